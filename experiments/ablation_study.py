@@ -55,7 +55,7 @@ class AblationStudy:
         self.gold_data = self._load_gold_standard()
 
         # Full system baseline
-        self.full_system = ModernKataKupas()
+        self.full_system = ModernKataKupas(share_resources=True)
         self.full_metrics = self._evaluate_system(
             self.full_system, "full_system"
         )
@@ -183,7 +183,7 @@ class AblationStudy:
 
         # Test with tiny dictionary (100 words)
         common_words = list(current_dict)[:100]
-        separator_tiny = ModernKataKupas()
+        separator_tiny = ModernKataKupas(share_resources=True)
         # Replace dictionary
         separator_tiny.dictionary.kata_dasar_set = set(common_words)
 
@@ -192,7 +192,7 @@ class AblationStudy:
 
         # Test with small dictionary (1000 words)
         small_words = list(current_dict)[:1000]
-        separator_small = ModernKataKupas()
+        separator_small = ModernKataKupas(share_resources=True)
         separator_small.dictionary.kata_dasar_set = set(small_words)
 
         result_small = self._evaluate_system(separator_small, "small_dict_1000")
@@ -200,7 +200,7 @@ class AblationStudy:
 
         # Test with medium dictionary (5000 words)
         medium_words = list(current_dict)[:5000]
-        separator_medium = ModernKataKupas()
+        separator_medium = ModernKataKupas(share_resources=True)
         separator_medium.dictionary.kata_dasar_set = set(medium_words)
 
         result_medium = self._evaluate_system(separator_medium, "medium_dict_5000")
@@ -208,7 +208,7 @@ class AblationStudy:
 
         # Test with large dictionary (15000 words)
         large_words = list(current_dict)[:15000]
-        separator_large = ModernKataKupas()
+        separator_large = ModernKataKupas(share_resources=True)
         separator_large.dictionary.kata_dasar_set = set(large_words)
 
         result_large = self._evaluate_system(separator_large, "large_dict_15000")
@@ -0,0 +1,116 @@
+"""
+Word Storage Benchmark for ModernKataKupas
+
+Compares the memory and lookup speed of the DictionaryManager storage
+backends on a large word list:
+1. set   - Python set of str (the default)
+2. table - memory-mapped word table (WordTable)
+3. graph - minimal acyclic word automaton (WordGraph)
+
+Usage:
+    python experiments/storage_benchmark.py                    # ~1M synthetic words
+    python experiments/storage_benchmark.py --words list.txt   # your own word list
+"""
+import argparse
+import gc
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, MutableSet, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from modern_kata_kupas import DictionaryManager
+from modern_kata_kupas.word_graph import WordGraph
+from modern_kata_kupas.word_table import WordTable, write_word_table
+
+PREFIXES = ["", "me", "mem", "men", "meng", "di", "ter", "ber", "pe", "pem", "pen", "per", "ke", "se"]
+SUFFIXES = ["", "an", "kan", "i", "nya", "lah", "kah", "annya", "kannya", "ilah"]
+
+
+def synthetic_words(count: int, seed: int = 13) -> List[str]:
+    """Affixed forms of the packaged root words, as a stand-in for a multi-million-entry list."""
+    roots = sorted(DictionaryManager().kata_dasar_set)
+    forms = [p + root + s for root in roots for p, s in itertools.product(PREFIXES, SUFFIXES)]
+    random.Random(seed).shuffle(forms)
+    return forms[:count]
+
+
+def measure(label: str, load: Callable[[], MutableSet[str]]) -> Tuple[MutableSet[str], Dict[str, float]]:
+    """Loads a store under tracemalloc; returns it with its heap size and load time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = load()
+    elapsed = time.perf_counter() - start
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, {"heap_mb": heap / 2**20, "load_s": elapsed}
+
+
+def probe_ns(store: MutableSet[str], probes: List[str]) -> float:
+    start = time.perf_counter()
+    for word in probes:
+        word in store
+    return (time.perf_counter() - start) / len(probes) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", help="Word list file (one normalized word per line)")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Synthetic word count (default: 1M)")
+    parser.add_argument("--probes", type=int, default=100_000, help="Lookups per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = args.words
+        if text_path is None:
+            text_path = os.path.join(tmp, "words.txt")
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(synthetic_words(args.count)) + "\n")
+        with open(text_path, encoding="utf-8") as f:
+            words = sorted({line.strip().lower() for line in f if line.strip()})
+        print(f"{len(words)} distinct words")
+
+        table_path = os.path.join(tmp, "words.tbl")
+        graph_path = os.path.join(tmp, "words.dawg")
+        start = time.perf_counter()
+        write_word_table(table_path, words)
+        table_build = time.perf_counter() - start
+        start = time.perf_counter()
+        WordGraph(words).save(graph_path)
+        graph_build = time.perf_counter() - start
+
+        def load_set() -> MutableSet[str]:
+            with open(text_path, encoding="utf-8") as f:
+                return {line.strip().lower() for line in f if line.strip()}
+
+        rng = random.Random(7)
+        hits = rng.sample(words, min(args.probes, len(words)))
+        misses = [word + "x" for word in hits]
+        results = []
+        for label, load, build_s, file_path in [
+            ("set", load_set, 0.0, text_path),
+            ("table", lambda: WordTable(table_path), table_build, table_path),
+            ("graph", lambda: WordGraph.load(graph_path), graph_build, graph_path),
+        ]:
+            store, stats = measure(label, load)
+            stats.update(build_s=build_s, file_mb=os.path.getsize(file_path) / 2**20,
+                         hit_ns=probe_ns(store, hits), miss_ns=probe_ns(store, misses))
+            results.append((label, stats))
+            del store
+
+    print(f"{'storage':<8}{'heap MB':>10}{'file MB':>10}{'build s':>10}{'load s':>10}{'hit ns':>10}{'miss ns':>10}")
+    for label, stats in results:
+        print(f"{label:<8}{stats['heap_mb']:>10.1f}{stats['file_mb']:>10.1f}{stats['build_s']:>10.2f}"
+              f"{stats['load_s']:>10.2f}{stats['hit_ns']:>10.0f}{stats['miss_ns']:>10.0f}")
+    print("(table: the mapped file lives in the OS page cache, shared by all processes)")
+
+
+if __name__ == "__main__":
+    main()
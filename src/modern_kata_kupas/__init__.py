@@ -6,6 +6,10 @@ from .exceptions import (
     DictionaryLoadingError
 )
 from .separator import ModernKataKupas # Added import
+from .parallel import ParallelSegmenter
+from .lattice import LatticeAnalysis, LatticeSegmenter
+from .lexicon import FullFormLexicon
+from .pipeline import MorphemeToken, TextToken, tokenize
 
 __version__ = "1.0.1"
 
@@ -15,5 +19,12 @@ __all__ = [
     'DictionaryFileNotFoundError',
     'DictionaryLoadingError',
     'ModernKataKupas', # Added to __all__
+    'ParallelSegmenter',
+    'LatticeAnalysis',
+    'LatticeSegmenter',
+    'FullFormLexicon',
+    'MorphemeToken',
+    'TextToken',
+    'tokenize',
     # Tambahkan nama publik lain dari package Anda di sini
 ]
\ No newline at end of file
@@ -5,11 +5,19 @@ Command-line interface for ModernKataKupas.
 """
 import sys
 import argparse
+import contextlib
+import csv
+import itertools
 import json
-from typing import List, Optional, Any
+import textwrap
+import time
+from typing import Callable, Iterable, Iterator, Optional, Set, TextIO, Tuple
 
 from . import __version__
+from .lexicon import FullFormLexicon
+from .parallel import ParallelSegmenter
 from .separator import ModernKataKupas
+from .snapshot import compile_snapshot
 
 
 def segment_word(mkk: ModernKataKupas, word: str, format_output: str = 'text') -> str:
@@ -52,54 +60,216 @@ def reconstruct_word(mkk: ModernKataKupas, segmented: str, format_output: str =
         return f"{segmented} → {reconstructed}"
 
 
+def _iter_words(stream: TextIO) -> Iterator[str]:
+    """Yields the stripped, non-empty lines of `stream` one at a time."""
+    for line in stream:
+        word = line.strip()
+        if word:
+            yield word
+
+
+@contextlib.contextmanager
+def _open_input(input_file: str) -> Iterator[TextIO]:
+    """Opens `input_file` for reading; `-` means standard input."""
+    if input_file == '-':
+        yield sys.stdin
+    else:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            yield f
+
+
+@contextlib.contextmanager
+def _open_output(output_file: Optional[str]) -> Iterator[TextIO]:
+    """Opens `output_file` for writing; None or `-` means standard output."""
+    if output_file is None or output_file == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+    else:
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            yield f
+
+
+class _RecordWriter:
+    """Writes (word, segmented) records incrementally in one output format."""
+
+    def __init__(self, out: TextIO, format_output: str):
+        self.out = out
+        self.format_output = format_output
+        self.count = 0
+        self._csv_writer = csv.writer(out, lineterminator='\n') if format_output == 'csv' else None
+
+    def write(self, word: str, segmented: str) -> None:
+        if self.format_output == 'json':
+            # Streamed JSON array, same layout as json.dumps(results, indent=2)
+            record = json.dumps({'word': word, 'segmented': segmented}, ensure_ascii=False, indent=2)
+            self.out.write(('[\n' if self.count == 0 else ',\n') + textwrap.indent(record, '  '))
+        elif self.format_output == 'jsonl':
+            self.out.write(json.dumps({'word': word, 'segmented': segmented}, ensure_ascii=False) + '\n')
+        elif self._csv_writer is not None:
+            self._csv_writer.writerow([word, segmented])
+        else:
+            self.out.write(f"{word} → {segmented}\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if self.format_output == 'json':
+            self.out.write('\n]\n' if self.count else '[]\n')
+
+
+def _dedupe(words: Iterable[str]) -> Iterator[str]:
+    """Yields each distinct word the first time it is seen."""
+    seen: Set[str] = set()
+    for word in words:
+        if word not in seen:
+            seen.add(word)
+            yield word
+
+
+class _ProgressReporter:
+    """Rewrites a single throughput line on stderr at most once per `interval` seconds."""
+
+    def __init__(self, hit_rate: Callable[[], float], interval: float = 1.0):
+        self.hit_rate = hit_rate
+        self.interval = interval
+        self.start = time.monotonic()
+        self._last_report = self.start
+
+    def update(self, count: int, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        elapsed = now - self.start
+        rate = count / elapsed if elapsed > 0 else 0.0
+        sys.stderr.write(f"\r{count} words, {rate:,.0f} words/s, cache hit rate {self.hit_rate():.1%}")
+        sys.stderr.flush()
+
+    def finish(self, count: int) -> None:
+        self.update(count, force=True)
+        sys.stderr.write("\n")
+
+
 def batch_segment(mkk: ModernKataKupas, input_file: str, output_file: Optional[str] = None,
-                  format_output: str = 'text') -> None:
+                  format_output: str = 'text', flush_every: int = 1000,
+                  segmenter: Optional[ParallelSegmenter] = None, dedupe: bool = False,
+                  progress: bool = False) -> None:
     """
-    Segment words from input file.
+    Segment words from input file, streaming line by line.
+
+    Words are read, segmented and written one at a time, so memory use does
+    not grow with the size of the input (except for the set of seen words
+    when `dedupe` is enabled).
 
     Args:
         mkk: ModernKataKupas instance
-        input_file: Path to input file (one word per line)
-        output_file: Path to output file (if None, prints to stdout)
-        format_output: Output format ('text', 'json', 'csv')
+        input_file: Path to input file (one word per line), or '-' for stdin
+        output_file: Path to output file (if None or '-', writes to stdout)
+        format_output: Output format ('text', 'json', 'jsonl', 'csv')
+        flush_every: Flush the output after this many records (0 disables
+            periodic flushing)
+        segmenter: Optional ParallelSegmenter; when given, words are
+            segmented in its worker processes instead of by `mkk`
+        dedupe: Segment and write each distinct word only once
+        progress: Show a words/sec and cache hit rate line on stderr
     """
+    to_file = output_file is not None and output_file != '-'
+    reporter = None
+    if progress:
+        if segmenter is not None:
+            parallel_cache = segmenter.cache
+            reporter = _ProgressReporter(lambda: parallel_cache.stats()['hit_rate'])
+        else:
+            reporter = _ProgressReporter(lambda: mkk.get_cache_stats()['segment']['hit_rate'])
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            words = [line.strip() for line in f if line.strip()]
+        with _open_input(input_file) as in_stream:
+            try:
+                with _open_output(output_file) as out_stream:
+                    writer = _RecordWriter(out_stream, format_output)
+                    words: Iterable[str] = _iter_words(in_stream)
+                    if dedupe:
+                        words = _dedupe(words)
+                    if segmenter is not None:
+                        # tee buffers only the chunks currently in flight in the pool
+                        words, to_segment = itertools.tee(words)
+                        pairs: Iterable[Tuple[str, str]] = zip(words, segmenter.imap(to_segment))
+                    else:
+                        pairs = ((word, mkk.segment(word)) for word in words)
+                    for word, segmented in pairs:
+                        writer.write(word, segmented)
+                        if flush_every and writer.count % flush_every == 0:
+                            out_stream.flush()
+                        if reporter is not None:
+                            reporter.update(writer.count)
+                    writer.close()
+                    if reporter is not None:
+                        reporter.finish(writer.count)
+            except OSError as e:
+                print(f"Error writing output file: {e}", file=sys.stderr)
+                sys.exit(1)
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found.", file=sys.stderr)
         sys.exit(1)
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Error reading input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    results: List[Any] = []
-    for word in words:
-        segmented = mkk.segment(word)
-        if format_output == 'json':
-            results.append({'word': word, 'segmented': segmented})
-        elif format_output == 'csv':
-            results.append(f"{word},{segmented}")
-        else:
-            results.append(f"{word} → {segmented}")
+    if to_file:
+        print(f"Results written to {output_file}")
 
-    # Format output
-    if format_output == 'json':
-        output_text = json.dumps(results, ensure_ascii=False, indent=2)
-    else:
-        output_text = '\n'.join([str(r) for r in results])
 
-    # Write output
-    if output_file:
+def build_lexicon(mkk: ModernKataKupas, output_file: str, roots_file: Optional[str] = None) -> None:
+    """
+    Build a full-form lexicon and write it to a file.
+
+    Args:
+        mkk: ModernKataKupas instance
+        output_file: Path of the lexicon file (gzip compressed if it ends in .gz)
+        roots_file: Optional file of roots to derive from (one per line);
+            defaults to every root word of the dictionary
+    """
+    roots = None
+    if roots_file is not None:
+        with _open_input(roots_file) as in_stream:
+            roots = list(_dedupe(_iter_words(in_stream)))
+    lexicon = FullFormLexicon.build(mkk, roots=roots)
+    lexicon.save(output_file)
+    ambiguous = sum(1 for _ in lexicon.ambiguous_forms())
+    print(f"Lexicon of {len(lexicon)} surface forms ({ambiguous} ambiguous) written to {output_file}")
+
+
+def build_word_tables(mkk: ModernKataKupas, directory: str, storage: str = "table") -> None:
+    """
+    Write the dictionary of `mkk` as word tables or word graphs.
+
+    Args:
+        mkk: ModernKataKupas instance
+        directory: Output directory (created if missing)
+        storage: "table" (memory-mapped) or "graph" (compact automaton)
+    """
+    mkk.dictionary.save_word_tables(directory, storage=storage)
+    print(f"Word {storage}s for {mkk.dictionary.get_kata_dasar_count()} root words and "
+          f"{mkk.dictionary.get_loanword_count()} loanwords written to {directory}")
+
+
+def _int_at_least(minimum: int) -> Callable[[str], int]:
+    """
+    Returns an argparse `type` that accepts integers of at least `minimum`.
+
+    Args:
+        minimum: Smallest accepted value
+
+    Returns:
+        Parser raising argparse.ArgumentTypeError for other values
+    """
+    def parse(value: str) -> int:
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(output_text + '\n')
-            print(f"Results written to {output_file}")
-        except Exception as e:
-            print(f"Error writing output file: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        print(output_text)
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    return parse
 
 
 def main():
@@ -123,13 +293,33 @@ Examples:
 
   # Output in CSV format
   mkk segment-file input.txt --format csv
+
+  # Stream JSON Lines in a pipeline ('-' is stdin/stdout)
+  cat words.txt | mkk segment-file - --format jsonl > segmented.jsonl
+
+  # Segment a large dump on 8 cores, each distinct word once, with progress
+  mkk segment-file tokens.txt -o vocab.jsonl -f jsonl --workers 8 --dedupe --progress
+
+  # Precompile known derivations, then use them (config: lexicon_path)
+  mkk build-lexicon lexicon.tsv.gz
+
+  # Compile dictionary, rules and config once for fast startup
+  mkk compile mkk.snapshot
+  mkk --snapshot mkk.snapshot segment "menulis"
+
+  # Memory-mapped word lists shared by all workers (config: word_table_dir)
+  mkk build-word-tables tables/
+  # Compact automata for very large word lists
+  mkk --dictionary big_list.txt build-word-tables tables/ --storage graph
         '''
     )
 
     parser.add_argument('--version', action='version', version=f'ModernKataKupas {__version__}')
     parser.add_argument('--dictionary', '-d', help='Path to custom dictionary file')
     parser.add_argument('--rules', '-r', help='Path to custom rules file')
-    parser.add_argument('--config', '-c', help='Path to custom config file')
+    parser.add_argument('--config', '-c', help='Path to custom config file, or a packaged profile name ("fast")')
+    parser.add_argument('--snapshot', '-s',
+                        help='Compiled snapshot to load dictionary, rules and config from (recompiled if stale)')
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
@@ -147,10 +337,37 @@ Examples:
 
     # Batch segment command
     batch_parser = subparsers.add_parser('segment-file', help='Segment words from file')
-    batch_parser.add_argument('input', help='Input file (one word per line)')
-    batch_parser.add_argument('--output', '-o', help='Output file (default: stdout)')
-    batch_parser.add_argument('--format', '-f', choices=['text', 'json', 'csv'],
+    batch_parser.add_argument('input', help="Input file (one word per line), or '-' for stdin")
+    batch_parser.add_argument('--output', '-o', help="Output file (default: stdout; '-' for stdout)")
+    batch_parser.add_argument('--format', '-f', choices=['text', 'json', 'jsonl', 'csv'],
                              default='text', help='Output format')
+    batch_parser.add_argument('--flush-every', type=_int_at_least(0), default=1000,
+                             help='Flush output every N records (default: 1000, 0 disables)')
+    batch_parser.add_argument('--workers', '-w', type=_int_at_least(1), default=1,
+                             help='Number of worker processes (default: 1, no multiprocessing)')
+    batch_parser.add_argument('--dedupe', action='store_true',
+                             help='Segment and output each distinct word only once')
+    batch_parser.add_argument('--progress', action='store_true',
+                             help='Show words/sec and cache hit rate on stderr')
+
+    # Build lexicon command
+    lexicon_parser = subparsers.add_parser('build-lexicon',
+                                           help='Precompile a full-form lexicon of known derivations')
+    lexicon_parser.add_argument('output', help='Output lexicon file (.gz for gzip compression)')
+    lexicon_parser.add_argument('--roots', help='File of roots to derive from (default: the whole dictionary)')
+
+    # Build word tables command
+    tables_parser = subparsers.add_parser('build-word-tables',
+                                          help='Write the word lists as memory-mapped word tables')
+    tables_parser.add_argument('directory', help='Output directory')
+    tables_parser.add_argument('--storage', choices=['table', 'graph'], default='table',
+                               help='table: memory-mapped hash tables (fastest lookups); '
+                                    'graph: compact word automata (smallest)')
+
+    # Compile command
+    compile_parser = subparsers.add_parser('compile',
+                                           help='Compile dictionary, rules and config into a snapshot for fast startup')
+    compile_parser.add_argument('output', help='Output snapshot file')
 
     args = parser.parse_args()
 
@@ -158,12 +375,23 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
+    if args.command == 'compile':
+        try:
+            compile_snapshot(args.output, dictionary_path=args.dictionary,
+                             rules_file_path=args.rules, config_path=args.config)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Snapshot written to {args.output}")
+        return
+
     # Initialize ModernKataKupas
     try:
         mkk = ModernKataKupas(
             dictionary_path=args.dictionary,
             rules_file_path=args.rules,
-            config_path=args.config
+            config_path=args.config,
+            snapshot_path=args.snapshot
         )
     except Exception as e:
         print(f"Error initializing ModernKataKupas: {e}", file=sys.stderr)
@@ -178,7 +406,19 @@ Examples:
             result = reconstruct_word(mkk, args.segmented, args.format)
             print(result)
         elif args.command == 'segment-file':
-            batch_segment(mkk, args.input, args.output, args.format)
+            if args.workers > 1:
+                with ParallelSegmenter(workers=args.workers, dictionary_path=args.dictionary,
+                                       rules_file_path=args.rules, config_path=args.config,
+                                       snapshot_path=args.snapshot) as segmenter:
+                    batch_segment(mkk, args.input, args.output, args.format, args.flush_every,
+                                  segmenter=segmenter, dedupe=args.dedupe, progress=args.progress)
+            else:
+                batch_segment(mkk, args.input, args.output, args.format, args.flush_every,
+                              dedupe=args.dedupe, progress=args.progress)
+        elif args.command == 'build-lexicon':
+            build_lexicon(mkk, args.output, args.roots)
+        elif args.command == 'build-word-tables':
+            build_word_tables(mkk, args.directory, args.storage)
     except KeyboardInterrupt:
         print("\nInterrupted by user", file=sys.stderr)
         sys.exit(130)
@@ -12,8 +12,17 @@ try:
 except ImportError:
     yaml = None
 
+# Supported values of the root_finder option
+ROOT_FINDERS = ("sastrawi", "native")
+# Supported values of the engine option
+ENGINES = ("greedy", "lattice")
+# Packaged configuration profiles, selectable by name instead of a path. Every
+# profile other than the default is an overlay merged over the default file.
+DEFAULT_PROFILE_FILENAME = "config.yaml"
+PROFILES = {"default": DEFAULT_PROFILE_FILENAME, "fast": "config_fast.yaml"}
+
 # Default configuration (fallback if YAML not available or file not found)
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG: Dict[str, Any] = {
     "min_stem_lengths": {
         "possessive": 3,
         "derivational": 4,
@@ -45,14 +54,77 @@ DEFAULT_CONFIG = {
         {"base": "balik", "variant": "balek"},
         {"base": "jangkau", "variant": "jingkau"},
     ],
+    "frozen_compounds": [
+        {"base": "ramah", "variant": "tamah"},
+        {"base": "hutan", "variant": "belantara"},
+        {"base": "tua", "variant": "bangka"},
+        {"base": "gotong", "variant": "royong"},
+        {"base": "hiruk", "variant": "pikuk"},
+        {"base": "pontang", "variant": "panting"},
+    ],
+    "root_finder": "sastrawi",
+    "engine": "greedy",
+    "prefix_strip_budget": 8,
+    "lexicon_path": None,
+    "word_table_dir": None,
     "features": {
         "enable_loanword_affixation": True,
         "enable_reduplication": True,
         "enable_morphophonemic_rules": True,
-    }
+    },
+    "cache": {
+        "segment_cache_size": 100000,
+        "stemmer_cache_size": 50000,
+    },
 }
 
 
+def resolve_config_source(config_path: Optional[str] = None) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    Decides where the configuration for `config_path` is read from.
+
+    Args:
+        config_path (Optional[str]): A file path, a profile name (see
+            PROFILES) or None.
+
+    Returns:
+        Tuple[Optional[str], Tuple[str, ...]]: The existing file to read, or
+            None, and the packaged files (in modern_kata_kupas.data) used if
+            there is no such file or it cannot be loaded: config.yaml,
+            followed by the overlay of the selected profile, if any.
+    """
+    if config_path in PROFILES and not os.path.exists(config_path):
+        profile_filename = PROFILES[config_path]
+        if profile_filename != DEFAULT_PROFILE_FILENAME:
+            return None, (DEFAULT_PROFILE_FILENAME, profile_filename)
+    elif config_path and os.path.exists(config_path):
+        return config_path, (DEFAULT_PROFILE_FILENAME,)
+    return None, (DEFAULT_PROFILE_FILENAME,)
+
+
+def merge_config(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merges a configuration overlay over a base configuration.
+
+    Nested mappings are merged key by key; any other value in `overlay`
+    (lists included) replaces the base value. Neither argument is modified.
+
+    Args:
+        base (Dict[str, Any]): The base configuration.
+        overlay (Dict[str, Any]): The options to change.
+
+    Returns:
+        Dict[str, Any]: The merged configuration.
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class ConfigLoader:
     """
     Loads and manages configuration for ModernKataKupas.
@@ -65,7 +137,9 @@ class ConfigLoader:
         Initializes the ConfigLoader.
 
         Args:
-            config_path (Optional[str]): Path to a custom config YAML file.
+            config_path (Optional[str]): Path to a custom config YAML file, or
+                the name of a packaged profile ("default", "fast"; see
+                PROFILES) if no file of that name exists.
                 If None, attempts to load the default packaged config.yaml.
                 If YAML is not available or file not found, uses DEFAULT_CONFIG.
         """
@@ -87,7 +161,9 @@ class ConfigLoader:
             self.config = DEFAULT_CONFIG
             return
 
-        if config_path and os.path.exists(config_path):
+        config_path, packaged_filenames = resolve_config_source(config_path)
+
+        if config_path:
             # Load from custom path
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
@@ -97,29 +173,46 @@ class ConfigLoader:
             except Exception as e:
                 logging.error(f"Error loading config from {config_path}: {e}")
 
-        # Try to load default packaged config
+        # Try to load default packaged config, with the selected profile's overlay
         try:
             import importlib.resources
-            try:
-                # Python 3.9+
-                with importlib.resources.files('modern_kata_kupas.data').joinpath('config.yaml').open('r') as f:
-                    self.config = yaml.safe_load(f)
-                logging.info("Loaded default packaged config.yaml")
-                return
-            except AttributeError:
-                # Python 3.8 fallback
-                import importlib.resources as pkg_resources
-                config_text = pkg_resources.read_text('modern_kata_kupas.data', 'config.yaml')
-                self.config = yaml.safe_load(config_text)
-                logging.info("Loaded default packaged config.yaml (Python 3.8 fallback)")
-                return
+            config: Dict[str, Any] = {}
+            for packaged_filename in packaged_filenames:
+                try:
+                    # Python 3.9+
+                    config_text = importlib.resources.files('modern_kata_kupas.data').joinpath(
+                        packaged_filename).read_text(encoding='utf-8')
+                except AttributeError:
+                    # Python 3.8 fallback
+                    import importlib.resources as pkg_resources
+                    config_text = pkg_resources.read_text('modern_kata_kupas.data', packaged_filename)
+                config = merge_config(config, yaml.safe_load(config_text) or {})
+                logging.info(f"Loaded packaged {packaged_filename}")
+            self.config = config
+            return
         except Exception as e:
-            logging.warning(f"Could not load packaged config.yaml: {e}")
+            logging.warning(f"Could not load packaged {' + '.join(packaged_filenames)}: {e}")
 
         # Fallback to default config
         logging.info("Using hardcoded default configuration")
         self.config = DEFAULT_CONFIG
 
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "ConfigLoader":
+        """
+        Creates a loader for an already parsed configuration, without reading files.
+
+        Args:
+            config (Dict[str, Any]): The configuration mapping (e.g., from a
+                compiled snapshot, see `snapshot`).
+
+        Returns:
+            ConfigLoader: A loader serving `config`.
+        """
+        loader = cls.__new__(cls)
+        loader.config = config
+        return loader
+
     def get_min_stem_length(self, suffix_type: str) -> int:
         """
         Gets the minimum stem length for a given suffix type.
@@ -142,6 +235,83 @@ class ConfigLoader:
         pairs_config = self.config.get("dwilingga_salin_suara_pairs", [])
         return [(pair["base"], pair["variant"]) for pair in pairs_config]
 
+    def get_frozen_compounds(self) -> List[Tuple[str, str]]:
+        """
+        Gets the list of frozen compounds (hyphenated pairs that look like
+        reduplication but are segmented without a reduplication marker).
+
+        Falls back to the built-in list if the config does not define any.
+
+        Returns:
+            List[Tuple[str, str]]: List of (base, variant) tuples.
+        """
+        compounds_config = self.config.get("frozen_compounds", DEFAULT_CONFIG["frozen_compounds"])
+        return [(pair["base"], pair["variant"]) for pair in compounds_config]
+
+    def get_root_finder(self) -> str:
+        """
+        Gets the root finder used to compare the parts of hyphenated words.
+
+        Returns:
+            str: "sastrawi" (external PySastrawi stemmer) or "native" (the
+                segmenter's own affix strippers plus the lexicon). Unknown
+                values fall back to "sastrawi" with a warning.
+        """
+        root_finder = str(self.config.get("root_finder", DEFAULT_CONFIG["root_finder"])).lower()
+        if root_finder not in ROOT_FINDERS:
+            logging.warning(f"Unknown root_finder '{root_finder}', using 'sastrawi'")
+            return "sastrawi"
+        return root_finder
+
+    def get_engine(self) -> str:
+        """
+        Gets the segmentation engine.
+
+        Returns:
+            str: "greedy" (two greedy stripping strategies) or "lattice" (all
+                affix analyses scored at once, see `LatticeSegmenter`).
+                Unknown values fall back to "greedy" with a warning.
+        """
+        engine = str(self.config.get("engine", DEFAULT_CONFIG["engine"])).lower()
+        if engine not in ENGINES:
+            logging.warning(f"Unknown engine '{engine}', using 'greedy'")
+            return "greedy"
+        return engine
+
+    def get_prefix_strip_budget(self) -> int:
+        """
+        Gets the maximum number of prefixes stripped from one word.
+
+        Returns:
+            int: The budget (at least 1).
+        """
+        budget = int(self.config.get("prefix_strip_budget", DEFAULT_CONFIG["prefix_strip_budget"]))
+        return max(1, budget)
+
+    def get_lexicon_path(self) -> Optional[str]:
+        """
+        Gets the path of the precompiled full-form lexicon, if any.
+
+        Returns:
+            Optional[str]: Path of a file written by `FullFormLexicon.save`
+                (e.g. with `mkk build-lexicon`), or None if no lexicon is used.
+        """
+        lexicon_path = self.config.get("lexicon_path")
+        return str(lexicon_path) if lexicon_path else None
+
+    def get_word_table_dir(self) -> Optional[str]:
+        """
+        Gets the directory of word tables or word graphs, if any.
+
+        Returns:
+            Optional[str]: A directory written by
+                `DictionaryManager.save_word_tables` (e.g. with
+                `mkk build-word-tables`), or None to load the word lists into
+                Python sets as usual.
+        """
+        word_table_dir = self.config.get("word_table_dir")
+        return str(word_table_dir) if word_table_dir else None
+
     def is_feature_enabled(self, feature_name: str) -> bool:
         """
         Checks if a feature is enabled.
@@ -154,6 +324,19 @@ class ConfigLoader:
         """
         return bool(self.config.get("features", {}).get(feature_name, True))
 
+    def get_cache_size(self, cache_name: str) -> int:
+        """
+        Gets the maximum number of entries for a named cache.
+
+        Args:
+            cache_name (str): Name of the cache (e.g., 'segment_cache_size').
+
+        Returns:
+            int: Maximum number of entries. 0 means the cache is disabled.
+        """
+        default_size = DEFAULT_CONFIG["cache"].get(cache_name, 0)
+        return int(self.config.get("cache", {}).get(cache_name, default_size))
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Gets a configuration value.
@@ -1,12 +1,51 @@
 # src/modern_kata_kupas/dictionary_manager.py
 import os
 import logging # Added import
-from typing import Set, Optional, Iterable
+from typing import Any, Callable, Dict, List, MutableSet, Optional, Iterable, Tuple
 from .exceptions import (
     DictionaryFileNotFoundError,
     DictionaryLoadingError
 )
 from .normalizer import TextNormalizer # Changed to relative import
+from .word_graph import WORD_GRAPH_MAGIC, WordGraph
+from .word_table import WORD_TABLE_MAGIC, WordTable, sorted_prefix_length, write_word_table
+
+
+def _write_graph(path: str, words: Iterable[str]) -> None:
+    WordGraph(words).save(path)
+
+
+# Storage backends for word list files: name -> (magic, writer, opener)
+WORD_STORAGES: Dict[str, Tuple[bytes, Callable[[str, Iterable[str]], Any], Callable[[str], MutableSet[str]]]] = {
+    "table": (WORD_TABLE_MAGIC, write_word_table, WordTable),
+    "graph": (WORD_GRAPH_MAGIC, _write_graph, WordGraph.load),
+}
+
+
+def open_word_store(path: str) -> MutableSet[str]:
+    """
+    Opens a word list file written by `DictionaryManager.save_word_tables`.
+
+    The storage backend (see `WORD_STORAGES`) is recognized from the file's
+    magic bytes.
+
+    Args:
+        path (str): The word list file.
+
+    Returns:
+        MutableSet[str]: A `WordTable` or a `WordGraph`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not in any known storage format.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(8)
+    for storage_magic, _, opener in WORD_STORAGES.values():
+        if magic == storage_magic:
+            return opener(path)
+    raise ValueError(f"{path} is not a word table or word graph")
+
 
 class DictionaryManager:
     """
@@ -18,8 +57,14 @@ class DictionaryManager:
     normalized (e.g., lowercased) before storage and lookup.
 
     Attributes:
-        kata_dasar_set (set[str]): A set of normalized Indonesian root words.
-        loanwords_set (set[str]): A set of normalized loanwords.
+        kata_dasar_set (MutableSet[str]): A set of normalized Indonesian root
+            words: a Python set, or a memory-mapped `WordTable` or compact
+            `WordGraph` when loaded with `from_word_tables`.
+        loanwords_set (MutableSet[str]): A set of normalized loanwords (same
+            storage as `kata_dasar_set`).
+        generation (int): Counter incremented every time words are added, so
+            components that derive caches from the lexicon (e.g., the
+            segmentation cache in `ModernKataKupas`) can detect staleness.
         normalizer (TextNormalizer): An instance of `TextNormalizer` used for
             normalizing words before they are added to the sets or checked
             for existence.
@@ -27,6 +72,9 @@ class DictionaryManager:
     DEFAULT_DICT_PACKAGE_PATH = "modern_kata_kupas.data" # Corrected path as per task
     DEFAULT_DICT_FILENAME = "kata_dasar.txt"
     DEFAULT_LOANWORD_FILENAME = "loanwords.txt"
+    # File names inside a word table directory (see save_word_tables)
+    KATA_DASAR_TABLE_FILENAME = "kata_dasar.tbl"
+    LOANWORD_TABLE_FILENAME = "loanwords.tbl"
 
     def __init__(self, dictionary_path: Optional[str] = None, loanword_list_path: Optional[str] = None):
         """Initializes the DictionaryManager and loads dictionaries.
@@ -54,9 +102,7 @@ class DictionaryManager:
                 issues with `importlib.resources` if default files are missing
                 from the package).
         """
-        self.kata_dasar_set: Set[str] = set()
-        self.loanwords_set: Set[str] = set() # Renamed from self.loanwords to self.loanwords_set
-        self.normalizer = TextNormalizer() # Instantiate TextNormalizer
+        self._init_state(set(), set(), generation=0)
 
         if dictionary_path:
             self._load_from_file_path(dictionary_path, is_loanword_list=False)
@@ -69,6 +115,147 @@ class DictionaryManager:
             self._load_default_loanword_list()
 
     # _normalize_word method removed, will use self.normalizer.normalize_word()
+
+    def _init_state(self, kata_dasar: MutableSet[str], loanwords: MutableSet[str], generation: int = 1,
+                    normalizer: Optional[TextNormalizer] = None, copy_on_write: bool = False,
+                    sorted_words: Optional[Dict[bool, Tuple[MutableSet[str], int, List[str]]]] = None) -> None:
+        """
+        Sets every instance attribute; shared by `__init__` and the alternative constructors.
+
+        Args:
+            kata_dasar (MutableSet[str]): The root word set (used as is).
+            loanwords (MutableSet[str]): The loanword set (used as is).
+            generation (int, optional): Initial `generation`. Defaults to 1.
+            normalizer (TextNormalizer, optional): Normalizer to use.
+                Defaults to a new one.
+            copy_on_write (bool, optional): True if the sets are shared with
+                other managers (see `shared_view`). Defaults to False.
+            sorted_words (dict, optional): Cache of sorted word lists to
+                share (see `known_prefix_length`). Defaults to a new one.
+        """
+        self.kata_dasar_set: MutableSet[str] = kata_dasar
+        self.loanwords_set: MutableSet[str] = loanwords
+        self.generation: int = generation
+        self.normalizer = normalizer if normalizer is not None else TextNormalizer()
+        # is_loanword -> (word set, generation, its words sorted), see known_prefix_length()
+        self._sorted_words: Dict[bool, Tuple[MutableSet[str], int, List[str]]] = (
+            sorted_words if sorted_words is not None else {})
+        # True while the word sets are shared with other managers, see shared_view()
+        self._copy_on_write = copy_on_write
+
+    @classmethod
+    def from_normalized_words(cls, kata_dasar: Iterable[str], loanwords: Iterable[str]) -> "DictionaryManager":
+        """
+        Creates a DictionaryManager from word lists that are already normalized.
+
+        No files are read and no word is normalized again, which makes this
+        much cheaper than loading the text files (used to load compiled
+        snapshots, see `snapshot`).
+
+        Args:
+            kata_dasar (Iterable[str]): Normalized root words.
+            loanwords (Iterable[str]): Normalized loanwords.
+
+        Returns:
+            DictionaryManager: A manager holding exactly these words.
+        """
+        manager = cls.__new__(cls)
+        manager._init_state(set(kata_dasar), set(loanwords))
+        return manager
+
+    @classmethod
+    def from_word_tables(cls, directory: str) -> "DictionaryManager":
+        """
+        Creates a DictionaryManager backed by word table or word graph files.
+
+        The root words and loanwords are not loaded into Python sets. With
+        the "table" storage every lookup is answered from `WordTable` files
+        mapped read-only, whose pages are shared through the OS page cache
+        by all processes using the same directory; with the "graph" storage
+        the words are held as `WordGraph` automata, a small fraction of the
+        size of a set, which also answer prefix and suffix queries. The
+        storage of each file is recognized from its content. Probes are a
+        few times slower than set lookups; words added with `add_word` are
+        kept in a per-instance overlay.
+
+        Args:
+            directory (str): A directory written by `save_word_tables`.
+
+        Returns:
+            DictionaryManager: A manager serving the tables.
+
+        Raises:
+            DictionaryFileNotFoundError: If a table file is missing.
+            DictionaryLoadingError: If a table file is invalid.
+        """
+        tables = []
+        for filename in (cls.KATA_DASAR_TABLE_FILENAME, cls.LOANWORD_TABLE_FILENAME):
+            table_path = os.path.join(directory, filename)
+            if not os.path.isfile(table_path):
+                raise DictionaryFileNotFoundError(f"Word table file not found at path: {table_path}")
+            try:
+                tables.append(open_word_store(table_path))
+            except (OSError, ValueError) as e:
+                raise DictionaryLoadingError(f"Error reading word table {table_path}: {e}") from e
+        manager = cls.__new__(cls)
+        manager._init_state(tables[0], tables[1])
+        return manager
+
+    def shared_view(self) -> "DictionaryManager":
+        """
+        Creates a manager that reads this manager's word sets without copying them.
+
+        The view is copy-on-write: the first `add_word` on it (or loading
+        more words into it) replaces its sets with private copies, so
+        neither this manager nor other views see the change. Used to share
+        one loaded dictionary between `ModernKataKupas` instances (see
+        `resources.ResourceRegistry`). Modifying `kata_dasar_set` or
+        `loanwords_set` in place bypasses the copy and affects every view;
+        assigning a new set to either attribute only affects the view.
+
+        Returns:
+            DictionaryManager: A view with the same words and generation.
+        """
+        view = self.__class__.__new__(self.__class__)
+        view._init_state(self.kata_dasar_set, self.loanwords_set, generation=self.generation,
+                         normalizer=self.normalizer, copy_on_write=True, sorted_words=self._sorted_words)
+        return view
+
+    @staticmethod
+    def _copy_words(words: MutableSet[str]) -> MutableSet[str]:
+        """Returns a private copy of a word set (word files are re-opened, not read into memory)."""
+        copy = getattr(words, "copy", None)
+        return copy() if copy is not None else set(words)
+
+    def _detach(self) -> None:
+        """Gives a shared view private copies of its word sets before they are modified."""
+        if self._copy_on_write:
+            self.kata_dasar_set = self._copy_words(self.kata_dasar_set)
+            self.loanwords_set = self._copy_words(self.loanwords_set)
+            self._sorted_words = {}
+            self._copy_on_write = False
+
+    def save_word_tables(self, directory: str, storage: str = "table") -> None:
+        """
+        Writes the root words and loanwords for `from_word_tables`.
+
+        Args:
+            directory (str): Destination directory (created if missing). The
+                files are named `KATA_DASAR_TABLE_FILENAME` and
+                `LOANWORD_TABLE_FILENAME`.
+            storage (str): "table" for memory-mappable word tables (fastest
+                lookups, shared between processes) or "graph" for word
+                graphs (smallest, with prefix and suffix queries).
+
+        Raises:
+            ValueError: If `storage` is unknown.
+        """
+        if storage not in WORD_STORAGES:
+            raise ValueError(f"Unknown word storage {storage!r}, expected one of {sorted(WORD_STORAGES)}")
+        _, writer, _ = WORD_STORAGES[storage]
+        os.makedirs(directory, exist_ok=True)
+        writer(os.path.join(directory, self.KATA_DASAR_TABLE_FILENAME), self.kata_dasar_set)
+        writer(os.path.join(directory, self.LOANWORD_TABLE_FILENAME), self.loanwords_set)
         
     def add_word(self, word: str, is_loanword: bool = False):
         """
@@ -95,10 +282,12 @@ class DictionaryManager:
         """
         normalized_word = self.normalizer.normalize_word(word) # Use TextNormalizer
         if normalized_word:
+            self._detach()
             if is_loanword:
                 self.loanwords_set.add(normalized_word)
             else:
                 self.kata_dasar_set.add(normalized_word)
+            self.generation += 1
 
     def get_kata_dasar_count(self) -> int:
         """
@@ -123,11 +312,13 @@ class DictionaryManager:
         Loads words from an iterable into the appropriate set, normalizing them.
         Skips empty words after normalization.
         """
+        self._detach()
         target_set = self.loanwords_set if is_loanword_list else self.kata_dasar_set
         for line in word_iterable:
             normalized_word = self.normalizer.normalize_word(line) # Use TextNormalizer
             if normalized_word: 
                 target_set.add(normalized_word)
+        self.generation += 1
                 
     def is_kata_dasar(self, kata: str) -> bool:
         """
@@ -152,8 +343,7 @@ class DictionaryManager:
             False
         """
         normalized_kata = self.normalizer.normalize_word(kata) # Use TextNormalizer
-        is_present = normalized_kata in self.kata_dasar_set
-        return is_present
+        return self.contains_normalized(normalized_kata)
 
     def is_loanword(self, word: str) -> bool:
         """
@@ -170,8 +360,112 @@ class DictionaryManager:
                 set, False otherwise.
         """
         normalized_word = self.normalizer.normalize_word(word) # Use TextNormalizer
-        is_present = normalized_word in self.loanwords_set
-        return is_present
+        return self.contains_normalized(normalized_word, is_loanword=True)
+
+    def contains_normalized(self, word: str, is_loanword: bool = False) -> bool:
+        """
+        Checks whether an already normalized word is in the root word or loanword set.
+
+        Unlike `is_kata_dasar` and `is_loanword`, the word is NOT normalized
+        again: this is a bare set membership probe meant for hot paths that
+        work on strings derived from `TextNormalizer.normalize_word` output
+        (the segmenter only ever slices and extends such strings). Passing
+        a non-normalized word (e.g., "Makan" or "makan.") simply returns False.
+
+        Args:
+            word (str): A normalized word (lowercased, stripped of surrounding
+                whitespace and trailing punctuation).
+            is_loanword (bool, optional): If True, checks the loanword set
+                instead of the root word set. Defaults to False.
+
+        Returns:
+            bool: True if `word` is in the selected set, False otherwise.
+
+        Example:
+            >>> dm = DictionaryManager()
+            >>> dm.contains_normalized("makan")
+            True
+            >>> dm.contains_normalized("MAKAN")
+            False
+        """
+        if is_loanword:
+            return word in self.loanwords_set
+        return word in self.kata_dasar_set
+
+    def known_prefix_length(self, word: str, is_loanword: bool = False) -> int:
+        """
+        Returns the length of the longest prefix of `word` that some entry starts with.
+
+        Like `contains_normalized`, `word` must already be normalized. Word
+        tables and word graphs answer the query themselves; for Python sets
+        a sorted copy of the words (one reference per word) is built on the
+        first query and after every change of `generation`, and searched
+        with `bisect`.
+
+        Args:
+            word (str): A normalized word or word fragment.
+            is_loanword (bool, optional): If True, queries the loanwords
+                instead of the root words. Defaults to False.
+
+        Returns:
+            int: 0 if no entry starts with `word[0]`, `len(word)` if some
+                entry starts with the whole of `word`.
+
+        Example:
+            >>> dm = DictionaryManager()
+            >>> dm.known_prefix_length("makanxyz")
+            5
+        """
+        words = self.loanwords_set if is_loanword else self.kata_dasar_set
+        prefix_length = getattr(words, "prefix_length", None)
+        if prefix_length is not None:
+            return int(prefix_length(word))
+        cached = self._sorted_words.get(is_loanword)
+        if cached is None or cached[0] is not words or cached[1] != self.generation:
+            cached = (words, self.generation, sorted(words))
+            self._sorted_words[is_loanword] = cached
+        return sorted_prefix_length(cached[2], word)
+
+    def has_prefix(self, prefix: str, is_loanword: bool = False) -> bool:
+        """
+        Checks whether any root word (or loanword) starts with an already normalized `prefix`.
+
+        Args:
+            prefix (str): A normalized word fragment.
+            is_loanword (bool, optional): If True, queries the loanwords
+                instead of the root words. Defaults to False.
+
+        Returns:
+            bool: True if some entry starts with `prefix` (an entry equal to
+                it included).
+        """
+        return self.known_prefix_length(prefix, is_loanword) == len(prefix)
+
+    def longest_known_root(self, word: str, is_loanword: bool = False) -> Optional[str]:
+        """
+        Returns the longest root word (or loanword) that an already normalized `word` starts with.
+
+        Only prefixes up to `known_prefix_length` are probed.
+
+        Args:
+            word (str): A normalized word.
+            is_loanword (bool, optional): If True, queries the loanwords
+                instead of the root words. Defaults to False.
+
+        Returns:
+            Optional[str]: The longest entry that is a prefix of `word`
+                (possibly `word` itself), or None.
+
+        Example:
+            >>> dm = DictionaryManager()
+            >>> dm.longest_known_root("makanannya")
+            'makan'
+        """
+        words = self.loanwords_set if is_loanword else self.kata_dasar_set
+        for length in range(self.known_prefix_length(word, is_loanword), 0, -1):
+            if word[:length] in words:
+                return word[:length]
+        return None
         
     def _load_default_packaged_dictionary(self):
         """Memuat kamus default yang dikemas dengan library."""
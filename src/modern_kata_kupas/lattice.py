@@ -0,0 +1,263 @@
+# src/modern_kata_kupas/lattice.py
+"""
+Modul mesin segmentasi berbasis lattice (chart) dengan keluaran n-best.
+"""
+import heapq
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .separator import ModernKataKupas
+
+# Maximum number of stacked prefixes on one path (e.g. di~per~ke~...)
+MAX_PREFIXES = 3
+
+# Slot of each suffix type, from the outside of the word inwards. A word
+# carries at most one suffix per slot, in this order (root~an~nya~lah).
+SUFFIX_SLOTS: Dict[str, int] = {"particle": 0, "possessive": 1, "suffix_derivational": 2}
+
+# Path scoring. A known root word on its own scores 0; every affix costs
+# AFFIX_COST, so the analysis with the fewest morphemes wins unless
+# morphotactic evidence (allomorph conditions, confixes, restored elided
+# initials) says otherwise. Tuned on the gold standard in data/.
+AFFIX_COST = 1.0
+ELISION_BONUS = 0.5
+LOANWORD_PENALTY = 1.0
+UNKNOWN_ROOT_PENALTY = 100.0
+ALLOMORPH_PENALTY = 2.0
+CONFIX_BONUS = 0.5
+
+# (outermost prefix, innermost suffix) pairs that form a confix
+CONFIXES = frozenset([
+    ("ke", "an"), ("peN", "an"), ("per", "an"), ("ber", "an"), ("se", "nya"),
+])
+
+
+class LatticeAnalysis(NamedTuple):
+    """One scored path through the lattice of a word.
+
+    Attributes:
+        prefixes: Canonical prefixes, outermost first (e.g. ("meN", "per")).
+        root: The root, with any elided initial restored.
+        suffixes: Suffixes, innermost first (e.g. ("kan", "nya")).
+        score: Path score; higher is better.
+    """
+    prefixes: Tuple[str, ...]
+    root: str
+    suffixes: Tuple[str, ...]
+    score: float
+
+
+# (stem end offset, suffixes innermost first)
+_SuffixSplit = Tuple[int, Tuple[str, ...]]
+# (root start offset, canonical prefixes, (surface, canonical, elided initial) of the last prefix or None)
+_PrefixPath = Tuple[int, Tuple[str, ...], Optional[Tuple[str, str, Optional[str]]]]
+
+
+class LatticeSegmenter:
+    """
+    Scores every prefix/root/suffix analysis of a word and returns the best ones.
+
+    The lattice of a word is built in one pass over the compiled affix tries
+    of `MorphologicalRules`: the prefix trie gives every way to peel up to
+    `MAX_PREFIXES` prefixes off the front (with the elided root initial
+    restored where an allomorph allows it), and the reversed-suffix trie
+    gives every way to peel suffixes off the back, at most one per slot
+    (derivational, possessive, particle). Each combination whose middle part
+    is a known root word or loanword is a path; paths are scored and the
+    top-k are returned. The number of paths is bounded by the affix
+    inventory, not by the length of the word, and nothing backtracks.
+
+    Reduplication is not part of the lattice itself: `ModernKataKupas`
+    detects it first and runs the lattice on the base form. The segmenter's
+    enable_morphophonemic_rules and enable_loanword_affixation features
+    control whether elided initials are restored and loanword roots allowed.
+
+    Attributes:
+        mkk (ModernKataKupas): The segmenter whose rules, dictionary and
+            minimum stem lengths are used.
+    """
+
+    def __init__(self, mkk: "ModernKataKupas"):
+        """
+        Initializes the lattice engine.
+
+        Args:
+            mkk (ModernKataKupas): The segmenter to take resources from. Its
+                `rules` and `dictionary` are read on every call, so replacing
+                them is picked up automatically.
+        """
+        self.mkk = mkk
+        self._allomorph_rules: Dict[Tuple[str, str], List[Mapping[str, Any]]] = {}
+        self._allomorph_rules_source: Optional[Any] = None
+
+    def _get_allomorph_rules(self) -> Dict[Tuple[str, str], List[Mapping[str, Any]]]:
+        """Indexes the prefix allomorphs by (surface, canonical), once per rules object."""
+        rules = self.mkk.rules
+        if self._allomorph_rules_source is not rules:
+            index: Dict[Tuple[str, str], List[Mapping[str, Any]]] = {}
+            for canonical, rules_list in rules.prefix_rules.items():
+                for rule_details in rules_list:
+                    allomorphs = rule_details.get("allomorphs")
+                    if not isinstance(allomorphs, list):
+                        continue
+                    for allomorph_rule in allomorphs:
+                        if isinstance(allomorph_rule, dict) and allomorph_rule.get("surface"):
+                            index.setdefault((allomorph_rule["surface"], canonical), []).append(allomorph_rule)
+            self._allomorph_rules = index
+            self._allomorph_rules_source = rules
+        return self._allomorph_rules
+
+    def _is_licensed(self, surface: str, canonical: str, restored: Optional[str], root: str) -> bool:
+        """
+        Checks whether some allomorph of the prefix permits this surface form
+        directly before `root` (e.g. "mem" only before p-elision or b/f/v).
+        Prefixes without allomorph rules are always licensed.
+        """
+        allomorphs = self._get_allomorph_rules().get((surface, canonical))
+        if not allomorphs:
+            return True
+        for allomorph_rule in allomorphs:
+            if restored:
+                if allomorph_rule.get("elision") and allomorph_rule.get("reconstruct_root_initial") == restored:
+                    return True
+                continue
+            if allomorph_rule.get("elision"):
+                continue
+            next_chars = allomorph_rule.get("next_char_is")
+            if next_chars and not any(root.startswith(char) for char in next_chars):
+                continue
+            exact_roots = allomorph_rule.get("condition_exact_root")
+            if exact_roots and root not in exact_roots:
+                continue
+            if allomorph_rule.get("is_monosyllabic_root") and not self.mkk._is_monosyllabic(root):
+                continue
+            return True
+        return False
+
+    def _suffix_splits(self, word: str) -> List[_SuffixSplit]:
+        """
+        Lists every way to peel suffixes off the end of `word`, outermost
+        first, one per slot, honouring the configured minimum stem lengths.
+        The unsuffixed split (len(word), ()) is always first.
+        """
+        mkk = self.mkk
+        min_lengths = {
+            "particle": mkk.MIN_STEM_LENGTH_FOR_PARTICLE,
+            "possessive": mkk.MIN_STEM_LENGTH_FOR_POSSESSIVE,
+            "suffix_derivational": mkk.MIN_STEM_LENGTH_FOR_DERIVATIONAL_SUFFIX_STRIPPING,
+        }
+        splits: List[_SuffixSplit] = [(len(word), ())]
+        pending: List[Tuple[int, Tuple[str, ...], int]] = [(len(word), (), 0)]
+        while pending:
+            end, suffixes, next_slot = pending.pop()
+            for suffix_rule in mkk.rules.match_suffix_rules(word[:end]):
+                suffix_type = suffix_rule.get("type", "")
+                slot = SUFFIX_SLOTS.get(suffix_type)
+                if slot is None or slot < next_slot:
+                    continue
+                suffix = suffix_rule["original_pattern"]
+                stem_end = end - len(suffix)
+                if stem_end < max(2, min_lengths[suffix_type]):
+                    continue
+                split = (stem_end, (suffix,) + suffixes)
+                splits.append(split)
+                pending.append((stem_end, split[1], slot + 1))
+        return splits
+
+    def _prefix_paths(self, word: str) -> List[_PrefixPath]:
+        """
+        Lists every way to peel up to `MAX_PREFIXES` prefixes off the front
+        of `word`. The unprefixed path (0, (), None) is always first.
+        """
+        match_prefixes = self.mkk.rules.match_prefixes
+        paths: List[_PrefixPath] = [(0, (), None)]
+        frontier: List[Tuple[int, Tuple[str, ...]]] = [(0, ())]
+        for _ in range(MAX_PREFIXES):
+            next_frontier: List[Tuple[int, Tuple[str, ...]]] = []
+            for start, prefixes in frontier:
+                for prefix_match in match_prefixes(word[start:]):
+                    end = start + len(prefix_match.surface)
+                    if end >= len(word):
+                        continue
+                    new_prefixes = prefixes + (prefix_match.canonical,)
+                    last = (prefix_match.surface, prefix_match.canonical, prefix_match.restore_initial)
+                    paths.append((end, new_prefixes, last))
+                    next_frontier.append((end, new_prefixes))
+            frontier = next_frontier
+        return paths
+
+    def _score(self, prefixes: Tuple[str, ...], suffixes: Tuple[str, ...],
+               is_restored: bool, is_loanword: bool, is_licensed: bool) -> float:
+        """Scores one path of the lattice."""
+        score = 0.0 - AFFIX_COST * (len(prefixes) + len(suffixes))
+        if is_restored:
+            score += ELISION_BONUS
+        if is_loanword:
+            score -= LOANWORD_PENALTY
+        if not is_licensed:
+            score -= ALLOMORPH_PENALTY
+        if prefixes and suffixes and (prefixes[0], suffixes[0]) in CONFIXES:
+            score += CONFIX_BONUS
+        return score
+
+    def analyze(self, word: str, k: int = 1) -> List[LatticeAnalysis]:
+        """
+        Returns the `k` best analyses of a normalized word, best first.
+
+        The unsegmented word is always a candidate: it scores like any other
+        path if it is a root word or loanword, and far below every other
+        path otherwise. A root candidate is only looked up if it is not
+        longer than the part of the remaining text that some dictionary
+        entry starts with (see `DictionaryManager.known_prefix_length`).
+
+        Args:
+            word (str): The normalized word (without reduplication).
+            k (int, optional): Maximum number of analyses. Defaults to 1.
+
+        Returns:
+            list[LatticeAnalysis]: Up to `k` distinct analyses, highest score first.
+        """
+        if not word or k < 1:
+            return []
+        dictionary = self.mkk.dictionary
+        restore_elided = self.mkk.enable_morphophonemic_rules
+        allow_loanwords = self.mkk.enable_loanword_affixation
+        analyses: Dict[Tuple[Tuple[str, ...], str, Tuple[str, ...]], float] = {}
+        suffix_splits = self._suffix_splits(word)
+        # (text a root may start, is_loanword) -> length of its longest prefix that
+        # starts a dictionary entry; longer root candidates are not probed
+        reach: Dict[Tuple[str, bool], int] = {}
+
+        def is_entry(root: str, text: str, is_loanword: bool) -> bool:
+            key = (text, is_loanword)
+            if key not in reach:
+                reach[key] = dictionary.known_prefix_length(text, is_loanword)
+            return len(root) <= reach[key] and dictionary.contains_normalized(root, is_loanword)
+
+        for start, prefixes, last_prefix in self._prefix_paths(word):
+            for end, suffixes in suffix_splits:
+                if end - start < 1:
+                    continue
+                surface_root = word[start:end]
+                candidates: List[Tuple[str, Optional[str]]] = [(surface_root, None)]
+                if restore_elided and last_prefix is not None and last_prefix[2]:
+                    candidates.append((last_prefix[2] + surface_root, last_prefix[2]))
+                for root, restored in candidates:
+                    text = word[start:] if restored is None else restored + word[start:]
+                    if is_entry(root, text, False):
+                        is_loanword = False
+                    elif allow_loanwords and is_entry(root, text, True):
+                        is_loanword = True
+                    else:
+                        continue
+                    is_licensed = last_prefix is None or self._is_licensed(
+                        last_prefix[0], last_prefix[1], restored, root)
+                    score = self._score(prefixes, suffixes, restored is not None, is_loanword, is_licensed)
+                    key = (prefixes, root, suffixes)
+                    if score > analyses.get(key, float("-inf")):
+                        analyses[key] = score
+        if ((), word, ()) not in analyses:
+            analyses[((), word, ())] = -UNKNOWN_ROOT_PENALTY
+        best = heapq.nlargest(k, analyses.items(), key=lambda item: item[1])
+        return [LatticeAnalysis(prefixes, root, suffixes, score)
+                for (prefixes, root, suffixes), score in best]
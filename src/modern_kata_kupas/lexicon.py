@@ -0,0 +1,184 @@
+# src/modern_kata_kupas/lexicon.py
+"""
+Modul leksikon bentuk-penuh (full-form lexicon) hasil kompilasi: bentuk permukaan -> segmentasi.
+"""
+import gzip
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Set, Tuple, cast
+
+if TYPE_CHECKING:
+    from .separator import ModernKataKupas
+
+# (prefixes outermost first, suffixes innermost first)
+Template = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+# Regular derivation patterns generated for every root by default. This is a fixed
+# list of common combinations, not every combination a rules file allows; templates
+# using an affix the segmenter's rules do not define are dropped by build().
+DEFAULT_TEMPLATES: Tuple[Template, ...] = (
+    ((), ("an",)), ((), ("kan",)), ((), ("i",)), ((), ("nya",)),
+    (("meN",), ()), (("meN",), ("kan",)), (("meN",), ("i",)),
+    (("di",), ()), (("di",), ("kan",)), (("di",), ("i",)),
+    (("ber",), ()), (("ber",), ("an",)),
+    (("ter",), ()),
+    (("peN",), ()), (("peN",), ("an",)),
+    (("per",), ("an",)),
+    (("ke",), ("an",)),
+    (("se",), ()),
+    (("meN", "per"), ()), (("meN", "per"), ("kan",)), (("meN", "per"), ("i",)),
+    (("di", "per"), ("kan",)), (("di", "per"), ("i",)),
+)
+
+FILE_HEADER = "# modern_kata_kupas full-form lexicon v1"
+
+
+def _open_text(path: str, mode: str) -> IO[str]:
+    """Opens a UTF-8 text file, gzip-compressed if the name ends in .gz."""
+    if path.endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8", newline="\n"))
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+
+class FullFormLexicon:
+    """
+    A precompiled table of surface forms and their segmentations.
+
+    The table is generated by running `Reconstructor` over every root and
+    derivation template (see `build`), so each entry is a known regular
+    derivation. A surface form generated by more than one analysis (e.g.
+    "bacakan" from "baca~kan" and "bacak~an") is ambiguous: `lookup` does
+    not answer for it and the rule engine decides.
+
+    On disk the table is a sorted, tab-separated UTF-8 text file (gzip
+    compressed if the name ends in .gz): a header line, then one line per
+    surface form followed by its analyses; lines with two or more analyses
+    are the ambiguous ones.
+
+    Example:
+        >>> lexicon = FullFormLexicon.build(mkk)
+        >>> lexicon.save("lexicon.tsv.gz")
+        >>> mkk.lexicon = FullFormLexicon.load("lexicon.tsv.gz")
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Tuple[str, ...]]] = None):
+        """
+        Initializes the lexicon.
+
+        Args:
+            entries (dict[str, tuple[str, ...]], optional): Surface form ->
+                its analyses (segmented strings). Defaults to an empty table.
+        """
+        self.entries: Dict[str, Tuple[str, ...]] = entries if entries is not None else {}
+
+    @classmethod
+    def build(cls, mkk: "ModernKataKupas", roots: Optional[Iterable[str]] = None,
+              templates: Iterable[Template] = DEFAULT_TEMPLATES) -> "FullFormLexicon":
+        """
+        Generates the surface forms of every root under every template.
+
+        Only templates whose affixes are all defined by `mkk.rules` are
+        used; combinations the rules allow but no template lists are not
+        generated. Surface forms that contain a hyphen or are themselves
+        root words or loanwords are skipped, so listed words keep
+        segmenting as without the lexicon. Roots spelled like an affix
+        ("per", "kan") are skipped too, since a segmented string cannot
+        tell them apart from the affix.
+
+        Args:
+            mkk (ModernKataKupas): Provides the reconstructor and the dictionary.
+            roots (Iterable[str], optional): Roots to derive from. Defaults to
+                every root word of `mkk.dictionary`.
+            templates (Iterable[Template], optional): (prefixes, suffixes)
+                patterns. Defaults to `DEFAULT_TEMPLATES`.
+
+        Returns:
+            FullFormLexicon: The generated table.
+        """
+        if roots is None:
+            roots = sorted(mkk.dictionary.kata_dasar_set)
+        affix_forms = set(mkk.rules.prefix_rules) | set(mkk.rules.suffix_rules)
+        templates = [(prefixes, suffixes) for prefixes, suffixes in templates
+                     if affix_forms.issuperset(prefixes + suffixes)]
+        analyses: Dict[str, Set[str]] = {}
+        for root in roots:
+            if root in affix_forms:
+                continue
+            for prefixes, suffixes in templates:
+                segmented = "~".join(prefixes + (root,) + suffixes)
+                surface = mkk.reconstruct(segmented)
+                if not surface or surface == root or "-" in surface:
+                    continue
+                if (mkk.dictionary.contains_normalized(surface)
+                        or mkk.dictionary.contains_normalized(surface, is_loanword=True)):
+                    continue
+                analyses.setdefault(surface, set()).add(segmented)
+        return cls({surface: tuple(sorted(found)) for surface, found in analyses.items()})
+
+    @classmethod
+    def load(cls, path: str) -> "FullFormLexicon":
+        """
+        Loads a table written by `save`.
+
+        Args:
+            path (str): The table file (.gz for gzip compression).
+
+        Returns:
+            FullFormLexicon: The loaded table.
+
+        Raises:
+            ValueError: If the file is not a full-form lexicon.
+        """
+        entries: Dict[str, Tuple[str, ...]] = {}
+        with _open_text(path, "r") as f:
+            if f.readline().rstrip("\n") != FILE_HEADER:
+                raise ValueError(f"{path} is not a full-form lexicon file")
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) >= 2:
+                    entries[fields[0]] = tuple(fields[1:])
+        return cls(entries)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the table, sorted by surface form.
+
+        Args:
+            path (str): Destination file (.gz for gzip compression).
+        """
+        with _open_text(path, "w") as f:
+            f.write(FILE_HEADER + "\n")
+            for surface in sorted(self.entries):
+                f.write("\t".join((surface,) + self.entries[surface]) + "\n")
+
+    def lookup(self, surface: str) -> Optional[str]:
+        """
+        Returns the segmentation of an unambiguous surface form.
+
+        Args:
+            surface (str): A normalized word.
+
+        Returns:
+            str | None: The only analysis of `surface`, or None if the form
+                is unknown or ambiguous.
+        """
+        found = self.entries.get(surface)
+        if found is not None and len(found) == 1:
+            return found[0]
+        return None
+
+    def analyses(self, surface: str) -> Tuple[str, ...]:
+        """Returns every generated analysis of a surface form (empty if unknown)."""
+        return self.entries.get(surface, ())
+
+    def is_ambiguous(self, surface: str) -> bool:
+        """True if more than one analysis generates the surface form."""
+        return len(self.entries.get(surface, ())) > 1
+
+    def ambiguous_forms(self) -> Iterator[str]:
+        """Yields the ambiguous surface forms."""
+        return (surface for surface, found in self.entries.items() if len(found) > 1)
+
+    def __contains__(self, surface: object) -> bool:
+        return surface in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
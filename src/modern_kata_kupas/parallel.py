@@ -0,0 +1,200 @@
+# src/modern_kata_kupas/parallel.py
+"""
+Modul untuk segmentasi paralel multi-proses pada korpus besar.
+"""
+import os
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config_loader import ConfigLoader
+from .separator import ModernKataKupas
+from .utils.lru_cache import LRUCache
+
+# Instance ModernKataKupas milik proses worker, dibuat sekali oleh _init_worker()
+_worker_mkk: Optional[ModernKataKupas] = None
+
+
+def _init_worker(dictionary_path: Optional[str], rules_file_path: Optional[str],
+                 config_path: Optional[str], snapshot_path: Optional[str]) -> None:
+    """Pool initializer: builds the worker's ModernKataKupas instance once."""
+    global _worker_mkk
+    _worker_mkk = ModernKataKupas(
+        dictionary_path=dictionary_path,
+        rules_file_path=rules_file_path,
+        config_path=config_path,
+        snapshot_path=snapshot_path,
+    )
+
+
+def _segment_chunk(words: List[str]) -> List[str]:
+    """Segments one batch of words inside a worker process."""
+    assert _worker_mkk is not None, "Worker was not initialized"
+    segment = _worker_mkk.segment
+    return [segment(word) for word in words]
+
+
+def _chunked(words: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Splits an iterable into lists of at most `chunk_size` items."""
+    iterator = iter(words)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# (chunk tokens, results already known, words sent to the pool, pending pool result)
+_PendingChunk = Tuple[List[str], Dict[str, str], List[str], Any]
+
+
+class ParallelSegmenter:
+    """
+    Segments large word streams on several CPU cores using a process pool.
+
+    Every worker process builds its own `ModernKataKupas` exactly once, via
+    the pool initializer, from the same dictionary, rules and config paths.
+    The input is cut into chunks of `chunk_size` tokens; each chunk is
+    deduplicated and only words whose result is not already known in the
+    parent process are sent to a worker. Results are streamed back in input
+    order while a bounded number of chunks is in flight, so memory use stays
+    flat no matter how long the input is.
+
+    Use it as a context manager (or call `close`) to shut the pool down.
+
+    Example:
+        >>> with ParallelSegmenter(workers=4) as segmenter:
+        ...     for segmented in segmenter.imap(open("tokens.txt", encoding="utf-8").read().split()):
+        ...         pass
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int): Number of input tokens per chunk.
+        max_pending_chunks (int): Maximum number of chunks in flight at once.
+        cache (LRUCache): Parent-side cache of results, used to skip words
+            that were already segmented in an earlier chunk.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 1000,
+                 dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None,
+                 config_path: Optional[str] = None, max_pending_chunks: Optional[int] = None,
+                 cache_size: Optional[int] = None, start_method: Optional[str] = None,
+                 snapshot_path: Optional[str] = None):
+        """
+        Initializes the segmenter. The process pool is started on first use.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to
+                the number of CPUs.
+            chunk_size (int, optional): Number of input tokens per chunk sent
+                to the pool. Larger chunks lower IPC overhead; smaller chunks
+                give smoother streaming. Defaults to 1000.
+            dictionary_path (str, optional): Passed to each worker's
+                `ModernKataKupas`. Defaults to None (packaged dictionary).
+            rules_file_path (str, optional): Passed to each worker's
+                `ModernKataKupas`. Defaults to None (packaged rules).
+            config_path (str, optional): Passed to each worker's
+                `ModernKataKupas`, and used for the parent-side cache size.
+                Defaults to None (packaged config).
+            max_pending_chunks (int, optional): Maximum number of chunks in
+                flight. Defaults to twice the number of workers.
+            cache_size (int, optional): Size of the parent-side result cache.
+                Defaults to `cache.segment_cache_size` from the config.
+            start_method (str, optional): multiprocessing start method
+                ("fork", "spawn", "forkserver"). Defaults to the platform default.
+            snapshot_path (str, optional): Compiled snapshot passed to each
+                worker's `ModernKataKupas`, so workers start faster. Defaults
+                to None.
+
+        Raises:
+            ValueError: If `workers` or `chunk_size` is smaller than 1.
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks or 2 * self.workers
+        self._init_args = (dictionary_path, rules_file_path, config_path, snapshot_path)
+        self._start_method = start_method
+        if cache_size is None:
+            cache_size = ConfigLoader(config_path=config_path).get_cache_size('segment_cache_size')
+        self.cache = LRUCache(cache_size)
+        self._pool: Optional[Any] = None
+
+    def _get_pool(self) -> Any:
+        """Starts the process pool if it is not running yet."""
+        if self._pool is None:
+            context = multiprocessing.get_context(self._start_method)
+            self._pool = context.Pool(
+                processes=self.workers,
+                initializer=_init_worker,
+                initargs=self._init_args,
+            )
+        return self._pool
+
+    def imap(self, words: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily segments `words`, yielding results in input order.
+
+        Args:
+            words (Iterable[str]): The words to segment. Consumed incrementally.
+
+        Yields:
+            str: The segmented form of each input word, as
+                `ModernKataKupas.segment` would return it.
+        """
+        pool = self._get_pool()
+        pending: Deque[_PendingChunk] = deque()
+        for chunk in _chunked(words, self.chunk_size):
+            known: Dict[str, str] = {}
+            to_segment: List[str] = []
+            for word in dict.fromkeys(chunk):
+                cached = self.cache.get(word)
+                if cached is None:
+                    to_segment.append(word)
+                else:
+                    known[word] = cached
+            async_result = pool.apply_async(_segment_chunk, (to_segment,)) if to_segment else None
+            pending.append((chunk, known, to_segment, async_result))
+            if len(pending) >= self.max_pending_chunks:
+                yield from self._drain(pending.popleft())
+        while pending:
+            yield from self._drain(pending.popleft())
+
+    def _drain(self, pending_chunk: _PendingChunk) -> Iterator[str]:
+        """Waits for one chunk's results and yields them in input order."""
+        chunk, known, to_segment, async_result = pending_chunk
+        if async_result is not None:
+            for word, segmented in zip(to_segment, async_result.get()):
+                known[word] = segmented
+                self.cache.put(word, segmented)
+        for word in chunk:
+            yield known[word]
+
+    def segment_many(self, words: Iterable[str]) -> List[str]:
+        """
+        Segments `words` in parallel and returns the results as a list.
+
+        Args:
+            words (Iterable[str]): The words to segment.
+
+        Returns:
+            list[str]: The segmented form of each input word, in input order.
+        """
+        return list(self.imap(words))
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelSegmenter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,146 @@
+# src/modern_kata_kupas/pipeline.py
+"""
+Modul pipeline tokenisasi-dan-segmentasi untuk teks berjalan (kalimat/dokumen).
+"""
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, List
+
+if TYPE_CHECKING:
+    from .separator import ModernKataKupas
+
+# Kata (huruf saja, boleh bersambung tanda hubung: "rumah-rumah", "di-download"),
+# bilangan ("2.500", "3,14"), atau satu karakter tanda baca.
+TOKEN_PATTERN = re.compile(
+    r"(?P<word>[^\W\d_]+(?:-[^\W\d_]+)*)"
+    r"|(?P<number>\d+(?:[.,]\d+)*)"
+    r"|(?P<punct>[^\w\s]|_)"
+)
+
+# Satu morfem dalam string tersegmentasi; "rs(~mayur)" tetap utuh.
+_MORPHEME_PATTERN = re.compile(r"rs\(~[^)]*\)|[^~]+")
+
+
+@dataclass(frozen=True)
+class TextToken:
+    """A token of running text with its character span.
+
+    Attributes:
+        text: The token exactly as it appears in the source text.
+        start: Offset of the first character in the source text.
+        end: Offset one past the last character in the source text.
+        kind: "word", "number" or "punct".
+    """
+    text: str
+    start: int
+    end: int
+    kind: str
+
+
+@dataclass(frozen=True)
+class MorphemeToken:
+    """A morpheme (or a non-word token) produced by the segmentation pipeline.
+
+    Morphemes are abstract units (e.g. "meN", "ulg"), so they do not map to
+    exact substrings of the source; every morpheme of a word carries the span
+    of that word.
+
+    Attributes:
+        text: The morpheme, or the token itself for numbers and punctuation.
+        start: Offset of the first character of the source token.
+        end: Offset one past the last character of the source token.
+        kind: "morpheme", "number" or "punct".
+        word: The source token as it appears in the text.
+        index: Position of the morpheme within its word (0 for non-words).
+        is_last: True for the last morpheme of a word (and for non-words).
+    """
+    text: str
+    start: int
+    end: int
+    kind: str
+    word: str
+    index: int = 0
+    is_last: bool = True
+
+
+def tokenize(text: str, offset: int = 0) -> Iterator[TextToken]:
+    """
+    Splits Indonesian running text into word, number and punctuation tokens.
+
+    Hyphenated forms such as "rumah-rumah" or "di-download" stay one word
+    token so that reduplication and loanword affixation can be segmented.
+    Whitespace is dropped.
+
+    Args:
+        text (str): The text to tokenize.
+        offset (int, optional): Added to every span, e.g. the position of
+            `text` inside a larger document. Defaults to 0.
+
+    Yields:
+        TextToken: The tokens of `text`, in order.
+    """
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup or "punct"
+        yield TextToken(match.group(), match.start() + offset, match.end() + offset, kind)
+
+
+def split_morphemes(segmented: str) -> List[str]:
+    """
+    Splits a segmented string into its morphemes.
+
+    Args:
+        segmented (str): Output of `ModernKataKupas.segment`, e.g. "meN~tulis~kan".
+
+    Returns:
+        list[str]: The morphemes, e.g. ["meN", "tulis", "kan"]. A "rs(~variant)"
+            marker is kept as one morpheme.
+    """
+    return _MORPHEME_PATTERN.findall(segmented)
+
+
+def segment_text(mkk: "ModernKataKupas", text: str, offset: int = 0) -> Iterator[MorphemeToken]:
+    """
+    Tokenizes `text` and segments its words, yielding morpheme tokens.
+
+    Words go through `mkk.segment`, so repeated words are served from the
+    segmenter's cache. Numbers and punctuation are passed through as single
+    tokens.
+
+    Args:
+        mkk (ModernKataKupas): The segmenter to use.
+        text (str): The running text to process.
+        offset (int, optional): Added to every span. Defaults to 0.
+
+    Yields:
+        MorphemeToken: Morpheme, number and punctuation tokens in text order.
+    """
+    segment = mkk.segment
+    for token in tokenize(text, offset):
+        if token.kind != "word":
+            yield MorphemeToken(token.text, token.start, token.end, token.kind, token.text)
+            continue
+        morphemes = split_morphemes(segment(token.text)) or [token.text]
+        last = len(morphemes) - 1
+        for index, morpheme in enumerate(morphemes):
+            yield MorphemeToken(morpheme, token.start, token.end, "morpheme", token.text,
+                                index, index == last)
+
+
+def segment_stream(mkk: "ModernKataKupas", lines: Iterable[str]) -> Iterator[MorphemeToken]:
+    """
+    Segments a stream of lines (e.g. an open file), yielding morpheme tokens.
+
+    Spans are offsets into the concatenation of all lines, as if the whole
+    stream had been read into one string; lines are consumed lazily.
+
+    Args:
+        mkk (ModernKataKupas): The segmenter to use.
+        lines (Iterable[str]): The lines of text, with or without line endings.
+
+    Yields:
+        MorphemeToken: Morpheme, number and punctuation tokens in stream order.
+    """
+    offset = 0
+    for line in lines:
+        yield from segment_text(mkk, line, offset)
+        offset += len(line)
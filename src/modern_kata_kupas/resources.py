@@ -0,0 +1,204 @@
+# src/modern_kata_kupas/resources.py
+"""
+Modul registri sumber daya bersama (flyweight) antar instans ModernKataKupas dalam satu proses.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from .config_loader import ConfigLoader, resolve_config_source
+from .dictionary_manager import DictionaryManager
+from .lexicon import FullFormLexicon
+from .rules import MorphologicalRules
+from .snapshot import Snapshot, load_snapshot, source_fingerprints
+from .stemmer_interface import SastrawiBackend
+
+T = TypeVar("T")
+
+
+def file_identity(path: str) -> Tuple[int, int, int, int]:
+    """
+    Identifies the current version of a built artifact (word table, lexicon) without reading it.
+
+    Artifacts are replaced atomically when rebuilt, so a new version has a
+    new inode; size and modification time catch in-place rewrites.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        tuple[int, int, int, int]: Device, inode, size and modification time (ns).
+
+    Raises:
+        OSError: If the file cannot be accessed.
+    """
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class ResourceRegistry:
+    """
+    A process-level registry of loaded resources shared between `ModernKataKupas` instances.
+
+    Each resource is stored under its kind, its source (file path, or None
+    for a packaged file) and a fingerprint of the source's current content:
+    the SHA-256 of text sources (dictionary, loanwords, rules, config, see
+    `snapshot.source_fingerprints`) or the file identity of built
+    artifacts (see `file_identity`). An instance built from the same
+    sources as an earlier one reuses its config, rules, dictionary, word
+    files, lexicon and Sastrawi stemmer instead of loading them again; a
+    changed source gets a new fingerprint, is loaded afresh and replaces
+    the previous version in the registry (instances still holding the old
+    version keep it).
+
+    Shared resources are treated as read-only. Each instance gets its own
+    caches and a copy-on-write view of the dictionary (see
+    `DictionaryManager.shared_view`), so `add_word` stays private to it.
+
+    Example:
+        >>> first = ModernKataKupas(share_resources=True)
+        >>> second = ModernKataKupas(share_resources=True)  # near free
+        >>> first.rules is second.rules
+        True
+    """
+
+    def __init__(self) -> None:
+        self._resources: Dict[Tuple[str, Hashable], Tuple[Hashable, Any]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, source: Hashable, fingerprint: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Returns the registered resource, loading and registering it if needed.
+
+        Args:
+            kind (str): Resource kind, e.g. "rules".
+            source (Hashable): Where the resource comes from, e.g. its path.
+            fingerprint (Hashable): The current version of the source; a
+                registered resource with another fingerprint is replaced.
+            loader (Callable[[], T]): Loads the resource.
+
+        Returns:
+            T: The shared resource.
+        """
+        with self._lock:
+            registered = self._resources.get((kind, source))
+            if registered is not None and registered[0] == fingerprint:
+                self.hits += 1
+                resource: T = registered[1]
+                return resource
+            self.misses += 1
+            resource = loader()
+            self._resources[(kind, source)] = (fingerprint, resource)
+            return resource
+
+    def load_resources(self, dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None,
+                       config_path: Optional[str] = None, snapshot_path: Optional[str] = None) -> Snapshot:
+        """
+        Returns the shared config, rules and dictionary for these sources.
+
+        The source files are hashed on every call (cheap compared to
+        parsing them). Resources that are not registered yet are loaded from
+        the snapshot at `snapshot_path` if given (see `snapshot.load_snapshot`),
+        otherwise from the source files.
+
+        Args:
+            dictionary_path (str, optional): Custom root word dictionary.
+            rules_file_path (str, optional): Custom rules JSON file.
+            config_path (str, optional): Custom config file or profile name.
+            snapshot_path (str, optional): Compiled snapshot of these sources.
+
+        Returns:
+            Snapshot: The shared config and rules, and a copy-on-write view
+                of the shared dictionary (new for every call).
+        """
+        sources = source_fingerprints(dictionary_path, rules_file_path, config_path)
+        loaded: List[Snapshot] = []
+
+        def compiled() -> Optional[Snapshot]:
+            """The snapshot, read (or recompiled) at most once per call."""
+            if snapshot_path is None:
+                return None
+            if not loaded:
+                loaded.append(load_snapshot(snapshot_path, dictionary_path, rules_file_path, config_path))
+            return loaded[0]
+
+        def load_config() -> ConfigLoader:
+            snapshot = compiled()
+            return snapshot.config if snapshot is not None else ConfigLoader(config_path=config_path)
+
+        def load_rules() -> MorphologicalRules:
+            snapshot = compiled()
+            return snapshot.rules if snapshot is not None else MorphologicalRules(rules_file_path=rules_file_path)
+
+        def load_dictionary() -> DictionaryManager:
+            snapshot = compiled()
+            return snapshot.dictionary if snapshot is not None else DictionaryManager(dictionary_path=dictionary_path)
+
+        config_file, packaged_config = resolve_config_source(config_path)
+        config = self.get("config", config_file or packaged_config, sources["config"], load_config)
+        rules = self.get("rules", rules_file_path, sources["rules"], load_rules)
+        dictionary = self.get("dictionary", dictionary_path, (sources["dictionary"], sources["loanwords"]),
+                              load_dictionary)
+        return Snapshot(config=config, dictionary=dictionary.shared_view(), rules=rules, sources=sources)
+
+    def word_tables(self, directory: str) -> DictionaryManager:
+        """
+        Returns a copy-on-write view of the shared dictionary served from a word table directory.
+
+        Args:
+            directory (str): A directory written by `DictionaryManager.save_word_tables`.
+
+        Returns:
+            DictionaryManager: A view of the shared manager.
+
+        Raises:
+            DictionaryFileNotFoundError: If a table file is missing.
+            DictionaryLoadingError: If a table file is invalid.
+        """
+        paths = [os.path.join(directory, filename) for filename in
+                 (DictionaryManager.KATA_DASAR_TABLE_FILENAME, DictionaryManager.LOANWORD_TABLE_FILENAME)]
+        try:
+            fingerprint: Hashable = tuple(file_identity(path) for path in paths)
+        except OSError:
+            fingerprint = None  # Let from_word_tables report the missing file
+        manager = self.get("word_tables", os.path.abspath(directory), fingerprint,
+                           lambda: DictionaryManager.from_word_tables(directory))
+        return manager.shared_view()
+
+    def lexicon(self, path: str) -> FullFormLexicon:
+        """
+        Returns the shared full-form lexicon loaded from `path`.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a lexicon.
+        """
+        return self.get("lexicon", os.path.abspath(path), file_identity(path), lambda: FullFormLexicon.load(path))
+
+    def stemmer_backend(self) -> SastrawiBackend:
+        """Returns the shared Sastrawi stemmer backend (built lazily on first use)."""
+        return self.get("stemmer", "sastrawi", None, SastrawiBackend)
+
+    def clear(self) -> None:
+        """Forgets every registered resource (instances keep the ones they hold)."""
+        with self._lock:
+            self._resources.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns registry statistics.
+
+        Returns:
+            dict[str, int]: "resources" (registered), "hits" (resources
+                reused) and "misses" (resources loaded).
+        """
+        return {"resources": len(self._resources), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+
+# The registry used by ModernKataKupas(share_resources=True)
+SHARED_REGISTRY = ResourceRegistry()
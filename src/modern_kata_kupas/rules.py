@@ -2,7 +2,8 @@ import json
 import os
 import importlib.resources
 import logging
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Tuple
 
 from .exceptions import RuleError
 
@@ -39,6 +40,13 @@ class RemoveSuffixRule(Rule):
             return word[:-len(self.pattern)]
         return word
 
+class PrefixMatch(NamedTuple):
+    """A prefix surface form matched at the start of a word, with its metadata."""
+    surface: str  # Surface form found on the word, e.g. "mem"
+    canonical: str  # Canonical prefix, e.g. "meN"
+    restore_initial: Optional[str]  # Root-initial char elided by this allomorph, e.g. "p"
+
+
 class MorphologicalRules:
     """
     Manages morphological rules for Indonesian word segmentation and reconstruction.
@@ -63,6 +71,14 @@ class MorphologicalRules:
             metadata present in the file.
         is_default_load (bool): True if the default packaged rules were loaded
             (i.e., no `rules_file_path` was provided during initialization).
+        canonical_by_surface (dict[str, str]): Reverse index from every prefix
+            surface form (e.g., "mem") to its canonical prefix (e.g., "meN").
+            Built by `rebuild_indexes`; O(1) fast path behind
+            `get_canonical_prefix_form`.
+        restore_initial_by_prefix (dict[tuple[str, str], Optional[str]]): Maps
+            (surface form, canonical prefix) to the root-initial character the
+            allomorph elides (e.g., ("mem", "meN") -> "p"), or None if nothing
+            is elided. Fast path behind `reverse_morphophonemics`.
     """
     def __init__(self, rules_file_path: Optional[str] = None):
         """Initializes MorphologicalRules by loading rules from a JSON file.
@@ -94,6 +110,14 @@ class MorphologicalRules:
         self.suffix_rules: Dict[str, List[Dict[str, Any]]] = {}
         self.infix_rules: Dict[str, List[Dict[str, Any]]] = {}
 
+        # Indeks balik dan trie karakter dari semua bentuk permukaan prefiks, dibangun oleh rebuild_indexes()
+        self.canonical_by_surface: Dict[str, str] = {}
+        self.restore_initial_by_prefix: Dict[Tuple[str, str], Optional[str]] = {}
+        self._prefix_trie: Dict[str, Any] = {}
+        self._prefix_forms: List[str] = []
+        # Trie sufiks terbalik; setiap simpul menyimpan rekaman aturan yang cocok di kunci ""
+        self._suffix_trie: Dict[str, Any] = {"": ()}
+
         self.is_default_load = not bool(rules_file_path) # True jika path tidak diberikan
 
         try:
@@ -157,10 +181,14 @@ class MorphologicalRules:
             self.prefix_rules = {}
             self.suffix_rules = {}
             self.infix_rules = {}
+            self.rebuild_indexes()
             return
 
         loaded_json = json.loads(file_content) # Bisa memunculkan JSONDecodeError
-        
+        self._parse_rules_data(loaded_json)
+
+    def _parse_rules_data(self, loaded_json: Dict[str, Any]) -> None:
+        """Menyusun aturan prefiks/sufiks dari struktur JSON yang sudah di-parse, lalu membangun indeks."""
         self.all_rules = loaded_json
         self.prefix_rules = {}
         self.suffix_rules = {}
@@ -198,45 +226,214 @@ class MorphologicalRules:
             # raw_infixes = self.all_rules.get("infixes", [])
             # ... (proses serupa untuk infiks) ...
 
-    def get_matching_suffix_rules(self, word: str) -> List[Dict[str, Any]]:
+        self.rebuild_indexes()
+
+    @classmethod
+    def from_rules_data(cls, rules_data: Dict[str, Any]) -> "MorphologicalRules":
+        """
+        Creates MorphologicalRules from an already parsed rules structure.
+
+        Nothing is read from disk; the rules are organized and the lookup
+        indexes compiled exactly as for a rules file with this content (used
+        to load compiled snapshots, see `snapshot`).
+
+        Args:
+            rules_data (dict[str, Any]): The parsed JSON structure of a rules
+                file (`all_rules` of a loaded instance).
+
+        Returns:
+            MorphologicalRules: The rules. `rules_file_path_arg` is None and
+                `is_default_load` is False.
+        """
+        rules = cls.__new__(cls)
+        rules.rules_file_path_arg = None
+        rules.is_default_load = False
+        rules._parse_rules_data(rules_data)
+        return rules
+
+    def rebuild_indexes(self) -> None:
+        """
+        Compiles the loaded prefix and suffix rules into lookup structures used on the hot path.
+
+        Builds the reverse indexes `canonical_by_surface` (surface form ->
+        canonical prefix) and `restore_initial_by_prefix` ((surface, canonical)
+        -> elided root-initial character, or None), then inserts every prefix
+        surface form into a character trie together with that metadata. When a
+        surface form is listed more than once, the first occurrence wins, which
+        is what `get_canonical_prefix_form` and `reverse_morphophonemics` rely on.
+
+        Suffix patterns are inserted, reversed, into a second trie. Each rule is
+        stored once as a read-only record annotated with its `original_pattern`,
+        and every trie node holds the tuple of records for all patterns that end
+        the path to that node, longest first (see `match_suffix_rules`).
+
+        This is called automatically after rules are parsed. Call it again if
+        `prefix_rules` or `suffix_rules` is modified in place.
+        """
+        canonical_by_surface: Dict[str, str] = {}
+        restore_initial_by_prefix: Dict[Tuple[str, str], Optional[str]] = {}
+        for canonical, rules_list in self.prefix_rules.items():
+            legacy_rules: List[Any] = rules_list # Berkas aturan lama bisa berisi detail yang bukan dict
+            for rule_index, rule_details in enumerate(legacy_rules):
+                if not isinstance(rule_details, dict):
+                    continue
+                form = rule_details.get("form")
+                if isinstance(form, str) and form:
+                    canonical_by_surface.setdefault(form, canonical)
+                allomorphs = rule_details.get("allomorphs")
+                if not isinstance(allomorphs, list):
+                    continue
+                for allomorph_rule in allomorphs:
+                    if not isinstance(allomorph_rule, dict):
+                        continue
+                    surface = allomorph_rule.get("surface")
+                    if not isinstance(surface, str) or not surface:
+                        continue
+                    canonical_by_surface.setdefault(surface, canonical)
+                    # Seperti reverse_morphophonemics: hanya detail aturan pertama per
+                    # bentuk kanonik, dan alomorf pertama dengan permukaan yang sama yang menang.
+                    if rule_index == 0 and (surface, canonical) not in restore_initial_by_prefix:
+                        char_to_restore = allomorph_rule.get("reconstruct_root_initial")
+                        was_elision = allomorph_rule.get("elision", False)
+                        restore_initial_by_prefix[(surface, canonical)] = (
+                            str(char_to_restore) if char_to_restore and was_elision else None
+                        )
+
+        trie: Dict[str, Any] = {}
+        for surface, canonical in canonical_by_surface.items():
+            node = trie
+            for char in surface:
+                node = node.setdefault(char, {})
+            node[""] = PrefixMatch( # Kunci kosong menandai akhir sebuah bentuk prefiks
+                surface, canonical, restore_initial_by_prefix.get((surface, canonical))
+            )
+        self.canonical_by_surface = canonical_by_surface
+        self.restore_initial_by_prefix = restore_initial_by_prefix
+        self._prefix_trie = trie
+        self._prefix_forms = list(canonical_by_surface)
+        self._suffix_trie = self._compile_suffix_trie()
+
+    def _compile_suffix_trie(self) -> Dict[str, Any]:
+        """Builds the reversed-suffix trie used by `match_suffix_rules`."""
+        suffix_trie: Dict[str, Any] = {}
+        for suffix_pattern, rules_list in self.suffix_rules.items():
+            node = suffix_trie
+            for char in reversed(suffix_pattern):
+                node = node.setdefault(char, {})
+            node[""] = node.get("", ()) + tuple(
+                MappingProxyType(dict(rule_detail, original_pattern=suffix_pattern))
+                for rule_detail in rules_list if isinstance(rule_detail, dict)
+            )
+
+        # Setiap simpul mewarisi rekaman dari simpul induknya (pola yang lebih pendek),
+        # diletakkan setelah rekamannya sendiri agar pola terpanjang tetap di depan.
+        pending = [(suffix_trie, ())]
+        while pending:
+            node, inherited = pending.pop()
+            node[""] = node.get("", ()) + inherited
+            pending.extend(
+                (child, node[""]) for char, child in node.items() if char
+            )
+        return suffix_trie
+
+    def match_suffix_rules(self, word: str) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Finds the suffix rules whose pattern ends the given word, without allocating.
+
+        The word is scanned once from its last character through the
+        precompiled reversed-suffix trie. The result is a tuple stored in the
+        trie, so repeated calls return the same objects and nothing is copied
+        or sorted per call.
+
+        Args:
+            word (str): The word to check for matching suffixes.
+
+        Returns:
+            tuple[Mapping[str, Any], ...]: Read-only rule records for every
+                matching suffix pattern, longest pattern first. Each record holds
+                the rule details plus an 'original_pattern' key with the matched
+                suffix form. Empty if no suffix matches.
+
+        Example:
+            >>> rules = MorphologicalRules() # Assuming default rules are loaded
+            >>> [r["original_pattern"] for r in rules.match_suffix_rules("makanannya")]
+            ['nya']
+            >>> [r["original_pattern"] for r in rules.match_suffix_rules("memberikan")]
+            ['kan', 'an']
+        """
+        node = self._suffix_trie
+        for char in reversed(word):
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+        records: Tuple[Mapping[str, Any], ...] = node[""]
+        return records
+
+    def match_prefixes(self, word: str) -> List[PrefixMatch]:
+        """
+        Finds every prefix surface form that the given word starts with.
+
+        The word is scanned once, left to right, through the precompiled prefix
+        trie. Matches are returned longest first (maximal munch), each carrying
+        its canonical form and elision metadata.
+
+        Args:
+            word (str): The word to match against.
+
+        Returns:
+            list[PrefixMatch]: Matching prefix forms, longest first. A form equal
+                to the whole word is included; callers decide whether an empty
+                remainder is acceptable.
+
+        Example:
+            >>> rules = MorphologicalRules() # Assuming default rules
+            >>> [m.surface for m in rules.match_prefixes("memukul")]
+            ['mem', 'me']
+            >>> rules.match_prefixes("memukul")[0]
+            PrefixMatch(surface='mem', canonical='meN', restore_initial='p')
+        """
+        matches: List[PrefixMatch] = []
+        node = self._prefix_trie
+        for char in word:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            match = node.get("")
+            if match is not None:
+                matches.append(match)
+        matches.reverse()
+        return matches
+
+    def get_matching_suffix_rules(self, word: str) -> List[Mapping[str, Any]]:
         """
         Retrieves all suffix rules that match the end of the given word.
 
         The rules are returned sorted by the length of the suffix pattern in descending
         order to prioritize longer matches (e.g., "-kannya" before "-nya").
-        Each returned rule dictionary includes an 'original_pattern' key for reference.
+        Each returned rule record includes an 'original_pattern' key for reference.
 
         Args:
             word (str): The word to check for matching suffixes.
 
         Returns:
-            list[dict[str, Any]]: A list of rule dictionaries for all matching
-                suffixes. Each dictionary contains details of a suffix rule,
+            list[Mapping[str, Any]]: A list of read-only rule records for all
+                matching suffixes. Each record contains details of a suffix rule,
                 plus an 'original_pattern' key indicating the matched suffix form
                 (e.g., "-kan", "-nya"). Returns an empty list if no suffixes match.
 
         Example:
             >>> rules = MorphologicalRules() # Assuming default rules are loaded
             >>> rules.get_matching_suffix_rules("makanannya")
-            [{'form': '-nya', 'type': 'P', 'description': 'Posesif -nya', 'original_pattern': '-nya'}, 
-             {'form': '-an', 'type': 'DS', 'description': 'Sufiks pembentuk nomina -an', 'original_pattern': '-an'}]
-            >>> # Note: Example output simplified for brevity. Actual rule dicts may vary.
-            >>> # Order depends on internal sorting (longest match first).
+            [mappingproxy({'form': 'nya', 'canonical': 'nya', 'type': 'possessive', 'original_pattern': 'nya'})]
+            >>> # Order depends on pattern length (longest match first).
+
+        Note:
+            The records are shared, precompiled objects; use `match_suffix_rules`
+            on hot paths to also avoid building the list.
         """
-        matched_rules = []
-        # Urutkan kunci sufiks berdasarkan panjangnya secara menurun
-        # agar sufiks yang lebih panjang (misal "-kannya") dicek sebelum yang lebih pendek (misal "-nya")
-        sorted_suffix_keys = sorted(self.suffix_rules.keys(), key=len, reverse=True)
-
-        for suffix_pattern in sorted_suffix_keys:
-            if word.endswith(suffix_pattern):
-                # self.suffix_rules[suffix_pattern] adalah list dari dict aturan
-                for rule_detail in self.suffix_rules[suffix_pattern]:
-                    # Tambahkan pattern asli ke detail aturan untuk referensi mudah
-                    rule_with_pattern = rule_detail.copy()
-                    rule_with_pattern['original_pattern'] = suffix_pattern 
-                    matched_rules.append(rule_with_pattern)
-        return matched_rules
+        return list(self.match_suffix_rules(word))
 
     def get_matching_prefix_rules(self, word: str) -> List[Dict[str, Any]]:
         """
@@ -404,18 +601,8 @@ class MorphologicalRules:
             list[str]: A list of all unique prefix surface forms found in the rules.
                        The list may not be in any particular order.
         """
-        all_forms = set()
-        for canon_rules_list in self.prefix_rules.values():
-            for rule_details in canon_rules_list:
-                # Untuk aturan prefiks sederhana yang mungkin hanya punya "form"
-                if "form" in rule_details and isinstance(rule_details["form"], str):
-                    all_forms.add(rule_details["form"])
-                # Untuk aturan prefiks kompleks dengan "allomorphs"
-                if "allomorphs" in rule_details and isinstance(rule_details["allomorphs"], list):
-                    for allomorph_rule in rule_details["allomorphs"]:
-                        if "surface" in allomorph_rule and isinstance(allomorph_rule["surface"], str):
-                            all_forms.add(allomorph_rule["surface"])
-        return list(all_forms)
+        # Dihitung sekali oleh rebuild_indexes()
+        return list(self._prefix_forms)
 
     def get_canonical_prefix_form(self, surface_form: str) -> Optional[str]:
         """
@@ -442,16 +629,11 @@ class MorphologicalRules:
             'di'
             >>> rules.get_canonical_prefix_form("xyz") is None
             True
+
+        Note:
+            This is a thin wrapper around the `canonical_by_surface` index.
         """
-        for canonical, rules_list in self.prefix_rules.items():
-            for rule_details in rules_list:
-                if rule_details.get("form") == surface_form:
-                    return canonical
-                if "allomorphs" in rule_details:
-                    for allomorph in rule_details["allomorphs"]:
-                        if allomorph.get("surface") == surface_form:
-                            return canonical
-        return None
+        return self.canonical_by_surface.get(surface_form)
 
     def reverse_morphophonemics(self, surface_stripped_prefix: str, canonical_prefix: str, stem_after_strip: str) -> str:
         """
@@ -483,39 +665,14 @@ class MorphologicalRules:
             'pukul'
             >>> rules.reverse_morphophonemics("di-", "di", "baca")
             'baca'
-        """
-        if not canonical_prefix or not surface_stripped_prefix:
-            return stem_after_strip # Tidak bisa melakukan apa-apa tanpa info prefiks
 
-        rules_for_canonical = self.prefix_rules.get(canonical_prefix)
-        if not rules_for_canonical:
-            return stem_after_strip
-
-        # Asumsi ada satu detail aturan utama per bentuk kanonik dalam list
-        actual_rule_details = rules_for_canonical[0]
-        allomorphs = actual_rule_details.get("allomorphs")
-
-        if not allomorphs:
-            return stem_after_strip # Tidak ada alomorf, tidak ada peluluhan yang perlu dibalik
-
-        for allomorph_rule in allomorphs:
-            if allomorph_rule.get("surface") == surface_stripped_prefix:
-                # Kita menemukan aturan alomorf yang cocok dengan prefiks permukaan yang dilepas
-                char_to_restore = allomorph_rule.get("reconstruct_root_initial")
-                was_elision = allomorph_rule.get("elision", False)
-
-                if char_to_restore and was_elision:
-                    # Jika aturan ini melibatkan peluluhan dan ada karakter untuk direstorasi,
-                    # maka tambahkan karakter tersebut ke awal stem_after_strip.
-                    # Tidak perlu memeriksa apakah stem_after_strip sudah dimulai dengan char_to_restore,
-                    # karena diasumsikan stem_after_strip adalah hasil *setelah* peluluhan.
-                    return str(char_to_restore) + stem_after_strip
-                else:
-                    # Alomorf cocok, tetapi tidak ada peluluhan yang perlu dibalik menurut aturan ini.
-                    return stem_after_strip
-        
-        # Jika surface_stripped_prefix tidak cocok dengan alomorf yang diketahui yang memiliki aturan peluluhan,
-        # kembalikan stem apa adanya.
+        Note:
+            This is a thin wrapper around the `restore_initial_by_prefix` index.
+        """
+        char_to_restore = self.restore_initial_by_prefix.get((surface_stripped_prefix, canonical_prefix))
+        if char_to_restore:
+            # Alomorf ini melibatkan peluluhan: tambahkan kembali karakter awal akar.
+            return char_to_restore + stem_after_strip
         return stem_after_strip
 
     def get_prefix_rules(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -2,10 +2,12 @@
 """
 Modul untuk memisahkan kata berimbuhan menjadi kata dasar dan afiksnya.
 """
+import os
 import re
 import logging
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple, List, Union
 
 from .normalizer import TextNormalizer
 
@@ -33,7 +35,38 @@ from .rules import MorphologicalRules
 from .stemmer_interface import IndonesianStemmer
 from .utils.alignment import align
 from .reconstructor import Reconstructor
-from .config_loader import ConfigLoader
+from .config_loader import ConfigLoader, ENGINES
+from .lattice import LatticeAnalysis, LatticeSegmenter
+from .lexicon import FullFormLexicon
+from .resources import SHARED_REGISTRY, ResourceRegistry
+from .snapshot import Snapshot, load_snapshot
+from .utils.lru_cache import LRUCache
+from . import pipeline
+from .pipeline import MorphemeToken
+
+# Dwipurwa words whose root is accepted without further checks (even if the
+# word itself is in the dictionary). Gold standard convention: le-X, te-X,
+# re-X and de-X words use the rp marker (lelaki -> laki~rp).
+DWIPURWA_WORDS: Dict[str, str] = {
+    # le- prefix dwipurwa
+    "lelaki": "laki",
+    "leluhur": "luhur",
+    "lelatu": "latu",
+    "lelap": "lap",
+    "lelah": "lah",
+    "leluasa": "luasa",
+    "lelucon": "lucon",
+    # te- prefix dwipurwa
+    "tetua": "tua",
+    "tetamu": "tamu",
+    "tetapi": "tapi",
+    # re- prefix dwipurwa
+    "rerata": "rata",
+    # de- prefix dwipurwa
+    "dedaun": "daun",
+    "dedalu": "dalu",
+}
+
 
 class ModernKataKupas:
     """
@@ -43,9 +76,15 @@ class ModernKataKupas:
     morphological rule engine, and stemmer to perform word segmentation.
     It handles various morphological phenomena including prefixes, suffixes,
     reduplication, and loanword affixation.
+
+    Input is normalized exactly once, in `segment`. Every internal helper works
+    on that normalized string (or slices of it) and therefore probes the
+    dictionary with `DictionaryManager.contains_normalized`, never with the
+    re-normalizing `is_kata_dasar`/`is_loanword`.
     """
 
-    def __init__(self, dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None, config_path: Optional[str] = None):
+    def __init__(self, dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None, config_path: Optional[str] = None,
+                 snapshot_path: Optional[str] = None, share_resources: bool = False):
         """Initializes the ModernKataKupas separator.
 
         Sets up the text normalizer, dictionary manager (for root words and
@@ -66,6 +105,19 @@ class ModernKataKupas:
                 If None, the default packaged config.yaml is loaded. Configuration
                 includes min stem lengths, reduplication pairs, and feature flags.
                 Defaults to None.
+            snapshot_path (str, optional): Path to a compiled snapshot of the
+                dictionary, loanwords, rules and configuration (see `snapshot`
+                and `mkk compile`). The three sources above are then loaded from
+                the snapshot, which is much faster; it is recompiled from them
+                automatically if it is missing or any source file has changed.
+                Defaults to None (no snapshot).
+            share_resources (bool, optional): If True, the configuration, rules,
+                dictionary, word tables, lexicon and Sastrawi stemmer are taken
+                from the process-wide `resources.SHARED_REGISTRY`, so every
+                further instance built from the same (unchanged) sources reuses
+                them instead of loading its own copies. Caches stay per
+                instance and the dictionary is a copy-on-write view, so
+                `add_word` only affects this instance. Defaults to False.
 
         Raises:
             DictionaryFileNotFoundError: If a specified `dictionary_path` is invalid
@@ -83,8 +135,18 @@ class ModernKataKupas:
         DEFAULT_DATA_PACKAGE_PATH = 'modern_kata_kupas.data' # Path for importlib when src is on sys.path
         DEFAULT_RULES_FILENAME = 'affix_rules.json'
 
+        # Shared (see resources.ResourceRegistry) or compiled (see snapshot.load_snapshot) dictionary/rules/config
+        self._registry: Optional[ResourceRegistry] = SHARED_REGISTRY if share_resources else None
+        if self._registry is not None:
+            snapshot: Optional[Snapshot] = self._registry.load_resources(
+                dictionary_path, rules_file_path, config_path, snapshot_path)
+        elif snapshot_path:
+            snapshot = load_snapshot(snapshot_path, dictionary_path, rules_file_path, config_path)
+        else:
+            snapshot = None
+
         # Load configuration
-        self.config = ConfigLoader(config_path=config_path)
+        self.config = snapshot.config if snapshot is not None else ConfigLoader(config_path=config_path)
 
         # Load min stem lengths from config
         self.MIN_STEM_LENGTH_FOR_POSSESSIVE = self.config.get_min_stem_length('possessive')
@@ -93,13 +155,32 @@ class ModernKataKupas:
 
         # Load reduplication pairs from config
         self.DWILINGGA_SALIN_SUARA_PAIRS = self.config.get_dwilingga_pairs()
+        self.FROZEN_COMPOUNDS = self.config.get_frozen_compounds()
+        self.rebuild_reduplication_indexes()
+        self.root_finder = self.config.get_root_finder()
+        self.prefix_strip_budget = self.config.get_prefix_strip_budget()
+        # Feature flags: disabled stages are skipped entirely
+        self.enable_loanword_affixation = self.config.is_feature_enabled('enable_loanword_affixation')
+        self.enable_reduplication = self.config.is_feature_enabled('enable_reduplication')
+        self.enable_morphophonemic_rules = self.config.is_feature_enabled('enable_morphophonemic_rules')
 
         self.normalizer = TextNormalizer()
-        self.dictionary = DictionaryManager(dictionary_path=dictionary_path)
-        self.stemmer = IndonesianStemmer()
+        word_table_dir = self.config.get_word_table_dir()
+        if word_table_dir and self._registry is not None:
+            self.dictionary = self._registry.word_tables(word_table_dir)
+        elif word_table_dir:
+            self.dictionary = DictionaryManager.from_word_tables(word_table_dir)
+        elif snapshot is not None:
+            self.dictionary = snapshot.dictionary
+        else:
+            self.dictionary = DictionaryManager(dictionary_path=dictionary_path)
+        self.stemmer = IndonesianStemmer(cache_size=self.config.get_cache_size('stemmer_cache_size'),
+                                         backend=self._registry.stemmer_backend() if self._registry else None)
         self.aligner = align
 
-        if rules_file_path:
+        if snapshot is not None:
+            self.rules = snapshot.rules
+        elif rules_file_path:
             self.rules = MorphologicalRules(rules_file_path=rules_file_path)
         else:
             # Refactored to use MorphologicalRules default loading (which uses read_text/files internally)
@@ -131,6 +212,57 @@ class ModernKataKupas:
         # Initialize Reconstructor
         self.reconstructor = Reconstructor(rules=self.rules, dictionary_manager=self.dictionary, stemmer=self.stemmer)
 
+        # Memoized segment() results keyed on the normalized word. The cache is
+        # tied to the dictionary object and its generation, see _sync_caches().
+        self.segment_cache = LRUCache(self.config.get_cache_size('segment_cache_size'))
+        self._cache_dictionary: Optional[DictionaryManager] = None
+        self._cache_generation = -1
+        # Per-word strip memo and stage counters, active during segment() (see _memo_strip)
+        self._strip_memo: Optional[Dict[Tuple[str, str], Tuple[str, Tuple[str, ...]]]] = None
+        self._word_stage_counts: Optional[Counter] = None
+        self.stage_stats: Counter = Counter()
+        self.last_word_stage_stats: Counter = Counter()
+        # Dwipurwa candidate index, built lazily (see _get_dwipurwa_index)
+        self._dwipurwa_index: Optional[Dict[str, str]] = None
+        # Loanword + suffix surface forms, built lazily (see _get_loanword_affix_index)
+        self._loanword_affix_index: Optional[Dict[str, Tuple[str, str]]] = None
+        self._loanword_affix_index_key: Optional[Tuple[Any, int, Any]] = None
+        # The registry's loanword list; its affix index is shared until add_word() detaches the view.
+        # The index is registered per dictionary and rules source, so a reloaded source replaces it.
+        self._shared_loanwords = self.dictionary.loanwords_set if self._registry is not None else None
+        self._shared_index_source: Tuple[Any, ...] = (
+            os.path.abspath(word_table_dir) if word_table_dir else dictionary_path, rules_file_path)
+        # Alternative engine, used by segment() when engine == "lattice" and by segment_nbest()
+        self.lattice = LatticeSegmenter(self)
+        self._engine = self.config.get_engine()
+        # Precompiled surface -> segmentation table consulted before the rule engine
+        lexicon_path = self.config.get_lexicon_path()
+        self.lexicon: Optional[FullFormLexicon] = None
+        if lexicon_path:
+            self.lexicon = (self._registry.lexicon(lexicon_path) if self._registry is not None
+                            else FullFormLexicon.load(lexicon_path))
+
+    @property
+    def engine(self) -> str:
+        """
+        The segmentation engine used by `segment`: "greedy" or "lattice".
+
+        Set from the `engine` config option. Assigning a new value clears the
+        segment cache.
+
+        Raises:
+            ValueError: If set to an unknown engine.
+        """
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine: str) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+        if engine != self._engine:
+            self._engine = engine
+            self.clear_cache()
+
     def reconstruct(self, segmented_word: str) -> str:
         """
         Reconstructs an original word from its segmented morpheme string.
@@ -179,6 +311,15 @@ class ModernKataKupas:
         Args:
             word (str): The Indonesian word to be segmented.
 
+        Results are memoized in a size-bounded LRU cache keyed on the normalized
+        word (see `get_cache_stats`). The cache is cleared automatically when the
+        dictionary is modified, e.g. through `DictionaryManager.add_word`.
+
+        If a full-form lexicon is loaded (`lexicon`, see the `lexicon_path`
+        config option), a word with exactly one analysis in it is answered
+        from the lexicon without running steps 2-6; ambiguous and unknown
+        words go through the rule engine as usual.
+
         Returns:
             str: A string representing the segmented morphemes separated by tildes (~).
                  For example, "mempermainkan" might become "meN~per~main~kan".
@@ -200,13 +341,179 @@ class ModernKataKupas:
         if not normalized_word:
             return ""
 
+        self._sync_caches()
+        cached = self.segment_cache.get(normalized_word)
+        if cached is not None:
+            return str(cached)
+
+        # Per-word memo shared by both strategies, see _memo_strip()
+        self._strip_memo = {}
+        self._word_stage_counts = Counter()
+        try:
+            lexicon_result = self._lookup_lexicon(normalized_word)
+            if lexicon_result is not None:
+                self._count_stage("lexicon_hits")
+                result = lexicon_result
+            else:
+                result = self._segment_normalized(normalized_word, word)
+        finally:
+            if self._word_stage_counts["prefix_budget_hits"]:
+                self._word_stage_counts["words_over_budget"] = 1
+            self.last_word_stage_stats = self._word_stage_counts
+            self.stage_stats.update(self._word_stage_counts)
+            self._strip_memo = None
+            self._word_stage_counts = None
+        self.segment_cache.put(normalized_word, result)
+        return result
+
+    def _lookup_lexicon(self, word: str) -> Optional[str]:
+        """
+        Looks a normalized word up in the full-form lexicon, if one is loaded.
+
+        Words that are root words or loanwords of the current dictionary are
+        never answered from the lexicon, so words added with `add_word`
+        after the lexicon was built segment as they would without it. The
+        lexicon's analyses assume every feature flag is on (each one changes
+        how some of its forms segment), so it is not consulted while any
+        flag is off.
+
+        Args:
+            word (str): The normalized word.
+
+        Returns:
+            Optional[str]: The lexicon's segmentation, or None to run the engine.
+        """
+        if self.lexicon is None or not (self.enable_loanword_affixation and self.enable_reduplication
+                                        and self.enable_morphophonemic_rules):
+            return None
+        result = self.lexicon.lookup(word)
+        if result is not None and (self.dictionary.contains_normalized(word)
+                                   or self.dictionary.contains_normalized(word, is_loanword=True)):
+            return None
+        return result
+
+    def segment_many(self, words: Iterable[str], lazy: bool = False) -> Union[List[str], Iterator[str]]:
+        """
+        Segments a sequence of words, e.g. all tokens of a document.
+
+        Each distinct input token is segmented only once and its result is
+        reused for every repetition, so the cost tracks the number of unique
+        word types rather than the number of tokens. Results come back in
+        input order. Segmentation shares the same caches as `segment`.
+
+        Args:
+            words (Iterable[str]): The words to segment.
+            lazy (bool, optional): If True, returns a generator that consumes
+                `words` incrementally and yields results one by one; repeated
+                tokens are then answered by the segment cache, so memory stays
+                bounded by its size. If False, returns a list. Defaults to False.
+
+        Returns:
+            list[str] | Iterator[str]: The segmented form of each input word,
+                in input order, as `segment` would return it.
+
+        Example:
+            >>> mkk = ModernKataKupas()
+            >>> mkk.segment_many(["makanan", "dimakan", "makanan"])
+            ['makan~an', 'di~makan', 'makan~an']
+        """
+        if lazy:
+            return self._iter_segment_many(words)
+        tokens = list(words)
+        segmented = {word: self.segment(word) for word in dict.fromkeys(tokens)}
+        return [segmented[word] for word in tokens]
+
+    def _iter_segment_many(self, words: Iterable[str]) -> Iterator[str]:
+        """Generator behind `segment_many(..., lazy=True)`; `segment_cache` dedupes repeated tokens."""
+        for word in words:
+            yield self.segment(word)
+
+    def segment_text(self, text: str) -> Iterator[MorphemeToken]:
+        """
+        Tokenizes running text and segments its words.
+
+        Hyphenated reduplication ("rumah-rumah") stays one word; numbers and
+        punctuation are passed through. Every token carries the character span
+        of its source word. See `pipeline.segment_text`.
+
+        Args:
+            text (str): A sentence or document.
+
+        Returns:
+            Iterator[MorphemeToken]: Morpheme, number and punctuation tokens,
+                generated lazily in text order.
+
+        Example:
+            >>> mkk = ModernKataKupas()
+            >>> [(t.text, t.start, t.end) for t in mkk.segment_text("Rumah-rumah dibangun.")]
+            [('rumah', 0, 11), ('ulg', 0, 11), ('di', 12, 20), ('bangun', 12, 20), ('.', 20, 21)]
+        """
+        return pipeline.segment_text(self, text)
+
+    def segment_stream(self, lines: Iterable[str]) -> Iterator[MorphemeToken]:
+        """
+        Segments a stream of lines (e.g. an open file) lazily.
+
+        Spans are offsets into the concatenation of all lines. See
+        `pipeline.segment_stream`.
+
+        Args:
+            lines (Iterable[str]): Lines of text.
+
+        Returns:
+            Iterator[MorphemeToken]: Morpheme, number and punctuation tokens,
+                generated lazily in stream order.
+        """
+        return pipeline.segment_stream(self, lines)
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns hit/miss/eviction statistics for the internal caches.
+
+        Returns:
+            dict[str, dict[str, Any]]: Statistics per cache, keyed by cache name
+                ("segment" and "stemmer"). See `LRUCache.stats` for the fields.
+        """
+        return {"segment": self.segment_cache.stats(), "stemmer": self.stemmer.get_cache_stats()}
+
+    def clear_cache(self) -> None:
+        """Discards all memoized segmentation results."""
+        self.segment_cache.clear()
+
+    def _sync_caches(self) -> None:
+        """
+        Clears memoized results if the dictionary changed since they were computed.
+
+        The dictionary counts as changed if it was replaced by another
+        `DictionaryManager` instance or if its `generation` counter moved.
+        """
+        dictionary = self.dictionary
+        if (self._cache_dictionary is not dictionary or
+                self._cache_generation != dictionary.generation):
+            self.segment_cache.clear()
+            self._cache_dictionary = dictionary
+            self._cache_generation = dictionary.generation
+
+    def _segment_normalized(self, normalized_word: str, word: str) -> str:
+        """
+        Runs the full segmentation pipeline on an already normalized word.
+
+        This is the uncached part of `segment`.
+
+        Args:
+            normalized_word: The normalized, non-empty form of `word`.
+            word: The original input word (for logging).
+
+        Returns:
+            The segmented string, see `segment`.
+        """
         # 2. Detect reduplication and check if already a root word
         redup_info = self._detect_reduplication(normalized_word, word)
 
         # Early return if the word is a root word with no reduplication
         if (redup_info.word_to_process == normalized_word and
                 not redup_info.marker and
-                self.dictionary.is_kata_dasar(normalized_word)):
+                self.dictionary.contains_normalized(normalized_word)):
             return normalized_word
 
         word_to_process = redup_info.word_to_process
@@ -215,24 +522,32 @@ class ModernKataKupas:
             f"word_to_process='{word_to_process}', marker='{redup_info.marker}'"
         )
 
-        # 3. Apply dual segmentation strategies
-        s1 = self._apply_strategy(word_to_process, prefix_first=True)
-        s2 = self._apply_strategy(word_to_process, prefix_first=False)
+        if self._engine == "lattice":
+            # 3-4. Score every analysis at once and take the best one
+            chosen_stem, chosen_prefixes, chosen_suffixes = self._choose_lattice_analysis(
+                word_to_process, redup_info
+            )
+        else:
+            # 3. Apply dual segmentation strategies
+            s1 = self._apply_strategy(word_to_process, prefix_first=True)
+            s2 = self._apply_strategy(word_to_process, prefix_first=False, must_beat=s1)
 
-        logging.debug(f"segment({word}): S1={s1}, S2={s2}")
+            logging.debug(f"segment({word}): S1={s1}, S2={s2}")
 
-        # 4. Choose the best result
-        chosen_stem, chosen_prefixes, chosen_suffixes = self._choose_best_strategy(
-            s1, s2, word_to_process
-        )
+            # 4. Choose the best result
+            chosen_stem, chosen_prefixes, chosen_suffixes = self._choose_best_strategy(
+                s1, s2, word_to_process
+            )
 
         logging.debug(
             f"segment({word}): chosen_stem='{chosen_stem}', "
             f"prefixes={chosen_prefixes}, suffixes={chosen_suffixes}"
         )
 
-        # 5. Try loanword affixation if stem is not a known root word
-        if not self.dictionary.is_kata_dasar(chosen_stem):
+        # 5. Try loanword affixation if no affixes were found around a known root word
+        if (self.enable_loanword_affixation and
+                not self.dictionary.contains_normalized(chosen_stem) and
+                not (chosen_prefixes or chosen_suffixes)):
             loanword_result = self._handle_loanword_affixation(normalized_word)
             if loanword_result:
                 logging.debug(f"segment({word}): Using loanword segmentation: '{loanword_result}'")
@@ -263,11 +578,11 @@ class ModernKataKupas:
             logging.debug(f"segment({word}): No effective segmentation, returning normalized_word")
             return normalized_word
 
-        if result_str == normalized_word and not self.dictionary.is_kata_dasar(normalized_word):
+        if result_str == normalized_word and not self.dictionary.contains_normalized(normalized_word):
             logging.debug(f"segment({word}): Result equals input but not a KD, returning normalized_word")
             return normalized_word
 
-        if (not self.dictionary.is_kata_dasar(chosen_stem) and
+        if (not self.dictionary.contains_normalized(chosen_stem) and
                 not chosen_prefixes and not assembled_suffixes and
                 not redup_info.marker and not redup_info.phonetic_variant):
             logging.debug(f"segment({word}): Stem not KD and no affixes, returning normalized_word")
@@ -286,7 +601,11 @@ class ModernKataKupas:
 
         Returns:
             ReduplicationInfo containing the word to process and reduplication details.
+            Nothing is detected if the enable_reduplication feature is off.
         """
+        if not self.enable_reduplication:
+            return ReduplicationInfo(normalized_word, "", [], None)
+
         if '-' in normalized_word:
             word_to_process, marker, suffixes, variant = self._handle_reduplication(normalized_word)
             if marker:
@@ -296,25 +615,14 @@ class ModernKataKupas:
                 logging.debug(f"segment({original_word}): Frozen compound detected: {word_to_process}~{variant}")
             else:
                 # No reduplication pattern found, treat as regular hyphenated word
-                if self.dictionary.is_kata_dasar(normalized_word):
+                if self.dictionary.contains_normalized(normalized_word):
                     return ReduplicationInfo(normalized_word, "", [], None)
                 # Return word_to_process but no reduplication info
                 variant = None
                 suffixes = []
             return ReduplicationInfo(word_to_process, marker, suffixes, variant)
 
-        # Check for Dwipurwa FIRST (even for KD words, as dwipurwa words can be in dictionary)
-        dwipurwa_result = self._handle_dwipurwa(normalized_word)
-        if dwipurwa_result:
-            word_to_process, marker, suffixes, variant = dwipurwa_result
-            logging.debug(f"segment({original_word}): Dwipurwa detected: marker='{marker}'")
-            return ReduplicationInfo(word_to_process, marker, suffixes, variant)
-
-        # Non-hyphenated word - if it's a KD and not dwipurwa, return as-is
-        if self.dictionary.is_kata_dasar(normalized_word):
-            return ReduplicationInfo(normalized_word, "", [], None)
-
-        # Fallback dwipurwa check (for words not caught by hardcoded list)
+        # Dwipurwa is checked even for KD words, as dwipurwa words can be in dictionary
         dwipurwa_result = self._handle_dwipurwa(normalized_word)
         if dwipurwa_result:
             word_to_process, marker, suffixes, variant = dwipurwa_result
@@ -323,27 +631,115 @@ class ModernKataKupas:
 
         return ReduplicationInfo(normalized_word, "", [], None)
 
-    def _apply_strategy(self, word: str, prefix_first: bool) -> StrategyResult:
+    def _apply_strategy(self, word: str, prefix_first: bool,
+                        must_beat: Optional[StrategyResult] = None) -> StrategyResult:
         """
         Applies a single segmentation strategy.
 
+        Stripping results are shared through the per-word memo (see
+        `_memo_strip`), so a substring stripped by one strategy is not
+        stripped again by the other.
+
         Args:
             word: The word to segment.
             prefix_first: If True, strip prefixes then suffixes. Otherwise, reverse.
+            must_beat: The other strategy's result, if already known. Used
+                only for the suffix-first strategy, which can only win with a
+                strictly longer valid stem (see `_choose_best_strategy`). If
+                the stem left after suffix stripping is not longer than
+                `must_beat`'s valid stem, the prefix stage is skipped and the
+                partial result is returned with `is_valid_root` False.
+
+        For the prefix-first strategy, the suffix stage is skipped the same
+        way when prefixes were stripped but no root word is a prefix of the
+        remaining stem (see `DictionaryManager.longest_known_root`).
 
         Returns:
             StrategyResult with the stem, affixes, and validity.
         """
         if prefix_first:
-            stem_after_first, prefixes = self._strip_prefixes(word)
-            final_stem, suffixes = self._strip_suffixes(stem_after_first)
+            stem_after_first, prefixes = self._memo_strip("prefixes", word)
+            if (prefixes and not self.dictionary.contains_normalized(stem_after_first) and
+                    self.dictionary.longest_known_root(stem_after_first) is None):
+                # Suffix stripping only shortens the stem from the end, so the
+                # final stem would be a prefix of this one: no root can come out.
+                # (Without prefixes the other strategy strips this very word, so
+                # its suffix stripping is kept for the memo.)
+                self._count_stage("pruned_branches")
+                return StrategyResult(stem_after_first, prefixes, [], False)
+            final_stem, suffixes = self._memo_strip("suffixes", stem_after_first)
         else:
-            stem_after_first, suffixes = self._strip_suffixes(word)
-            final_stem, prefixes = self._strip_prefixes(stem_after_first)
-
-        is_valid = self.dictionary.is_kata_dasar(final_stem)
+            stem_after_first, suffixes = self._memo_strip("suffixes", word)
+            if (must_beat is not None and must_beat.is_valid_root and
+                    len(stem_after_first) <= len(must_beat.stem)):
+                # Prefix stripping only shortens the stem, so this strategy
+                # cannot produce a strictly longer valid stem: must_beat dominates.
+                self._count_stage("dominated_skips")
+                return StrategyResult(stem_after_first, [], suffixes, False)
+            final_stem, prefixes = self._memo_strip("prefixes", stem_after_first)
+
+        is_valid = self.dictionary.contains_normalized(final_stem)
         return StrategyResult(final_stem, prefixes, suffixes, is_valid)
 
+    def _memo_strip(self, operation: str, word: str) -> Tuple[str, List[str]]:
+        """
+        Runs `_strip_prefixes` ("prefixes") or `_strip_suffixes` ("suffixes")
+        on `word`, reusing the result if the same (substring, operation) was
+        already computed while segmenting the current word.
+
+        The memo only lives for one uncached `segment` call, so it never
+        outlives a dictionary change. Outside `segment` it is not used.
+
+        Args:
+            operation: "prefixes" or "suffixes".
+            word: The substring to strip.
+
+        Returns:
+            Tuple of (stem, affixes), as returned by the stripping method.
+        """
+        memo = self._strip_memo
+        key = (word, operation)
+        if memo is not None:
+            memoized = memo.get(key)
+            if memoized is not None:
+                self._count_stage("memo_hits")
+                return memoized[0], list(memoized[1])
+        self._count_stage("strip_" + operation)
+        if operation == "prefixes":
+            stem, affixes = self._strip_prefixes(word)
+        else:
+            stem, affixes = self._strip_suffixes(word)
+        if memo is not None:
+            memo[key] = (stem, tuple(affixes))
+        return stem, affixes
+
+    def _count_stage(self, stage: str) -> None:
+        """Increments a per-word stage counter while a word is being segmented."""
+        if self._word_stage_counts is not None:
+            self._word_stage_counts[stage] += 1
+
+    def get_stage_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns counters of the stripping work done by the segmentation strategies.
+
+        Counted stages are "strip_prefixes" and "strip_suffixes" (stripping
+        actually performed), "memo_hits" (stripping answered from the per-word
+        memo shared by both strategies) and "dominated_skips" (suffix-first
+        prefix stages skipped because the prefix-first result already
+        dominates) and "pruned_branches" (prefix-first suffix stages skipped
+        because no root word starts the stem). "prefix_budget_hits" counts prefix stripping calls that
+        ran out of their `prefix_strip_budget`, and "words_over_budget" the
+        words on which that happened at least once. "lexicon_hits" counts
+        words answered from the full-form lexicon. Words answered from the
+        segment cache are not counted.
+
+        Returns:
+            dict[str, dict[str, int]]: "total" holds the counters summed over
+                all words segmented so far, "last_word" those of the most
+                recently computed word.
+        """
+        return {"total": dict(self.stage_stats), "last_word": dict(self.last_word_stage_stats)}
+
     def _choose_best_strategy(
         self, s1: StrategyResult, s2: StrategyResult, word_to_process: str
     ) -> Tuple[str, List[str], List[str]]:
@@ -368,10 +764,76 @@ class ModernKataKupas:
             return s2.stem, s2.prefixes, s2.suffixes
         else:
             # Fallback: use word_to_process as stem if it's a KD, otherwise as-is
-            if self.dictionary.is_kata_dasar(word_to_process):
+            if self.dictionary.contains_normalized(word_to_process):
                 return word_to_process, [], []
             return word_to_process, [], []
 
+    def _choose_lattice_analysis(
+        self, word_to_process: str, redup_info: ReduplicationInfo
+    ) -> Tuple[str, List[str], List[str]]:
+        """
+        Chooses the best analysis of the lattice engine (see `LatticeSegmenter`).
+
+        Args:
+            word_to_process: The word left after reduplication detection.
+            redup_info: The reduplication detected on the word.
+
+        Returns:
+            Tuple of (chosen_stem, chosen_prefixes, chosen_suffixes). Falls back
+            to (word_to_process, [], []) if no analysis has a known root.
+        """
+        analyses = self._lattice_analyses(word_to_process, redup_info, 1)
+        if analyses and (analyses[0].prefixes or analyses[0].suffixes):
+            best = analyses[0]
+            return best.root, list(best.prefixes), list(best.suffixes)
+        return word_to_process, [], []
+
+    def _lattice_analyses(
+        self, word_to_process: str, redup_info: ReduplicationInfo, k: int
+    ) -> List[LatticeAnalysis]:
+        """Runs the lattice on the base form; hyphens are dropped when no reduplication was found (di-download)."""
+        if not redup_info.marker and not redup_info.phonetic_variant:
+            word_to_process = word_to_process.replace('-', '')
+        return self.lattice.analyze(word_to_process, k)
+
+    def segment_nbest(self, word: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Returns the `k` best segmentations of a word with their scores.
+
+        Always uses the lattice engine, whatever `engine` is set to.
+        Reduplication is detected first, as in `segment`, and every analysis
+        of the base form is combined with it. The unsegmented word is always
+        among the candidates, with a very low score if it is not a known
+        root word.
+
+        Args:
+            word (str): The Indonesian word to be segmented.
+            k (int, optional): Maximum number of segmentations. Defaults to 5.
+
+        Returns:
+            list[tuple[str, float]]: Distinct (segmentation, score) pairs,
+                highest score first. Empty if the word normalizes to an empty
+                string.
+
+        Example:
+            >>> mkk = ModernKataKupas()
+            >>> mkk.segment_nbest("mengetik", k=2)
+            [('meN~ketik', -0.5), ('meN~tik', -1.0)]
+        """
+        normalized_word = self.normalizer.normalize_word(word)
+        if not normalized_word or k < 1:
+            return []
+        redup_info = self._detect_reduplication(normalized_word, word)
+        results: Dict[str, float] = {}
+        for analysis in self._lattice_analyses(redup_info.word_to_process, redup_info, k):
+            if analysis.prefixes or analysis.suffixes or redup_info.marker or redup_info.phonetic_variant:
+                segmented = self._assemble_result(
+                    analysis.root, list(analysis.prefixes), list(analysis.suffixes), redup_info)
+            else:
+                segmented = normalized_word
+            results.setdefault(segmented, analysis.score)
+        return list(results.items())
+
     def _assemble_result(
         self,
         stem: str,
@@ -421,6 +883,13 @@ class ModernKataKupas:
         Attempts to segment a word by stripping Indonesian affixes if the base is a known loanword.
         This is typically called for OOV words after standard stemming fails.
 
+        For each prefix form the word starts with (longest first), the rest of
+        the word is looked up as a bare loanword and then in the loanword affix
+        index (see `_split_loanword_suffix`); failing that, the whole word
+        is looked up in the index for loanword + suffix. This is at most one
+        set probe and one index probe per prefix form, instead of probing the
+        loanword set once per prefix form and matching suffix rule.
+
         Args:
             word (str): The word to process (usually the normalized_word).
 
@@ -437,61 +906,46 @@ class ModernKataKupas:
         # do not contain hyphens themselves.
         processed_word = word.replace('-', '')
 
-        # Strategy 1: Check for prefix + loanword_base + suffix
-        # Iterate through all prefix forms (longest first for maximal munch)
-        sorted_prefix_forms = sorted(self.rules.get_all_prefix_forms(), key=len, reverse=True)
-        
-        for p_form in sorted_prefix_forms:
-            if processed_word.startswith(p_form): # Use processed_word
-                canonical_prefix = self.rules.get_canonical_prefix_form(p_form)
-                if not canonical_prefix: 
-                    continue
-
-                # Try with prefix only first
-                base_after_prefix = processed_word[len(p_form):] # Use processed_word
-                if not base_after_prefix: continue
-
-                if self.dictionary.is_loanword(base_after_prefix):
-                    return f"{canonical_prefix}~{base_after_prefix}"
-
-                # Try with prefix + suffix
-                matching_suffix_rules = self.rules.get_matching_suffix_rules(base_after_prefix)
-                for s_rule in matching_suffix_rules:
-                    s_form_on_word = s_rule.get("original_pattern")
-                    if not s_form_on_word: continue
-                    s_form_clean = s_form_on_word.lstrip('-') 
-                    
-                    if not base_after_prefix.endswith(s_form_on_word):
-                        continue
+        # Strategy 1: prefix + loanword_base (+ suffix), longest prefix first (maximal munch)
+        for prefix_match in self.rules.match_prefixes(processed_word):
+            base_after_prefix = processed_word[len(prefix_match.surface):]
+            if not base_after_prefix:
+                continue
+            if self.dictionary.contains_normalized(base_after_prefix, is_loanword=True):
+                return f"{prefix_match.canonical}~{base_after_prefix}"
+            split = self._split_loanword_suffix(base_after_prefix)
+            if split:
+                return f"{prefix_match.canonical}~{split[0]}~{split[1]}"
+
+        # Strategy 2: loanword_base + suffix only (no prefix)
+        split = self._split_loanword_suffix(processed_word)
+        if split:
+            return f"{split[0]}~{split[1]}"
+
+        # A bare loanword is not an *affixed* loanword; segment() returns it as is.
+        return "" # No loanword affixation pattern found
 
-                    loanword_candidate = base_after_prefix[:-len(s_form_on_word)]
-                    if not loanword_candidate: continue
-                    
-                    if self.dictionary.is_loanword(loanword_candidate):
-                        return f"{canonical_prefix}~{loanword_candidate}~{s_form_clean}"
-        
-        # Strategy 2: Check for loanword_base + suffix only (no prefix)
-        matching_suffix_rules = self.rules.get_matching_suffix_rules(processed_word) # Use processed_word
-        for s_rule in matching_suffix_rules:
-            s_form_on_word = s_rule.get("original_pattern")
-            if not s_form_on_word: continue
-            s_form_clean = s_form_on_word.lstrip('-')
-            
-            base_candidate = processed_word[:-len(s_form_on_word)] # Use processed_word
-            if not base_candidate: continue
-
-            if self.dictionary.is_loanword(base_candidate):
-                return f"{base_candidate}~{s_form_clean}"
-                
-        # Strategy 3: Check if the word itself is a loanword (no affixes)
-        # This might seem redundant if the main segment() checks for KD first.
-        # However, if a word is NOT a KD, but IS a loanword, segment() might still call this.
-        # In such a case, we should return it as is, but without '~' separators.
-        # The task is to identify AFFIXED loanwords. If it's just a loanword,
-        # the existing logic in segment() should handle it (return normalized_word if no affixes found).
-        # So, if we reach here, it means it's not an *affixed* loanword found by this method.
+    def _split_loanword_suffix(self, surface: str) -> Optional[Tuple[str, str]]:
+        """
+        Splits `surface` into a loanword and a suffix, longest suffix first.
 
-        return "" # No loanword affixation pattern found
+        In-memory loanword sets are served from the loanword affix index (see
+        `_get_loanword_affix_index`). Other storages, such as memory-mapped
+        word tables, are probed once per matching suffix instead, so no
+        per-process copy of the loanword list is built.
+
+        Returns:
+            Optional[Tuple[str, str]]: (loanword, suffix), or None.
+        """
+        loanwords = self.dictionary.loanwords_set
+        if isinstance(loanwords, (set, frozenset)):
+            return self._get_loanword_affix_index().get(surface)
+        for suffix_rule in self.rules.match_suffix_rules(surface):
+            suffix_pattern = suffix_rule["original_pattern"]
+            base = surface[:-len(suffix_pattern)]
+            if base and base in loanwords:
+                return base, suffix_pattern.lstrip('-')
+        return None
 
     def _handle_reduplication(self, word: str) -> Tuple[str, str, List[str], Optional[str]]:
         """
@@ -529,30 +983,16 @@ class ModernKataKupas:
 
             # Check for frozen compounds first (these don't use ulg marker)
             # These are compound words that look like reduplication but aren't
-            frozen_compounds = [
-                ("ramah", "tamah"), ("hutan", "belantara"), ("tua", "bangka"),
-                ("gotong", "royong"), ("hiruk", "pikuk"), ("pontang", "panting")
-            ]
-            for base, variant in frozen_compounds:
-                if (part1 == base and part2 == variant) or (part1 == variant and part2 == base):
-                    # Return as compound without ulg marker
-                    return part1, "", [], part2
+            if (part1, part2) in self._frozen_compound_index:
+                # Return as compound without ulg marker
+                return part1, "", [], part2
 
             # Check for Dwilingga Salin Suara (e.g., "bolak-balik", "sayur-mayur")
-            # Pattern: both parts have same length and share phonological similarity
-            # OR check against known pairs
-            for base, variant in self.DWILINGGA_SALIN_SUARA_PAIRS:
-                # Check if part1 matches base or variant
-                if part1 == base or part1 == variant:
-                    # Check if part2 matches the pair
-                    pair = variant if part1 == base else base
-                    if part2 == pair:
-                        # Full match - use ulg marker with variant
-                        return part1, "ulg", [], part2
-                    # Check if part2 starts with the pair (for compound forms with suffix)
-                    elif part2.startswith(pair):
-                        # This could be like sayur-mayurkan (with suffix)
-                        return part1, "ulg", [], part2
+            # against the known pairs. part2 may be the partner itself or the
+            # partner followed by a suffix (e.g., sayur-mayurkan).
+            partners = self._salin_suara_index.get(part1)
+            if partners and any(part2.startswith(partner) for partner in partners):
+                return part1, "ulg", [], part2
 
             # Sub-pattern 2a: Simple X-X (e.g., "rumah-rumah", "main-main")
             if part1 == part2:
@@ -568,11 +1008,10 @@ class ModernKataKupas:
                     return part1, "ulg", [], part2
 
             # Sub-pattern 2b: Stem comparison for forms like PX-X ("bermain-main") or X-PX
-            # This requires the stemmer to be available.
-            # Ensure self.stemmer is initialized before calling this.
+            # Roots come from the configured root finder (Sastrawi or native).
             if hasattr(self, 'stemmer') and self.stemmer:
-                stem1 = self.stemmer.get_root_word(part1)
-                stem2 = self.stemmer.get_root_word(part2)
+                stem1 = self._get_root_word(part1)
+                stem2 = self._get_root_word(part2)
 
                 if stem1 == stem2: # Both parts share the same root (e.g., stem1 is "main")
                     # Case 1: PX-X (e.g., "bermain-main")
@@ -611,97 +1050,175 @@ class ModernKataKupas:
         # Fallback: If no specific hyphenated pattern matched above.
         return word, "", [], None
 
+    def _get_root_word(self, word: str) -> str:
+        """
+        Finds the root of a normalized word with the configured root finder.
+
+        Args:
+            word (str): The normalized word.
+
+        Returns:
+            str: The root word, or `word` itself if no root was found.
+        """
+        if self.root_finder == "native":
+            return self._find_root_native(word)
+        return self.stemmer.get_root_word(word)
+
+    def _find_root_native(self, word: str) -> str:
+        """
+        Finds the root of a normalized word using this segmenter's own prefix
+        and suffix strippers and the lexicon, without the external stemmer.
+
+        Both stripping orders are tried and the better analysis is chosen as
+        in `segment`. Like Sastrawi, the word is returned unchanged if it is a
+        root itself or if no lexicon root is reached.
+
+        Args:
+            word (str): The normalized word.
+
+        Returns:
+            str: The root word, or `word` itself if no root was found.
+        """
+        if self.dictionary.contains_normalized(word):
+            return word
+        s1 = self._apply_strategy(word, prefix_first=True)
+        s2 = self._apply_strategy(word, prefix_first=False, must_beat=s1)
+        stem, _, _ = self._choose_best_strategy(s1, s2, word)
+        return stem if self.dictionary.contains_normalized(stem) else word
+
+    def rebuild_reduplication_indexes(self) -> None:
+        """
+        Rebuilds the hash indexes over `FROZEN_COMPOUNDS` and
+        `DWILINGGA_SALIN_SUARA_PAIRS`.
+
+        Both tables are indexed in both directions, so a hyphenated token is
+        looked up by its first part in constant time regardless of how many
+        pairs are configured. Call this after modifying either table in place.
+        """
+        self._frozen_compound_index: Set[Tuple[str, str]] = set()
+        for base, variant in self.FROZEN_COMPOUNDS:
+            self._frozen_compound_index.add((base, variant))
+            self._frozen_compound_index.add((variant, base))
+
+        partners: Dict[str, List[str]] = {}
+        for base, variant in self.DWILINGGA_SALIN_SUARA_PAIRS:
+            for first, second in ((base, variant), (variant, base)):
+                first_partners = partners.setdefault(first, [])
+                if second not in first_partners:
+                    first_partners.append(second)
+        self._salin_suara_index: Dict[str, Tuple[str, ...]] = {
+            first: tuple(second) for first, second in partners.items()
+        }
+
+    def _get_loanword_affix_index(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Returns the loanword affix index (loanword + suffix surface -> (loanword,
+        suffix)), building it on first use and again whenever the loanword
+        list or the rules object changes.
+
+        With shared resources, instances that still use the registry's
+        loanword list share one index (see `resources.ResourceRegistry`).
+
+        For every loanword and every suffix pattern of the rules, the surface
+        form loanword + suffix is indexed. Where one surface form has several
+        splits, the longest suffix wins, as `match_suffix_rules` orders them.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: Maps each surface form to its loanword
+                and suffix.
+        """
+        dictionary = self.dictionary
+        key = (dictionary, dictionary.generation, self.rules)
+        if self._loanword_affix_index is None or self._loanword_affix_index_key != key:
+            loanwords = dictionary.loanwords_set
+            rules = self.rules
+            if self._registry is not None and loanwords is self._shared_loanwords:
+                # The registered value holds both objects, so their ids cannot be reused while it exists
+                _, _, index = self._registry.get(
+                    "loanword_affix_index", self._shared_index_source, (id(loanwords), id(rules)),
+                    lambda: (loanwords, rules, self._build_loanword_affix_index(loanwords, rules)))
+            else:
+                index = self._build_loanword_affix_index(loanwords, rules)
+            self._loanword_affix_index = index
+            self._loanword_affix_index_key = key
+        return self._loanword_affix_index
+
+    @staticmethod
+    def _build_loanword_affix_index(loanwords: Iterable[str], rules: MorphologicalRules) -> Dict[str, Tuple[str, str]]:
+        """Builds the index returned by `_get_loanword_affix_index`."""
+        index: Dict[str, Tuple[str, str]] = {}
+        for suffix_pattern in sorted(rules.suffix_rules, key=len, reverse=True):
+            suffix = suffix_pattern.lstrip('-')
+            for loanword in loanwords:
+                index.setdefault(loanword + suffix_pattern, (loanword, suffix))
+        return index
+
+    def _get_dwipurwa_index(self) -> Dict[str, str]:
+        """
+        Returns the dwipurwa candidate index (surface form -> root), building
+        it on first use.
+
+        The index holds every entry of `DWIPURWA_WORDS` plus, for each
+        consonant-initial root of the stemmer's lexicon whose second letter is
+        a vowel (or that is a single letter), the CV-reduplicated surface form
+        root[0] + "e" + root (e.g. "tamu" -> "tetamu"), unless that surface
+        form is itself in the lexicon. The stemmer's lexicon is used (not
+        `self.dictionary`) because candidates are confirmed by the stemmer,
+        which can only ever reduce a word to one of its own roots. With shared
+        resources, the index is shared along with the stemmer.
+
+        Returns:
+            Dict[str, str]: Maps each candidate surface form to its root.
+        """
+        if self._dwipurwa_index is None:
+            if self._registry is not None:
+                self._dwipurwa_index = self._registry.get(
+                    "dwipurwa_index", "sastrawi", None, self._build_dwipurwa_index)
+            else:
+                self._dwipurwa_index = self._build_dwipurwa_index()
+        return self._dwipurwa_index
+
+    def _build_dwipurwa_index(self) -> Dict[str, str]:
+        """Builds the index returned by `_get_dwipurwa_index`."""
+        vowels = "aiueo"
+        roots = self.stemmer.get_dictionary_words()
+        index: Dict[str, str] = {}
+        for root in roots:
+            if not root or root[0] in vowels or not root[0].isalpha():
+                continue
+            if len(root) >= 2 and root[1] not in vowels:
+                continue
+            surface = root[0] + "e" + root
+            if surface not in roots:
+                index[surface] = root
+        index.update(DWIPURWA_WORDS)
+        return index
+
     def _handle_dwipurwa(self, word: str) -> Optional[Tuple[str, str, List[str], Optional[str]]]:
         """
         Handles Dwipurwa (Partial Initial Syllable Reduplication) checks for non-hyphenated words.
         e.g. lelaki, sesama, tetamu.
-        
+
+        Detection is a single probe into the candidate index built by
+        `_get_dwipurwa_index`. Listed words (`DWIPURWA_WORDS`) are accepted
+        directly; other candidates are confirmed by checking that the
+        (memoized) stemmer reduces the word to the same root, so that forms
+        the stemmer analyses differently are left to affix stripping.
+
         Args:
             word (str): The word to check.
-            
+
         Returns:
             Optional[Tuple[str, str, List[str], Optional[str]]]:
                 Result tuple if Dwipurwa detected, else None.
         """
-        # Comprehensive Dwipurwa word list with their root forms
-        # Format: word -> (root, marker, suffixes, variant)
-        # Note: Gold standard uses different conventions:
-        # - le-X words use rp marker: lelaki -> laki~rp
-        # - se-X words treated as prefix: sesama -> se~sama (handled differently)
-        # - te-X words use rp marker: tetua -> tua~rp
-
-        dwipurwa_with_rp = {
-            # le- prefix dwipurwa (use rp marker)
-            "lelaki": "laki",
-            "leluhur": "luhur",
-            "lelatu": "latu",
-            "lelap": "lap",
-            "lelah": "lah",
-            "leluasa": "luasa",
-            "lelucon": "lucon",
-            # te- prefix dwipurwa (use rp marker)
-            "tetua": "tua",
-            "tetamu": "tamu",
-            "tetapi": "tapi",
-            # re- prefix dwipurwa
-            "rerata": "rata",
-            # de- prefix dwipurwa
-            "dedaun": "daun",
-            "dedalu": "dalu",
-        }
-
-        if word in dwipurwa_with_rp:
-            return dwipurwa_with_rp[word], "rp", [], None
-
-        # se- prefix words treated as prefix + root (not dwipurwa marker)
-        # These follow gold standard convention: sesama -> se~sama
-        se_prefix_words = {
-            "sesama": "sama",
-            "sesepuh": "sepuh",
-            "sesaji": "saji",
-            "sesak": "sak",
-            "sesal": "sal",
-            "sesap": "sap",
-        }
-        # Note: se- words are handled by returning None here and letting
-        # prefix stripping handle them as se~ prefix
-        # But if stemmer doesn't detect them, we return None to let main flow handle
-
-        # --- Dwipurwa (Partial Initial Syllable Reduplication) Check ---
-        if hasattr(self, 'stemmer') and self.stemmer:
-            root_word = self.stemmer.get_root_word(word)
-            logging.debug(f"_handle_dwipurwa({word}): Dwipurwa check - word='{word}', stemmer_root='{root_word}'")
-
-            # Primary conditions for Dwipurwa
-            prefix_candidate = ""
-            if word.endswith(root_word) and word != root_word:
-                prefix_candidate = word[:-len(root_word)]
-
-                # Heuristic Conditions for Dwipurwa (e.g., lelaki -> laki, sesama -> sama)
-                # A: len(prefix_candidate) == 2
-                # B: len(root_word) >= 1
-                
-                condition_a = (len(prefix_candidate) == 2)
-                condition_b = (len(root_word) >= 1)
-
-                if condition_a and condition_b: # Proceed only if A and B are met
-                    condition_c = (prefix_candidate[0] == root_word[0])
-                    condition_d = (prefix_candidate[1] == 'e')
-
-                    condition_e_met = False
-                    vowels = ['a', 'i', 'u', 'e', 'o']
-                    if len(root_word) >= 2:
-                        if root_word == "laki" and root_word[1].lower() == 'a': # Specific for laki
-                            condition_e_met = True
-                        elif root_word != "laki" and root_word[1].lower() in vowels: # Original for others
-                            condition_e_met = True
-                    elif len(root_word) == 1:
-                        condition_e_met = True 
-
-                    if condition_c and condition_d and condition_e_met:
-                        return root_word, "rp", [], None
-        
-        return None
+        root_word = self._get_dwipurwa_index().get(word)
+        if root_word is None:
+            return None
+        if word not in DWIPURWA_WORDS and self.stemmer.get_root_word(word) != root_word:
+            logging.debug(f"_handle_dwipurwa({word}): candidate '{root_word}' rejected by stemmer")
+            return None
+        return root_word, "rp", [], None
 
     def _strip_suffixes(self, word: str, is_processing_suffix_cluster: bool = False) -> Tuple[str, List[str]]:
         current_word = str(word)
@@ -758,7 +1275,7 @@ class ModernKataKupas:
                         # OR if we are specifically processing a suffix cluster (is_processing_suffix_cluster is True),
                         # where intermediate non-KD steps are expected.
                         if sfx in suffix_types[2]: # Check if suffix is derivational
-                            if not self.dictionary.is_kata_dasar(stem_candidate) and not is_processing_suffix_cluster:
+                            if not self.dictionary.contains_normalized(stem_candidate) and not is_processing_suffix_cluster:
                                 continue # Don't strip if stem is not KD and not in cluster processing mode
                         # --- END MODIFIED CONSERVATIVE CHECK ---
                         
@@ -787,12 +1304,12 @@ class ModernKataKupas:
         vowels = "aiueo"
         vowel_count = sum(1 for char in word if char in vowels)
         # Kasar: jika jumlah vokal = 1 dan ada di kamus ATAU sangat pendek
-        if vowel_count == 1 and (len(word) <= 3 or self.dictionary.is_kata_dasar(word)):
+        if vowel_count == 1 and (len(word) <= 3 or self.dictionary.contains_normalized(word)):
             return True
         # Ini hanya contoh kasar, perlu analisis lebih lanjut atau daftar kata monosilabik.
         # Untuk kasus seperti "tes", "kon" (dari "rekonstruksi"), "bor"
         # Mungkin lebih baik jika aturan "menge-" hanya berlaku jika sisanya adalah kata dasar yang diketahui monosilabik.
-        if self.dictionary.is_kata_dasar(word):
+        if self.dictionary.contains_normalized(word):
             # Jika kata ada di kamus, baru cek suku katanya (logika bisa rumit)
             # Untuk sekarang, kita asumsikan jika kata ada di kamus dan jumlah vokal=1, itu monosilabik.
              return vowel_count == 1
@@ -808,86 +1325,72 @@ class ModernKataKupas:
 
         # Check if the original word itself is a KD, if so, no prefixes to strip.
         # This is a guard, primary KD check is at the start of segment()
-        if self.dictionary.is_kata_dasar(current_word):
+        if self.dictionary.contains_normalized(current_word):
             return current_word, []
 
         return self._strip_prefixes_detailed(current_word, [])
 
     def _strip_prefixes_detailed(self, word_to_strip: str, accumulated_prefixes: List[str]) -> Tuple[str, List[str]]:
         """
-        Implementasi rekursif (atau iteratif yang dimodelkan secara rekursif) untuk pelepasan prefiks.
-        """
-        # Base case: Jika kata sudah menjadi kata dasar, kembalikan apa adanya.
-        if self.dictionary.is_kata_dasar(word_to_strip):
-            return word_to_strip, accumulated_prefixes
-
-        # Optimization: If word is too short to have prefixes and a meaningful stem
-        if len(word_to_strip) < 3: # e.g., "di", "ku" - too short for prefix + stem_min_1
-            return word_to_strip, accumulated_prefixes
-
-        # Check all known prefixes from longest to shortest to prefer maximal munch for prefixes
-        # This helps with layered prefixes like "memper-"
-        sorted_prefixes = sorted(self.rules.get_all_prefix_forms(), key=len, reverse=True)
-
-        for prefix_form in sorted_prefixes:
-            if word_to_strip.startswith(prefix_form):
-                stem_candidate = word_to_strip[len(prefix_form):]
-
-                if not stem_candidate: # Stripping prefix left nothing
-                    continue
-
-                canonical_prefix = self.rules.get_canonical_prefix_form(prefix_form)
-                if not canonical_prefix: 
-                    continue
-
-                # Option 1 (Swapped): If reversing morphophonemics on stem_candidate yields a KD
-                potential_original_stem = self.rules.reverse_morphophonemics(prefix_form, canonical_prefix, stem_candidate)
-                if potential_original_stem != stem_candidate and self.dictionary.is_kata_dasar(potential_original_stem):
-                    new_prefixes = accumulated_prefixes + [canonical_prefix]
-                    logging.debug(f"_strip_prefixes_detailed: '{prefix_form}' (canon: {canonical_prefix}) stripped from '{word_to_strip}', reverse_morpho to '{potential_original_stem}' (KD). Finalizing.")
-                    return potential_original_stem, new_prefixes
-
-                # Option 2 (Swapped): If stem_candidate is directly a KD
-                if self.dictionary.is_kata_dasar(stem_candidate):
-                    new_prefixes = accumulated_prefixes + [canonical_prefix]
-                    logging.debug(f"_strip_prefixes_detailed: '{prefix_form}' stripped from '{word_to_strip}', '{stem_candidate}' is KD. Finalizing.")
-                    return stem_candidate, new_prefixes
-
-                # Option 3: Recursively strip from stem_candidate (the surface form after stripping prefix_form)
-                # This handles layered prefixes (e.g., di-per-oleh, mem-per-mainkan)
-                logging.debug(f"_strip_prefixes_detailed: '{prefix_form}' stripped from '{word_to_strip}', stem_candidate '{stem_candidate}' is not KD. Recursing.")
-                further_stripped_stem, deeper_prefixes = self._strip_prefixes_detailed(stem_candidate, []) 
-                
-                # If the recursive call found a KD OR found more prefixes, then this path is valid.
-                if self.dictionary.is_kata_dasar(further_stripped_stem) or deeper_prefixes:
-                    current_prefixes = accumulated_prefixes + [canonical_prefix] + deeper_prefixes
-                    logging.debug(f"_strip_prefixes_detailed: Recursive call from '{stem_candidate}' yielded KD '{further_stripped_stem}' or deeper_prefixes {deeper_prefixes}. Prefixes so far: {current_prefixes}")
-                    return further_stripped_stem, current_prefixes
-                
-                # Option 4: (NEW FALLBACK FOR CONFIDENCE) If no KD was found via options 1, 2, or 3,
-                # but a prefix was indeed stripped, consider this a valid partial strip.
-                # This allows the main `segment` function's S1 strategy (prefix then suffix)
-                # to attempt suffix stripping on this `stem_candidate`.
-                # We only do this if this is the first prefix being stripped in this call chain (accumulated_prefixes is empty)
-                # to avoid overly greedy behavior in deep recursion, or if no other prefix choice worked out from the loop.
-                # For now, let's be more direct: if a prefix matched, and recursion didn't improve, take the current strip.
-                # This path is taken if this `prefix_form` was the first one in `sorted_prefixes` that matched.
-                # The loop will try other (shorter) prefixes if this path isn't taken.
-                # The crucial change is to allow returning a non-KD stem if a prefix is found.
-                
-                # If we are here, it means: 
-                # 1. stem_candidate is not KD
-                # 2. potential_original_stem is not KD (or same as stem_candidate)
-                # 3. recursion on stem_candidate did not yield a KD and found no further prefixes.
-                # In this case, we accept the current prefix strip and return the non-KD stem.
-                # This allows the S1 strategy in segment() to try suffix stripping later.
-                new_prefixes = accumulated_prefixes + [canonical_prefix]
-                logging.debug(f"_strip_prefixes_detailed: '{prefix_form}' stripped from '{word_to_strip}', stem_candidate '{stem_candidate}' is not KD, but accepting prefix strip. Prefixes: {new_prefixes}")
-                return stem_candidate, new_prefixes
-
-        # If no prefix could be stripped at all from word_to_strip
-        logging.debug(f"_strip_prefixes_detailed: No prefix stripped from '{word_to_strip}' or no valid stem found after stripping. Returning as is.")
-        return word_to_strip, accumulated_prefixes
+        Pelepasan prefiks berlapis secara iteratif, dengan anggaran kerja per panggilan.
+
+        At every step the longest prefix form with a non-empty remainder is
+        stripped (maximal munch). Stripping stops at the first known root
+        word, either the remainder itself or the remainder with the elided
+        initial restored (e.g. "mem" + "ukul" -> "pukul"). If no known root is
+        reached, the prefixes stripped so far are kept and the remaining
+        non-root stem is returned, so the prefix-first strategy can still try
+        suffix stripping on it.
+
+        Every step consumes at least one character, so the work is linear in
+        the length of the word. In addition, at most `prefix_strip_budget`
+        prefixes are stripped per call; when the budget runs out, stripping
+        stops where it is and the "prefix_budget_hits" stage counter is
+        incremented (see `get_stage_stats`).
+
+        Args:
+            word_to_strip: The (normalized) word to strip.
+            accumulated_prefixes: Prefixes already stripped by the caller.
+
+        Returns:
+            Tuple of (stem, prefixes), prefixes outermost first.
+        """
+        current_word = word_to_strip
+        prefixes = list(accumulated_prefixes)
+        steps = 0
+        while True:
+            # Berhenti jika sudah menjadi kata dasar, atau terlalu pendek untuk prefiks + stem
+            if self.dictionary.contains_normalized(current_word) or len(current_word) < 3:
+                return current_word, prefixes
+
+            # Longest prefix form that leaves something behind
+            prefix_match = next(
+                (match for match in self.rules.match_prefixes(current_word)
+                 if len(match.surface) < len(current_word)),
+                None
+            )
+            if prefix_match is None:
+                logging.debug(f"_strip_prefixes_detailed: No prefix stripped from '{current_word}'. Returning as is.")
+                return current_word, prefixes
+
+            if steps >= self.prefix_strip_budget:
+                logging.debug(f"_strip_prefixes_detailed: Budget of {self.prefix_strip_budget} prefixes exhausted on '{word_to_strip}'. Stopping at '{current_word}'.")
+                self._count_stage("prefix_budget_hits")
+                return current_word, prefixes
+            steps += 1
+
+            stem_candidate = current_word[len(prefix_match.surface):]
+            prefixes.append(prefix_match.canonical)
+
+            # The elided initial comes precompiled with the match (e.g. "mem" + "ukul" -> "pukul")
+            if prefix_match.restore_initial and self.enable_morphophonemic_rules:
+                potential_original_stem = prefix_match.restore_initial + stem_candidate
+                if self.dictionary.contains_normalized(potential_original_stem):
+                    logging.debug(f"_strip_prefixes_detailed: '{prefix_match.surface}' (canon: {prefix_match.canonical}) stripped from '{current_word}', reverse_morpho to '{potential_original_stem}' (KD). Finalizing.")
+                    return potential_original_stem, prefixes
+
+            logging.debug(f"_strip_prefixes_detailed: '{prefix_match.surface}' stripped from '{current_word}', continuing with '{stem_candidate}'. Prefixes: {prefixes}")
+            current_word = stem_candidate
 
 # Example usage (can be removed or commented out later)
 if __name__ == '__main__':
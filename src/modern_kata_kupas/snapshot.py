@@ -0,0 +1,247 @@
+# src/modern_kata_kupas/snapshot.py
+"""
+Modul snapshot sumber daya terkompilasi (kamus, kata serapan, aturan, konfigurasi) untuk start-up cepat.
+"""
+import hashlib
+import importlib.resources
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .config_loader import ConfigLoader, resolve_config_source
+from .dictionary_manager import DictionaryManager
+from .rules import DEFAULT_RULES_FILENAME, MorphologicalRules
+
+# Bumped whenever the snapshot layout changes; older snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAGIC = b"MKKSNAP\n"
+DATA_PACKAGE = "modern_kata_kupas.data"
+
+
+@dataclass
+class Snapshot:
+    """The loaded resources of a compiled snapshot."""
+    config: ConfigLoader
+    dictionary: DictionaryManager
+    rules: MorphologicalRules
+    sources: Dict[str, str]  # source name -> SHA-256 of its content
+
+
+def _read_source(path: Optional[str], packaged_filename: str, loader: Optional[Callable[[str], Any]] = None) -> bytes:
+    """
+    Returns the content of `path`, or of the packaged data file if `path` is None.
+
+    If `path` cannot be read, `loader(path)` is called first so that the
+    error is the one the resource's own loader raises for that path (e.g.
+    `DictionaryFileNotFoundError`), not a bare `OSError`.
+    """
+    if path:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            if loader is not None:
+                loader(path)
+            raise
+    try:
+        if hasattr(importlib.resources, 'files'):
+            return importlib.resources.files(DATA_PACKAGE).joinpath(packaged_filename).read_bytes()
+        return importlib.resources.read_binary(DATA_PACKAGE, packaged_filename) # Python 3.8 fallback
+    except (FileNotFoundError, ModuleNotFoundError):
+        return b""
+
+
+def source_fingerprints(dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None,
+                        config_path: Optional[str] = None) -> Dict[str, str]:
+    """
+    Hashes the source files a `ModernKataKupas` with these arguments is built from.
+
+    Args:
+        dictionary_path (str, optional): Custom root word dictionary.
+        rules_file_path (str, optional): Custom rules JSON file.
+        config_path (str, optional): Custom config file or profile name.
+
+    Returns:
+        dict[str, str]: "dictionary", "loanwords", "rules" and "config" ->
+            SHA-256 hex digest of the file content (of the packaged file
+            where no path is given).
+
+    Raises:
+        DictionaryFileNotFoundError: If `dictionary_path` is not a file.
+        DictionaryLoadingError: If `dictionary_path` cannot be read.
+        FileNotFoundError: If `rules_file_path` does not exist.
+        RuleError: If `rules_file_path` cannot be read.
+    """
+    config_file, packaged_config = resolve_config_source(config_path)
+    sources = {
+        "dictionary": _read_source(dictionary_path, DictionaryManager.DEFAULT_DICT_FILENAME,
+                                   lambda path: DictionaryManager(dictionary_path=path)),
+        "loanwords": _read_source(None, DictionaryManager.DEFAULT_LOANWORD_FILENAME),
+        "rules": _read_source(rules_file_path, DEFAULT_RULES_FILENAME,
+                              lambda path: MorphologicalRules(rules_file_path=path)),
+        "config": (_read_source(config_file, packaged_config[0]) if config_file
+                   else b"\0".join(_read_source(None, filename) for filename in packaged_config)),
+    }
+    return {name: hashlib.sha256(content).hexdigest() for name, content in sources.items()}
+
+
+def _library_version() -> str:
+    from . import __version__
+    return __version__
+
+
+def _load_sources(dictionary_path: Optional[str], rules_file_path: Optional[str],
+                  config_path: Optional[str], sources: Optional[Dict[str, str]] = None) -> Snapshot:
+    """Loads the resources from their source files, as `ModernKataKupas` does without a snapshot."""
+    if sources is None:
+        sources = source_fingerprints(dictionary_path, rules_file_path, config_path)
+    return Snapshot(
+        config=ConfigLoader(config_path=config_path),
+        dictionary=DictionaryManager(dictionary_path=dictionary_path),
+        rules=MorphologicalRules(rules_file_path=rules_file_path),
+        sources=sources,
+    )
+
+
+def write_snapshot(path: str, snapshot: Snapshot) -> None:
+    """
+    Writes loaded resources as a snapshot file.
+
+    The file starts with a JSON header holding the snapshot format version,
+    the library version, the source fingerprints and the SHA-256 of the
+    payload; the payload is JSON with the normalized root words and
+    loanwords, the parsed rules and the parsed configuration. The file is
+    written atomically (temporary file + rename).
+
+    Args:
+        path (str): Destination file.
+        snapshot (Snapshot): The resources to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    payload = json.dumps({
+        "kata_dasar": sorted(snapshot.dictionary.kata_dasar_set),
+        "loanwords": sorted(snapshot.dictionary.loanwords_set),
+        "rules": snapshot.rules.all_rules,
+        "config": snapshot.config.config,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = json.dumps({
+        "version": SNAPSHOT_VERSION,
+        "library_version": _library_version(),
+        "sources": snapshot.sources,
+        "payload_sha256": hashlib.sha256(payload).hexdigest(),
+    }, sort_keys=True).encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".mkk-snapshot-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(SNAPSHOT_MAGIC + header + b"\n" + payload)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def compile_snapshot(path: str, dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None,
+                     config_path: Optional[str] = None) -> Snapshot:
+    """
+    Loads the resources from their source files and writes them as a snapshot.
+
+    Args:
+        path (str): Destination file.
+        dictionary_path (str, optional): Custom root word dictionary.
+        rules_file_path (str, optional): Custom rules JSON file.
+        config_path (str, optional): Custom config file or profile name.
+
+    Returns:
+        Snapshot: The loaded resources.
+
+    Raises:
+        OSError: If the snapshot cannot be written.
+    """
+    snapshot = _load_sources(dictionary_path, rules_file_path, config_path)
+    write_snapshot(path, snapshot)
+    return snapshot
+
+
+def read_snapshot(path: str, expected_sources: Optional[Dict[str, str]] = None) -> Snapshot:
+    """
+    Loads a snapshot written by `compile_snapshot`, without reading the source files.
+
+    Args:
+        path (str): The snapshot file.
+        expected_sources (dict[str, str], optional): Source fingerprints (see
+            `source_fingerprints`) the snapshot must have been compiled from.
+
+    Returns:
+        Snapshot: The loaded resources.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a snapshot, was written by another
+            format or library version, is corrupt (checksum mismatch) or is
+            stale (its sources differ from `expected_sources`).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError(f"{path} is not a ModernKataKupas snapshot")
+    header_end = data.find(b"\n", len(SNAPSHOT_MAGIC))
+    if header_end < 0:
+        raise ValueError(f"Snapshot {path} is truncated")
+    header: Dict[str, Any] = json.loads(data[len(SNAPSHOT_MAGIC):header_end])
+    if header.get("version") != SNAPSHOT_VERSION or header.get("library_version") != _library_version():
+        raise ValueError(f"Snapshot {path} was compiled by another version")
+    if expected_sources is not None and header.get("sources") != expected_sources:
+        raise ValueError(f"Snapshot {path} is stale: its source files have changed")
+    payload = data[header_end + 1:]
+    if hashlib.sha256(payload).hexdigest() != header.get("payload_sha256"):
+        raise ValueError(f"Snapshot {path} is corrupt: checksum mismatch")
+
+    content = json.loads(payload)
+    return Snapshot(
+        config=ConfigLoader.from_dict(content["config"]),
+        dictionary=DictionaryManager.from_normalized_words(content["kata_dasar"], content["loanwords"]),
+        rules=MorphologicalRules.from_rules_data(content["rules"]),
+        sources=header["sources"],
+    )
+
+
+def load_snapshot(path: str, dictionary_path: Optional[str] = None, rules_file_path: Optional[str] = None,
+                  config_path: Optional[str] = None) -> Snapshot:
+    """
+    Loads the snapshot at `path`, recompiling it if it is missing, stale or invalid.
+
+    The source files are hashed on every call (cheap compared to parsing
+    them); if any hash differs from the one recorded in the snapshot, the
+    resources are loaded from the sources and the snapshot is rewritten.
+    If it cannot be rewritten (e.g. a read-only location), the freshly
+    loaded resources are still returned.
+
+    Args:
+        path (str): The snapshot file.
+        dictionary_path (str, optional): Custom root word dictionary.
+        rules_file_path (str, optional): Custom rules JSON file.
+        config_path (str, optional): Custom config file or profile name.
+
+    Returns:
+        Snapshot: The loaded resources.
+    """
+    sources = source_fingerprints(dictionary_path, rules_file_path, config_path)
+    try:
+        return read_snapshot(path, expected_sources=sources)
+    except FileNotFoundError:
+        logging.info(f"Snapshot {path} not found, compiling it")
+    except (OSError, ValueError, KeyError) as e:
+        logging.info(f"Recompiling snapshot: {e}")
+    snapshot = _load_sources(dictionary_path, rules_file_path, config_path, sources)
+    try:
+        write_snapshot(path, snapshot)
+    except OSError as e:
+        logging.warning(f"Could not write snapshot {path}: {e}")
+    return snapshot
@@ -1,5 +1,39 @@
 # src/modern_kata_kupas/stemmer_interface.py
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+from typing import Any, Dict, FrozenSet, Optional
+
+from .utils.lru_cache import LRUCache
+
+DEFAULT_STEMMER_CACHE_SIZE = 50000
+
+
+class SastrawiBackend:
+    """
+    The PySastrawi stemmer and its root word list, built lazily.
+
+    Holds no per-caller state, so one backend can serve several
+    `IndonesianStemmer` instances (see `resources.ResourceRegistry`).
+    """
+    def __init__(self) -> None:
+        self.stemmer: Optional[Any] = None
+        self._dictionary_words: Optional[FrozenSet[str]] = None
+
+    def get_stemmer(self) -> Any:
+        """Builds the Sastrawi stemmer on first use."""
+        if self.stemmer is None:
+            from Sastrawi.Dictionary.ArrayDictionary import ArrayDictionary
+            from Sastrawi.Stemmer.Stemmer import Stemmer
+            # Same dictionary as StemmerFactory.create_stemmer(), without its
+            # unbounded CachedStemmer layer; memoization happens in IndonesianStemmer.cache.
+            self.stemmer = Stemmer(ArrayDictionary(list(self.get_dictionary_words())))
+        return self.stemmer
+
+    def get_dictionary_words(self) -> FrozenSet[str]:
+        """Loads Sastrawi's bundled root word list on first use."""
+        if self._dictionary_words is None:
+            from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+            self._dictionary_words = frozenset(StemmerFactory().get_words())
+        return self._dictionary_words
+
 
 class IndonesianStemmer:
     """
@@ -9,15 +43,50 @@ class IndonesianStemmer:
     encapsulating its initialization and usage. It is used to obtain the root
     form of Indonesian words.
 
+    The Sastrawi stemmer is imported and built lazily, on the first call to
+    `get_root_word`, so instances that never stem cost nothing. Results are
+    memoized in a bounded LRU cache keyed on the input word; Sastrawi's own
+    unbounded result cache is bypassed.
+
     Attributes:
-        _stemmer: An instance of the Sastrawi stemmer.
+        backend (SastrawiBackend): The Sastrawi stemmer, possibly shared with
+            other instances.
+        cache (LRUCache): Memoized `get_root_word` results (per instance).
     """
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_STEMMER_CACHE_SIZE, backend: Optional[SastrawiBackend] = None):
+        """
+        Initializes the IndonesianStemmer. The Sastrawi stemmer itself is
+        created on first use.
+
+        Args:
+            cache_size (int, optional): Maximum number of memoized results.
+                0 disables memoization. Defaults to 50000.
+            backend (SastrawiBackend, optional): A backend to share with
+                other instances. Defaults to a new, private backend.
+        """
+        self.backend = backend if backend is not None else SastrawiBackend()
+        self.cache = LRUCache(cache_size)
+
+    def _get_stemmer(self) -> Any:
+        """Builds the Sastrawi stemmer on first use."""
+        return self.backend.get_stemmer()
+
+    def get_dictionary_words(self) -> FrozenSet[str]:
         """
-        Initializes the IndonesianStemmer by creating an instance of the Sastrawi stemmer.
+        Returns the root words known to the Sastrawi stemmer.
+
+        The stemmer only ever reduces a word to one of these roots (or leaves
+        it unchanged). Loaded on first use without building the stemmer.
+
+        Returns:
+            FrozenSet[str]: Sastrawi's bundled root word list.
         """
-        factory = StemmerFactory()
-        self._stemmer = factory.create_stemmer()
+        return self.backend.get_dictionary_words()
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the Sastrawi stemmer has been built."""
+        return self.backend.stemmer is not None
 
     def get_root_word(self, word: str) -> str:
         """
@@ -29,6 +98,17 @@ class IndonesianStemmer:
         Returns:
             str: The root word (kata dasar).
         """
-        if self._stemmer:
-            return str(self._stemmer.stem(word))
-        return word
\ No newline at end of file
+        root: Optional[str] = self.cache.get(word)
+        if root is None:
+            root = str(self._get_stemmer().stem(word))
+            self.cache.put(word, root)
+        return root
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss statistics of the result cache.
+
+        Returns:
+            dict[str, Any]: See `LRUCache.stats`.
+        """
+        return self.cache.stats()
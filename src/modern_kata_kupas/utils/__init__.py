@@ -4,9 +4,11 @@ Package initialization for utils module.
 """
 
 from .string_utils import is_vowel, is_consonant # normalize_word removed
+from .lru_cache import LRUCache
 
 __all__ = [
     # "normalize_word", # Removed
     "is_vowel",
-    "is_consonant"
+    "is_consonant",
+    "LRUCache",
 ]
\ No newline at end of file
@@ -0,0 +1,114 @@
+# src/modern_kata_kupas/utils/lru_cache.py
+"""
+Size-bounded LRU cache used to memoize hot lookups in ModernKataKupas.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A least-recently-used cache with a fixed maximum number of entries.
+
+    Besides plain get/put access, the cache keeps hit, miss and eviction
+    counters so callers can judge how effective memoization is on their data.
+    A `maxsize` of 0 (or less) disables the cache: every lookup is a miss and
+    nothing is stored.
+
+    The cache is not thread-safe; each `ModernKataKupas` instance owns its own.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept before the least
+            recently used entry is evicted.
+        hits (int): Number of lookups that found an entry.
+        misses (int): Number of lookups that did not find an entry.
+        evictions (int): Number of entries dropped because the cache was full.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Values <= 0
+                disable the cache. Defaults to 1024.
+        """
+        self.maxsize = max(0, int(maxsize))
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Looks up `key` and marks it as most recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any, optional): Value returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or `default` if `key` is not cached.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key`, evicting the least recently used entry
+        if the cache is full.
+
+        Args:
+            key (Hashable): The key to store.
+            value (Any): The value to associate with `key`.
+        """
+        if self.maxsize <= 0:
+            return
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries. Counters are kept; see `reset_stats`."""
+        self._data.clear()
+
+    def reset_stats(self) -> None:
+        """Resets the hit, miss and eviction counters to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            dict[str, Any]: Keys `hits`, `misses`, `evictions`, `size`,
+                `maxsize` and `hit_rate` (hits / lookups, 0.0 if there were
+                no lookups yet).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,479 @@
+# src/modern_kata_kupas/word_graph.py
+"""
+Modul graf kata (DAWG, automaton asiklik minimal) yang ringkas untuk daftar kata berukuran jutaan entri.
+"""
+import operator
+import os
+import sys
+import tempfile
+from array import array
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, MutableSet, Optional, Set, Tuple
+
+from .word_table import common_prefix_length
+
+WORD_GRAPH_MAGIC = b"MKKDAWG1"
+# Header after the magic: uint32 word count, then per graph (forward, reversed)
+# uint32 state count, uint32 edge count, uint32 label byte length
+_HEADER_FIELDS = 7
+
+
+class _Node:
+    """A mutable automaton state, only used while building."""
+    __slots__ = ("edges", "final", "id")
+
+    def __init__(self) -> None:
+        self.edges: Dict[str, "_Node"] = {}
+        self.final = False
+        self.id = -1
+
+
+class _Graph:
+    """
+    A frozen minimal acyclic automaton in flat arrays.
+
+    The outgoing edges of state `s` are `first[s]` to `first[s + 1]`
+    (exclusive), sorted by label; `labels` holds one character per edge and
+    `targets` the state each edge leads to. State 0 is the start state.
+    """
+    __slots__ = ("first", "labels", "targets", "final")
+
+    def __init__(self, first: "array[int]", labels: str, targets: "array[int]", final: bytes):
+        self.first = first
+        self.labels = labels
+        self.targets = targets
+        self.final = final
+
+    @classmethod
+    def build(cls, sorted_words: Iterable[str]) -> "_Graph":
+        """
+        Builds the minimal automaton of distinct words given in code point order.
+
+        Uses the incremental construction of Daciuk et al. (2000) for sorted
+        input: the path of the previous word below the common prefix with
+        the next word can no longer change, so its states are merged with
+        equivalent states already seen (same finality, same edges) right
+        away. Only the minimal automaton and one word's path are in memory.
+        """
+        root = _Node()
+        register: Dict[Tuple[bool, Tuple[Tuple[str, int], ...]], _Node] = {}
+        unchecked: List[Tuple[_Node, str, _Node]] = []
+        previous = ""
+
+        def minimize(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, label, child = unchecked.pop()
+                key = (child.final, tuple(sorted((ch, node.id) for ch, node in child.edges.items())))
+                existing = register.get(key)
+                if existing is not None:
+                    parent.edges[label] = existing
+                else:
+                    child.id = len(register)
+                    register[key] = child
+
+        for word in sorted_words:
+            if word <= previous:
+                if word == previous:
+                    continue
+                raise ValueError("Words must be given in sorted order")
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for ch in word[common:]:
+                child = _Node()
+                node.edges[ch] = child
+                unchecked.append((node, ch, child))
+                node = child
+            node.final = True
+            previous = word
+        minimize(0)
+
+        # Number the states breadth-first from the root and flatten the edges
+        numbers = {id(root): 0}
+        order = [root]
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for child in node.edges.values():
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(order)
+                    order.append(child)
+                    queue.append(child)
+        first = array("I", [0])
+        targets = array("I")
+        labels: List[str] = []
+        final = bytearray(len(order))
+        for number, node in enumerate(order):
+            for ch in sorted(node.edges):
+                labels.append(ch)
+                targets.append(numbers[id(node.edges[ch])])
+            first.append(len(targets))
+            final[number] = node.final
+        return cls(first, "".join(labels), targets, bytes(final))
+
+    def walk(self, text: str) -> int:
+        """Returns the state reached by reading `text` from the start state, or -1."""
+        first = self.first
+        labels = self.labels
+        targets = self.targets
+        state = 0
+        for ch in text:
+            edge = labels.find(ch, first[state], first[state + 1])
+            if edge < 0:
+                return -1
+            state = targets[edge]
+        return state
+
+    def walk_length(self, text: str) -> int:
+        """Returns how many leading characters of `text` can be read from the start state."""
+        first = self.first
+        labels = self.labels
+        targets = self.targets
+        state = 0
+        for length, ch in enumerate(text):
+            edge = labels.find(ch, first[state], first[state + 1])
+            if edge < 0:
+                return length
+            state = targets[edge]
+        return len(text)
+
+    def iter_from(self, state: int, prefix: str) -> Iterator[str]:
+        """Yields `prefix` + every completion accepted from `state`, in code point order."""
+        first = self.first
+        labels = self.labels
+        targets = self.targets
+        final = self.final
+        stack = [(state, prefix)]
+        while stack:
+            state, text = stack.pop()
+            if final[state]:
+                yield text
+            for edge in range(first[state + 1] - 1, first[state] - 1, -1):
+                stack.append((targets[edge], text + labels[edge]))
+
+    @property
+    def state_count(self) -> int:
+        return len(self.final)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays (excluding object headers)."""
+        label_width = 1 if all(ord(ch) < 256 for ch in self.labels) else 4
+        return (self.first.itemsize * len(self.first) + self.targets.itemsize * len(self.targets)
+                + len(self.final) + label_width * len(self.labels))
+
+
+def _uint32_array(data: bytes) -> "array[int]":
+    """Reads little-endian uint32 values."""
+    values = array("I")
+    if values.itemsize != 4:  # pragma: no cover - no common platform has another size
+        values = array("L")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _uint32_bytes(values: "array[int]") -> bytes:
+    """Writes uint32 values little-endian."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class WordGraph(MutableSet[str]):
+    """
+    A set of words stored as a minimal acyclic automaton (DAWG).
+
+    Words sharing a prefix share the states that spell it and words sharing
+    a suffix share the states after it, so large word lists with regular
+    morphology take a small fraction of the memory of a Python set of
+    strings: the automaton lives in a few flat arrays and no Python object
+    is kept per word. Membership follows one edge per character, so a probe
+    costs O(len(word)) instead of a hash lookup.
+
+    Besides membership, the graph answers prefix queries (`has_prefix`,
+    `iter_prefix`: "does any word start with X?") and, through an automaton
+    of the reversed words, suffix queries (`has_suffix`, `iter_suffix`).
+    The reversed automaton is stored in files written by `save`; for
+    graphs built in memory it is built on the first suffix query.
+
+    The stored words are read-only: words added at runtime (e.g. through
+    `DictionaryManager.add_word`) go to a small in-memory overlay. Iteration
+    yields the stored words in sorted order, followed by the overlay.
+
+    Example:
+        >>> words = WordGraph(["makan", "makanan", "minum"])
+        >>> "makan" in words, words.has_prefix("mak"), words.has_prefix("mal")
+        (True, True, False)
+        >>> list(words.iter_suffix("an"))
+        ['makan', 'makanan']
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        """
+        Builds the automaton of `words`.
+
+        Args:
+            words (Iterable[str]): Normalized words; duplicates and empty
+                strings are dropped.
+        """
+        distinct = sorted({word for word in words if word})
+        self._graph = _Graph.build(distinct)
+        self._reverse: Optional[_Graph] = None
+        self._count = len(distinct)
+        self.path: Optional[str] = None
+        self._added: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    def _reversed_graph(self) -> _Graph:
+        if self._reverse is None:
+            self._reverse = _Graph.build(sorted(word[::-1] for word in self._graph.iter_from(0, "")))
+        return self._reverse
+
+    @property
+    def stored_count(self) -> int:
+        """Number of words stored in the automaton."""
+        return self._count
+
+    @property
+    def state_count(self) -> int:
+        """Number of states of the (forward) automaton."""
+        return self._graph.state_count
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the automata arrays, in bytes."""
+        total = self._graph.nbytes()
+        if self._reverse is not None:
+            total += self._reverse.nbytes()
+        return total
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        if self._added or self._removed:
+            if word in self._added:
+                return True
+            if word in self._removed:
+                return False
+        graph = self._graph
+        state = graph.walk(word)
+        return state >= 0 and bool(graph.final[state])
+
+    def __iter__(self) -> Iterator[str]:
+        removed = self._removed
+        for word in self._graph.iter_from(0, ""):
+            if word not in removed:
+                yield word
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return self._count - len(self._removed) + len(self._added)
+
+    def _stored(self, word: str) -> bool:
+        state = self._graph.walk(word)
+        return state >= 0 and bool(self._graph.final[state])
+
+    def add(self, word: str) -> None:
+        """Adds a word to the in-memory overlay (the automaton is not modified)."""
+        if word in self._removed:
+            self._removed.discard(word)
+        elif not self._stored(word):
+            self._added.add(word)
+
+    def discard(self, word: str) -> None:
+        """Removes a word from this instance's view (the automaton is not modified)."""
+        if word in self._added:
+            self._added.discard(word)
+        elif self._stored(word):
+            self._removed.add(word)
+
+    def copy(self) -> "WordGraph":
+        """Returns a graph sharing this one's (read-only) automata, with a copy of the runtime overlay."""
+        words = self.__class__.__new__(self.__class__)
+        words._graph = self._graph
+        words._reverse = self._reverse
+        words._count = self._count
+        words.path = self.path
+        words._added = set(self._added)
+        words._removed = set(self._removed)
+        return words
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Yields the words starting with `prefix`.
+
+        Stored words come first, in sorted order, followed by matching words
+        of the overlay.
+
+        Args:
+            prefix (str): A normalized prefix ("" yields every word).
+
+        Returns:
+            Iterator[str]: The matching words.
+        """
+        state = self._graph.walk(prefix)
+        if state >= 0:
+            removed = self._removed
+            for word in self._graph.iter_from(state, prefix):
+                if word not in removed:
+                    yield word
+        yield from [word for word in self._added if word.startswith(prefix)]
+
+    def prefix_length(self, text: str) -> int:
+        """
+        Returns the length of the longest prefix of `text` that some word starts with.
+
+        Args:
+            text (str): The text to match.
+
+        Returns:
+            int: A length between 0 and `len(text)`.
+        """
+        length = self._graph.walk_length(text)
+        if self._removed:
+            removed = self._removed
+            while length and all(word in removed for word in self._graph.iter_from(
+                    self._graph.walk(text[:length]), text[:length])):
+                length -= 1
+        for word in self._added:
+            length = max(length, common_prefix_length(word, text))
+        return length
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Returns True if any word starts with `prefix` (a word equal to it included)."""
+        if not self._removed:
+            if self._graph.walk(prefix) >= 0:
+                return True
+            return any(word.startswith(prefix) for word in self._added)
+        return next(self.iter_prefix(prefix), None) is not None
+
+    def iter_suffix(self, suffix: str) -> Iterator[str]:
+        """
+        Yields the words ending with `suffix`.
+
+        Stored words come first, ordered by their reversed spelling (so
+        words sharing a longer ending are grouped together), followed by
+        matching words of the overlay.
+
+        Args:
+            suffix (str): A normalized suffix ("" yields every word).
+
+        Returns:
+            Iterator[str]: The matching words.
+        """
+        reverse = self._reversed_graph()
+        reversed_suffix = suffix[::-1]
+        state = reverse.walk(reversed_suffix)
+        if state >= 0:
+            removed = self._removed
+            for reversed_word in reverse.iter_from(state, reversed_suffix):
+                word = reversed_word[::-1]
+                if word not in removed:
+                    yield word
+        yield from [word for word in self._added if word.endswith(suffix)]
+
+    def has_suffix(self, suffix: str) -> bool:
+        """Returns True if any word ends with `suffix` (a word equal to it included)."""
+        if not self._removed:
+            if self._reversed_graph().walk(suffix[::-1]) >= 0:
+                return True
+            return any(word.endswith(suffix) for word in self._added)
+        return next(self.iter_suffix(suffix), None) is not None
+
+    def save(self, path: str) -> None:
+        """
+        Writes the stored words (not the overlay) as a word graph file.
+
+        Layout, after the magic: uint32 word count, then for the forward and
+        the reversed automaton its state count, edge count and label byte
+        length; then, per automaton, `states + 1` uint32 first-edge offsets,
+        `edges` uint32 edge targets, one final flag byte per state and the
+        UTF-8 encoded edge labels. All integers are little-endian. The file
+        is written atomically.
+
+        Args:
+            path (str): Destination file.
+        """
+        graphs = (self._graph, self._reversed_graph())
+        encoded = [graph.labels.encode("utf-8") for graph in graphs]
+        header = array("I", [self._count])
+        for graph, labels in zip(graphs, encoded):
+            header.extend([graph.state_count, graph.edge_count, len(labels)])
+
+        fd, tmp_path = tempfile.mkstemp(prefix=".mkk-graph-", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(WORD_GRAPH_MAGIC + _uint32_bytes(header))
+                for graph, labels in zip(graphs, encoded):
+                    f.write(_uint32_bytes(graph.first))
+                    f.write(_uint32_bytes(graph.targets))
+                    f.write(graph.final)
+                    f.write(labels)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "WordGraph":
+        """
+        Loads a word graph file written by `save`.
+
+        Args:
+            path (str): The word graph file.
+
+        Returns:
+            WordGraph: The stored words, with an empty overlay.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a word graph, is truncated or is
+                corrupt (edge offsets or targets out of range).
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        header_end = len(WORD_GRAPH_MAGIC) + 4 * _HEADER_FIELDS
+        if not data.startswith(WORD_GRAPH_MAGIC) or len(data) < header_end:
+            raise ValueError(f"{path} is not a word graph")
+        header = _uint32_array(data[len(WORD_GRAPH_MAGIC):header_end])
+        position = header_end
+        graphs = []
+        for states, edges, label_bytes in (header[1:4], header[4:7]):
+            end = position + 4 * (states + 1) + 4 * edges + states + label_bytes
+            if len(data) < end:
+                raise ValueError(f"Word graph {path} is truncated")
+            first = _uint32_array(data[position:position + 4 * (states + 1)])
+            position += 4 * (states + 1)
+            targets = _uint32_array(data[position:position + 4 * edges])
+            position += 4 * edges
+            final = data[position:position + states]
+            position += states
+            labels = data[position:position + label_bytes].decode("utf-8")
+            position += label_bytes
+            # Every edge range must lie inside the edge arrays and every edge lead to a state
+            if (states < 1 or len(labels) != edges or first[0] != 0 or first[states] != edges
+                    or any(map(operator.gt, first, first[1:]))
+                    or (edges and max(targets) >= states)):
+                raise ValueError(f"Word graph {path} is corrupt")
+            graphs.append(_Graph(first, labels, targets, final))
+
+        words = cls.__new__(cls)
+        words._graph, words._reverse = graphs
+        words._count = header[0]
+        words.path = path
+        words._added = set()
+        words._removed = set()
+        return words
+
+    def __repr__(self) -> str:
+        return f"WordGraph({len(self)} words, {self.state_count} states)"
@@ -0,0 +1,338 @@
+# src/modern_kata_kupas/word_table.py
+"""
+Modul tabel kata read-only yang di-memory-map (mmap), untuk berbagi leksikon antar proses.
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, MutableSet, Sequence, Set
+
+WORD_TABLE_MAGIC = b"MKKWTBL1"
+# Header after the magic: uint32 word count, uint32 hash slot count
+_HEADER = struct.Struct("<II")
+_DATA_START = len(WORD_TABLE_MAGIC) + _HEADER.size
+# Sorts after every character that can follow a prefix in a normalized word
+_MAX_CHAR = "\U0010ffff"
+
+
+def _slot_count(word_count: int) -> int:
+    """Hash table size: a power of two, at most half full."""
+    slots = 8
+    while slots < 2 * word_count:
+        slots *= 2
+    return slots
+
+
+def sorted_prefix_length(words: Sequence[str], text: str) -> int:
+    """
+    Returns the length of the longest prefix of `text` that some word of `words` starts with.
+
+    Each further character narrows the range of candidate words with two
+    binary searches, so the cost is O(len(text) * log(len(words))).
+
+    Args:
+        words (Sequence[str]): Words in code point order.
+        text (str): The text to match.
+
+    Returns:
+        int: 0 if no word starts with `text[0]`, `len(text)` if some word
+            starts with the whole of `text`.
+    """
+    lo, hi = 0, len(words)
+    length = 0
+    while length < len(text):
+        prefix = text[:length + 1]
+        lo = bisect_left(words, prefix, lo, hi)
+        if lo == hi or not words[lo].startswith(prefix):
+            break
+        hi = bisect_left(words, prefix + _MAX_CHAR, lo, hi)
+        length += 1
+    return length
+
+
+def common_prefix_length(first: str, second: str) -> int:
+    """Returns the length of the longest common prefix of two strings."""
+    length = 0
+    for a, b in zip(first, second):
+        if a != b:
+            break
+        length += 1
+    return length
+
+
+class _SortedWords(Sequence[str]):
+    """The stored words of a `WordTable` as a sorted sequence, for binary search."""
+
+    def __init__(self, table: "WordTable"):
+        self._table = table
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._table.word_at(index)
+
+    def __len__(self) -> int:
+        return self._table.stored_count
+
+
+def write_word_table(path: str, words: Iterable[str]) -> int:
+    """
+    Writes normalized words as a memory-mappable word table.
+
+    Layout, after the magic and the header: `count + 1` uint32 offsets into
+    the string blob, an open-addressing hash table of `slots` uint32 entries
+    (word index + 1, or 0 for an empty slot; CRC-32 of the UTF-8 bytes,
+    linear probing), then the blob of the sorted UTF-8 encoded words. All
+    integers are little-endian. The file is written atomically.
+
+    Args:
+        path (str): Destination file.
+        words (Iterable[str]): Normalized words; duplicates are dropped.
+
+    Returns:
+        int: The number of distinct words written.
+
+    Raises:
+        ValueError: On a big-endian platform (tables are read in place).
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Word tables are only supported on little-endian platforms")
+    encoded = sorted({word.encode("utf-8") for word in words if word})
+    count = len(encoded)
+    slots = _slot_count(count)
+    mask = slots - 1
+
+    offsets = memoryview(bytearray(4 * (count + 1))).cast("I")
+    position = 0
+    for index, word_bytes in enumerate(encoded):
+        offsets[index] = position
+        position += len(word_bytes)
+    offsets[count] = position
+
+    table = memoryview(bytearray(4 * slots)).cast("I")
+    for index, word_bytes in enumerate(encoded):
+        slot = zlib.crc32(word_bytes) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = index + 1
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".mkk-words-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(WORD_TABLE_MAGIC + _HEADER.pack(count, slots))
+            f.write(offsets.tobytes())
+            f.write(table.tobytes())
+            f.write(b"".join(encoded))
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+class WordTable(MutableSet[str]):
+    """
+    A set of words served from a memory-mapped word table file.
+
+    Membership tests hash the probe word and compare bytes inside the
+    mapping; no Python object is created per stored word, and the file's
+    pages live in the OS page cache, so every process that maps the same
+    file shares one copy of the lexicon. The set is read-only on disk:
+    words added at runtime (e.g. through `DictionaryManager.add_word`) go to
+    a small in-memory overlay of this instance only.
+
+    Iteration yields the stored words in sorted order (decoding them on the
+    fly), followed by the overlay.
+
+    Example:
+        >>> write_word_table("kata_dasar.tbl", ["makan", "minum"])
+        2
+        >>> words = WordTable("kata_dasar.tbl")
+        >>> "makan" in words
+        True
+    """
+
+    def __init__(self, path: str):
+        """
+        Maps a word table written by `write_word_table`.
+
+        Args:
+            path (str): The table file.
+
+        Raises:
+            ValueError: If the file is not a word table, is truncated, or
+                the platform is big-endian.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Word tables are only supported on little-endian platforms")
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _DATA_START:
+                raise ValueError(f"{path} is not a word table")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._map_sections(size)
+        except ValueError:
+            self._mmap.close()
+            raise
+        self._added: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    def _map_sections(self, size: int) -> None:
+        """
+        Validates the header and section bounds, then creates the views into the mapping.
+
+        Raises:
+            ValueError: If the file is not a word table or is truncated.
+        """
+        path = self.path
+        if self._mmap[:len(WORD_TABLE_MAGIC)] != WORD_TABLE_MAGIC:
+            raise ValueError(f"{path} is not a word table")
+        count, slots = _HEADER.unpack_from(self._mmap, len(WORD_TABLE_MAGIC))
+        if slots < 1 or slots & (slots - 1) or slots <= count:
+            raise ValueError(f"{path} is not a word table")
+        offsets_end = _DATA_START + 4 * (count + 1)
+        table_end = offsets_end + 4 * slots
+        if size < table_end:
+            raise ValueError(f"Word table {path} is truncated")
+        view = memoryview(self._mmap)
+        offsets = view[_DATA_START:offsets_end].cast("I")
+        if size < table_end + offsets[count]:
+            offsets.release()
+            view.release()
+            raise ValueError(f"Word table {path} is truncated")
+        self._count: int = count
+        self._offsets = offsets
+        self._table = view[offsets_end:table_end].cast("I")
+        self._blob_start = table_end
+        self._mask = slots - 1
+
+    def _find(self, word_bytes: bytes) -> int:
+        """Returns the index of a stored word, or -1."""
+        table = self._table
+        offsets = self._offsets
+        data = self._mmap
+        blob_start = self._blob_start
+        mask = self._mask
+        length = len(word_bytes)
+        slot = zlib.crc32(word_bytes) & mask
+        while True:
+            entry: int = table[slot]
+            if not entry:
+                return -1
+            start = blob_start + offsets[entry - 1]
+            end = blob_start + offsets[entry]
+            if end - start == length and data[start:end] == word_bytes:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def word_at(self, index: int) -> str:
+        """Returns the stored word at `index` in sorted order (overlay not included)."""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = self._blob_start + self._offsets[index]
+        return self._mmap[start:self._blob_start + self._offsets[index + 1]].decode("utf-8")
+
+    @property
+    def stored_count(self) -> int:
+        """Number of words stored in the file."""
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        if self._added or self._removed:
+            if word in self._added:
+                return True
+            if word in self._removed:
+                return False
+        return self._find(word.encode("utf-8")) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        removed = self._removed
+        for index in range(self._count):
+            word = self.word_at(index)
+            if word not in removed:
+                yield word
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return self._count - len(self._removed) + len(self._added)
+
+    def add(self, word: str) -> None:
+        """Adds a word to the in-memory overlay (the file is not modified)."""
+        if word in self._removed:
+            self._removed.discard(word)
+        elif self._find(word.encode("utf-8")) < 0:
+            self._added.add(word)
+
+    def discard(self, word: str) -> None:
+        """Removes a word from this instance's view (the file is not modified)."""
+        if word in self._added:
+            self._added.discard(word)
+        elif self._find(word.encode("utf-8")) >= 0:
+            self._removed.add(word)
+
+    def _has_stored_prefix(self, prefix: str) -> bool:
+        """Returns True if a stored word that was not discarded starts with `prefix`."""
+        words = _SortedWords(self)
+        index = bisect_left(words, prefix)
+        while index < self._count:
+            word = self.word_at(index)
+            if not word.startswith(prefix):
+                return False
+            if word not in self._removed:
+                return True
+            index += 1
+        return False
+
+    def prefix_length(self, text: str) -> int:
+        """
+        Returns the length of the longest prefix of `text` that some word starts with.
+
+        Answered by binary search over the sorted words of the file (see
+        `sorted_prefix_length`), then adjusted for the runtime overlay.
+
+        Args:
+            text (str): The text to match.
+
+        Returns:
+            int: A length between 0 and `len(text)`.
+        """
+        length = sorted_prefix_length(_SortedWords(self), text)
+        if self._removed:
+            while length and not self._has_stored_prefix(text[:length]):
+                length -= 1
+        for word in self._added:
+            length = max(length, common_prefix_length(word, text))
+        return length
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Returns True if any word starts with `prefix` (a word equal to it included)."""
+        return self.prefix_length(prefix) == len(prefix)
+
+    def copy(self) -> "WordTable":
+        """Returns a new mapping of the same file with a copy of the runtime overlay."""
+        table = WordTable(self.path)
+        table._added = set(self._added)
+        table._removed = set(self._removed)
+        return table
+
+    def close(self) -> None:
+        """Releases the mapping. The set must not be used afterwards."""
+        for view in (self._offsets, self._table):
+            view.release()
+        self._mmap.close()
+
+    def __reduce__(self) -> Any:
+        # Re-map the same file instead of copying the words (e.g. when sent to a worker)
+        if self._added or self._removed:
+            raise TypeError("A WordTable with runtime changes cannot be pickled")
+        return (WordTable, (self.path,))
+
+    def __repr__(self) -> str:
+        return f"WordTable({self.path!r}, {len(self)} words)"
@@ -4,7 +4,7 @@ import os
 import tempfile
 from unittest.mock import MagicMock, patch
 from io import StringIO
-from modern_kata_kupas.cli import segment_word, reconstruct_word, batch_segment
+from modern_kata_kupas.cli import segment_word, reconstruct_word, batch_segment, main
 from modern_kata_kupas import ModernKataKupas
 
 class TestCLI(unittest.TestCase):
@@ -74,5 +74,71 @@ class TestCLI(unittest.TestCase):
         os.unlink(tmp_in_path)
         os.unlink(tmp_out_path)
 
+    def test_batch_segment_json_matches_array_layout(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8') as tmp_in:
+            tmp_in.write("dimakan\n\nterbawa\n")
+            tmp_in_path = tmp_in.name
+
+        captured_output = StringIO()
+        with patch('sys.stdout', new=captured_output):
+            batch_segment(self.mock_mkk, tmp_in_path, format_output='json')
+
+        expected = [{'word': 'dimakan', 'segmented': 'di~makan'},
+                    {'word': 'terbawa', 'segmented': 'di~makan'}]
+        self.assertEqual(json.loads(captured_output.getvalue()), expected)
+        self.assertEqual(captured_output.getvalue(),
+                         json.dumps(expected, ensure_ascii=False, indent=2) + '\n')
+
+        os.unlink(tmp_in_path)
+
+    def test_batch_segment_jsonl_from_stdin(self):
+        captured_output = StringIO()
+        with patch('sys.stdin', new=StringIO("dimakan\nterbawa\n")), \
+                patch('sys.stdout', new=captured_output):
+            batch_segment(self.mock_mkk, '-', output_file='-', format_output='jsonl', flush_every=1)
+
+        lines = captured_output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1]), {'word': 'terbawa', 'segmented': 'di~makan'})
+
+    def test_batch_segment_missing_input_exits(self):
+        with patch('sys.stderr', new=StringIO()), self.assertRaises(SystemExit):
+            batch_segment(self.mock_mkk, 'file_yang_tidak_ada.txt')
+
+    def test_segment_file_rejects_invalid_counts(self):
+        for option, value in [('--workers', '0'), ('--workers', '-4'), ('--flush-every', '-1'),
+                              ('--workers', 'many')]:
+            argv = ['mkk', 'segment-file', '-', option, value]
+            with patch('sys.argv', new=argv), patch('sys.stderr', new=StringIO()) as captured_err, \
+                    self.assertRaises(SystemExit) as raised:
+                main()
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn(option, captured_err.getvalue())
+
+    def test_batch_segment_dedupe_with_progress(self):
+        self.mock_mkk.get_cache_stats.return_value = {'segment': {'hit_rate': 0.5}}
+        captured_output, captured_err = StringIO(), StringIO()
+        with patch('sys.stdin', new=StringIO("dimakan\nterbawa\ndimakan\n")), \
+                patch('sys.stdout', new=captured_output), patch('sys.stderr', new=captured_err):
+            batch_segment(self.mock_mkk, '-', format_output='text', dedupe=True, progress=True)
+
+        self.assertEqual(captured_output.getvalue().splitlines(),
+                         ["dimakan → di~makan", "terbawa → di~makan"])
+        self.assertEqual(self.mock_mkk.segment.call_count, 2)
+        self.assertIn("2 words", captured_err.getvalue())
+        self.assertIn("cache hit rate 50.0%", captured_err.getvalue())
+
+    def test_batch_segment_with_parallel_segmenter(self):
+        segmenter = MagicMock()
+        segmenter.imap.side_effect = lambda words: (word.upper() for word in words)
+        captured_output = StringIO()
+        with patch('sys.stdin', new=StringIO("dimakan\nterbawa\n")), \
+                patch('sys.stdout', new=captured_output):
+            batch_segment(self.mock_mkk, '-', format_output='csv', segmenter=segmenter)
+
+        self.assertEqual(captured_output.getvalue().splitlines(),
+                         ["dimakan,DIMAKAN", "terbawa,TERBAWA"])
+        self.mock_mkk.segment.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import os
 import tempfile
 import yaml
-from modern_kata_kupas.config_loader import ConfigLoader
+from modern_kata_kupas.config_loader import ConfigLoader, merge_config, resolve_config_source
 
 class TestConfigLoader(unittest.TestCase):
     def setUp(self):
@@ -51,6 +51,69 @@ class TestConfigLoader(unittest.TestCase):
         pairs = loader.get_dwilingga_pairs()
         self.assertIn(('testbase', 'testvariant'), pairs)
 
+    def test_frozen_compounds_default(self):
+        """Test that frozen compounds fall back to the built-in list."""
+        loader = ConfigLoader(config_path=self.temp_config_file.name)
+        self.assertIn(('ramah', 'tamah'), loader.get_frozen_compounds())
+        self.assertIn(('gotong', 'royong'), ConfigLoader().get_frozen_compounds())
+
+    def test_root_finder(self):
+        """Test the root_finder option and its fallback for unknown values."""
+        self.assertEqual(ConfigLoader().get_root_finder(), 'sastrawi')
+        loader = ConfigLoader(config_path=self.temp_config_file.name)
+        loader.config['root_finder'] = 'Native'
+        self.assertEqual(loader.get_root_finder(), 'native')
+        loader.config['root_finder'] = 'porter'
+        self.assertEqual(loader.get_root_finder(), 'sastrawi')
+
+    def test_engine(self):
+        """Test the engine option and its fallback for unknown values."""
+        self.assertEqual(ConfigLoader().get_engine(), 'greedy')
+        loader = ConfigLoader(config_path=self.temp_config_file.name)
+        loader.config['engine'] = 'Lattice'
+        self.assertEqual(loader.get_engine(), 'lattice')
+        loader.config['engine'] = 'viterbi'
+        self.assertEqual(loader.get_engine(), 'greedy')
+
+    def test_prefix_strip_budget(self):
+        """Test the prefix_strip_budget option and its lower bound."""
+        self.assertEqual(ConfigLoader().get_prefix_strip_budget(), 8)
+        loader = ConfigLoader(config_path=self.temp_config_file.name)
+        self.assertEqual(loader.get_prefix_strip_budget(), 8)
+        loader.config['prefix_strip_budget'] = 0
+        self.assertEqual(loader.get_prefix_strip_budget(), 1)
+
+    def test_lexicon_path(self):
+        """Test the lexicon_path option (no lexicon by default)."""
+        self.assertIsNone(ConfigLoader().get_lexicon_path())
+        loader = ConfigLoader(config_path=self.temp_config_file.name)
+        self.assertIsNone(loader.get_lexicon_path())
+        loader.config['lexicon_path'] = 'lexicon.tsv.gz'
+        self.assertEqual(loader.get_lexicon_path(), 'lexicon.tsv.gz')
+
+    def test_profiles(self):
+        """Test loading packaged profiles by name."""
+        fast = ConfigLoader(config_path="fast")
+        self.assertFalse(fast.is_feature_enabled('enable_loanword_affixation'))
+        self.assertTrue(fast.is_feature_enabled('enable_reduplication'))
+        self.assertEqual(fast.get_root_finder(), 'native')
+        self.assertEqual(fast.get_min_stem_length('derivational'), 4)
+        default = ConfigLoader(config_path="default")
+        self.assertTrue(default.is_feature_enabled('enable_loanword_affixation'))
+        self.assertEqual(default.get_root_finder(), 'sastrawi')
+        # The fast profile is an overlay: everything else comes from config.yaml
+        expected = merge_config(default.config, {"root_finder": "native",
+                                                 "features": {"enable_loanword_affixation": False}})
+        self.assertEqual(fast.config, expected)
+        self.assertEqual(resolve_config_source("fast")[1], ("config.yaml", "config_fast.yaml"))
+
+    def test_merge_config(self):
+        """Test that nested sections are merged key by key and other values replaced."""
+        base = {"features": {"a": True, "b": True}, "pairs": [1, 2], "engine": "greedy"}
+        merged = merge_config(base, {"features": {"b": False}, "pairs": [3]})
+        self.assertEqual(merged, {"features": {"a": True, "b": False}, "pairs": [3], "engine": "greedy"})
+        self.assertEqual(base["features"], {"a": True, "b": True})
+
     def test_load_invalid_path(self):
         """Test fallback when custom path is invalid."""
         loader = ConfigLoader(config_path="invalid/path/config.yaml")
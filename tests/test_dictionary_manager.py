@@ -88,4 +88,45 @@ def test_load_default_packaged_dictionary_successfully():
         assert manager.is_kata_dasar("makan") # Ganti dengan kata yang ada
         assert manager.is_kata_dasar("MINUM") # Tes normalisasi
     except (DictionaryFileNotFoundError, DictionaryLoadingError) as e:
-        pytest.fail(f"Default dictionary loading failed. Check setup. Error: {e}")
\ No newline at end of file
+        pytest.fail(f"Default dictionary loading failed. Check setup. Error: {e}")
+
+
+def test_contains_normalized_skips_normalization():
+    """Tests that contains_normalized is a bare set probe on normalized input."""
+    manager = DictionaryManager(dictionary_path=SAMPLE_DICT_PATH)
+    manager.add_word("server", is_loanword=True)
+    assert manager.contains_normalized("alpha")
+    assert not manager.contains_normalized("Alpha") # Not normalized again
+    assert not manager.contains_normalized("alpha.")
+    assert manager.contains_normalized("server", is_loanword=True)
+    assert not manager.contains_normalized("server")
+
+
+def test_prefix_queries():
+    """Prefix-existence and longest-known-root queries on the set storage."""
+    manager = DictionaryManager(dictionary_path=SAMPLE_DICT_PATH)
+    assert manager.known_prefix_length("alphabet") == 5
+    assert manager.known_prefix_length("xyz") == 0
+    assert manager.has_prefix("alp") and manager.has_prefix("") and not manager.has_prefix("alx")
+    assert manager.longest_known_root("alphabet") == "alpha"
+    assert manager.longest_known_root("alp") is None
+    manager.add_word("alphabe") # The sorted copy is rebuilt after a change
+    assert manager.longest_known_root("alphabet") == "alphabe"
+    assert manager.longest_known_root("downloadnya", is_loanword=True) == "download"
+
+
+def test_prefix_queries_on_word_files(tmp_path):
+    """Word tables and word graphs answer the prefix queries, including runtime changes."""
+    source = DictionaryManager(dictionary_path=SAMPLE_DICT_PATH)
+    words = ["alphabet", "alp", "alx", "deltanya", "xyz", "charliee", ""]
+    for storage in ("table", "graph"):
+        directory = str(tmp_path / storage)
+        source.save_word_tables(directory, storage=storage)
+        manager = DictionaryManager.from_word_tables(directory)
+        for word in words:
+            assert manager.known_prefix_length(word) == source.known_prefix_length(word)
+            assert manager.longest_known_root(word) == source.longest_known_root(word)
+        manager.add_word("echo")
+        manager.kata_dasar_set.discard("delta")
+        assert manager.has_prefix("ech") and not manager.has_prefix("del")
+        assert manager.longest_known_root("deltanya") is None
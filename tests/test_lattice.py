@@ -0,0 +1,72 @@
+# tests/test_lattice.py
+import pytest
+
+from modern_kata_kupas import ModernKataKupas
+from modern_kata_kupas.lattice import MAX_PREFIXES, LatticeAnalysis, LatticeSegmenter
+
+
+@pytest.fixture(scope="module")
+def mkk():
+    return ModernKataKupas()
+
+
+def test_analyze_scores_all_paths(mkk):
+    """Every prefix/root/suffix path with a known root is scored; best first."""
+    analyses = mkk.lattice.analyze("mengetik", k=10)
+    assert analyses[0] == LatticeAnalysis(("meN",), "ketik", (), -0.5)
+    assert LatticeAnalysis(("meN",), "tik", (), -1.0) in analyses
+    scores = [analysis.score for analysis in analyses]
+    assert scores == sorted(scores, reverse=True)
+    # The unsegmented word is always a candidate, far below any known root
+    assert analyses[-1] == LatticeAnalysis((), "mengetik", (), -100.0)
+
+
+def test_analyze_root_word_and_limits(mkk):
+    """A root word is its own best analysis; k bounds the output."""
+    assert mkk.lattice.analyze("makan", k=1) == [LatticeAnalysis((), "makan", (), 0.0)]
+    assert len(mkk.lattice.analyze("memperjuangkannya", k=2)) == 2
+    assert mkk.lattice.analyze("", k=3) == []
+    assert mkk.lattice.analyze("makan", k=0) == []
+
+
+def test_allomorph_conditions_and_suffix_slots(mkk):
+    """Paths that break an allomorph condition rank below licensed ones."""
+    lattice = LatticeSegmenter(mkk)
+    assert lattice._is_licensed("mem", "meN", "p", "pukul")
+    assert lattice._is_licensed("mem", "meN", None, "baca")
+    assert not lattice._is_licensed("mem", "meN", None, "pukul")
+    assert lattice._is_licensed("di", "di", None, "makan")
+    # At most one suffix per slot, derivational inside possessive
+    assert lattice._suffix_splits("makanannya") == [(10, ()), (7, ("nya",)), (5, ("an", "nya"))]
+    assert lattice._suffix_splits("makannyaan") == [(10, ()), (8, ("an",))]
+    assert all(len(prefixes) <= MAX_PREFIXES
+               for _, prefixes, _ in lattice._prefix_paths("dipeperpeperkan"))
+
+
+def test_segment_nbest(mkk):
+    """segment_nbest returns distinct scored segmentations, with reduplication."""
+    assert mkk.segment_nbest("mengetik", k=2) == [("meN~ketik", -0.5), ("meN~tik", -1.0)]
+    assert mkk.segment_nbest("makanan", k=1) == [("makan~an", -1.0)]
+    assert mkk.segment_nbest("rumah-rumahnya", k=1)[0][0] == "rumah~ulg~nya"
+    assert mkk.segment_nbest("di-download", k=1)[0][0] == "di~download"
+    assert mkk.segment_nbest("   ") == []
+
+
+def test_lattice_engine(tmp_path):
+    """engine: lattice makes segment() use the best lattice analysis."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("engine: lattice\n", encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert mkk.engine == "lattice"
+    # Greedy stops at the first known root ("aring"); the lattice prefers
+    # the analysis that restores the elided initial of "peny-".
+    assert mkk.segment("penyaringan") == "peN~saring~an"
+    assert mkk.segment("membacakan") == "meN~baca~kan"
+    assert mkk.segment("makan") == "makan"
+    assert mkk.segment("xyzabc") == "xyzabc"
+    assert mkk.segment("buku-bukunya") == "buku~ulg~nya"
+
+    mkk.engine = "greedy" # Clears the segment cache
+    assert mkk.segment("penyaringan") == "peN~aring~an"
+    with pytest.raises(ValueError):
+        mkk.engine = "viterbi"
@@ -0,0 +1,113 @@
+# tests/test_lexicon.py
+import json
+from pathlib import Path
+
+import pytest
+
+import modern_kata_kupas
+from modern_kata_kupas import ModernKataKupas
+from modern_kata_kupas.lexicon import FullFormLexicon
+
+ROOTS = ["kirim", "baca", "bacak", "makan", "kan"]
+
+
+@pytest.fixture(scope="module")
+def mkk():
+    return ModernKataKupas()
+
+
+@pytest.fixture(scope="module")
+def lexicon(mkk):
+    return FullFormLexicon.build(mkk, roots=ROOTS)
+
+
+def test_build_generates_derivations(lexicon):
+    """Every template is reconstructed for every root; root words are left out."""
+    assert lexicon.lookup("mengirimi") == "meN~kirim~i"
+    assert lexicon.lookup("pengiriman") == "peN~kirim~an"
+    assert lexicon.lookup("memperkirimkan") == "meN~per~kirim~kan"
+    assert "makanan" in lexicon
+    assert "makan" not in lexicon
+    assert "kirim" not in lexicon
+    # Roots spelled like an affix cannot be written unambiguously
+    assert "dikan" not in lexicon
+
+
+def test_build_skips_loanwords_and_undefined_affixes(mkk, tmp_path):
+    """Listed loanwords are not overridden; templates need affixes the rules define."""
+    assert mkk.dictionary.is_loanword("sewing")
+    assert "sewing" not in FullFormLexicon.build(mkk, roots=["wing"])
+
+    rules = json.loads((Path(modern_kata_kupas.__file__).parent / "data" / "affix_rules.json").read_text(encoding="utf-8"))
+    rules["prefixes"] = [rule for rule in rules["prefixes"] if rule.get("canonical") == "di"]
+    rules["suffixes"] = [rule for rule in rules["suffixes"] if rule.get("form") == "kan"]
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps(rules), encoding="utf-8")
+    limited = FullFormLexicon.build(ModernKataKupas(rules_file_path=str(rules_path)), roots=["kirim"])
+    assert set(limited.entries) == {"dikirim", "kirimkan", "dikirimkan"}
+
+
+def test_ambiguous_forms(lexicon):
+    """Forms generated by two analyses are kept but not answered."""
+    assert lexicon.analyses("bacakan") == ("bacak~an", "baca~kan")
+    assert lexicon.is_ambiguous("bacakan")
+    assert lexicon.lookup("bacakan") is None
+    assert "bacakan" in set(lexicon.ambiguous_forms())
+    assert lexicon.lookup("xyzabc") is None
+    assert lexicon.analyses("xyzabc") == ()
+
+
+@pytest.mark.parametrize("filename", ["lexicon.tsv", "lexicon.tsv.gz"])
+def test_save_load_roundtrip(lexicon, tmp_path, filename):
+    path = str(tmp_path / filename)
+    lexicon.save(path)
+    loaded = FullFormLexicon.load(path)
+    assert loaded.entries == lexicon.entries
+    assert len(loaded) == len(lexicon)
+
+    not_a_lexicon = tmp_path / "words.txt"
+    not_a_lexicon.write_text("makan\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        FullFormLexicon.load(str(not_a_lexicon))
+
+
+def test_segment_consults_lexicon(lexicon, tmp_path):
+    """With lexicon_path configured, unambiguous known forms skip the rule engine."""
+    lexicon_path = tmp_path / "lexicon.tsv.gz"
+    lexicon.save(str(lexicon_path))
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"lexicon_path: {lexicon_path}\n", encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert mkk.lexicon is not None and len(mkk.lexicon) == len(lexicon)
+
+    assert mkk.segment("Mengirimi") == "meN~kirim~i"
+    assert mkk.get_stage_stats()["last_word"] == {"lexicon_hits": 1}
+    # Ambiguous and unknown forms go through the rule engine
+    mkk.segment("bacakan")
+    assert "lexicon_hits" not in mkk.get_stage_stats()["last_word"]
+    assert mkk.segment("makan") == "makan"
+    assert mkk.segment("rumah-rumahnya") == "rumah~ulg~nya"
+
+
+def test_listed_words_bypass_lexicon(lexicon):
+    """Words added to the dictionary after the lexicon was built segment as without it."""
+    mkk = ModernKataKupas()
+    mkk.lexicon = lexicon
+    assert mkk.segment("pengiriman") == "peN~kirim~an"
+    mkk.dictionary.add_word("pengiriman")
+    assert mkk.segment("pengiriman") == "pengiriman"
+    assert "lexicon_hits" not in mkk.get_stage_stats()["last_word"]
+
+
+@pytest.mark.parametrize("flag", ["enable_loanword_affixation", "enable_reduplication", "enable_morphophonemic_rules"])
+def test_lexicon_off_with_disabled_features(lexicon, flag):
+    """A disabled feature flag turns the lexicon off, so results match the engine."""
+    mkk = ModernKataKupas()
+    setattr(mkk, flag, False)
+    plain = mkk.segment("mengirimi")
+    mkk.clear_cache()
+    mkk.lexicon = lexicon
+    assert mkk.segment("mengirimi") == plain
+    assert "lexicon_hits" not in mkk.get_stage_stats()["last_word"]
+    if flag == "enable_morphophonemic_rules":
+        assert plain == "mengirimi"
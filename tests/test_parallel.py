@@ -0,0 +1,27 @@
+# tests/test_parallel.py
+import pytest
+from modern_kata_kupas import ModernKataKupas, ParallelSegmenter
+
+WORDS = ["makanan", "dimakan", "rumah-rumah", "makanan", "memperjuangkannya",
+         "", "di-download", "lelaki", "dimakan", "sayur-mayur", "xyzabc"]
+
+@pytest.fixture(scope="module")
+def serial_results():
+    mkk = ModernKataKupas()
+    return [mkk.segment(w) for w in WORDS]
+
+def test_parallel_matches_serial_in_order(serial_results):
+    with ParallelSegmenter(workers=2, chunk_size=3) as segmenter:
+        assert segmenter.segment_many(WORDS) == serial_results
+
+def test_imap_streams_and_reuses_known_results(serial_results):
+    with ParallelSegmenter(workers=2, chunk_size=4, max_pending_chunks=1) as segmenter:
+        assert list(segmenter.imap(iter(WORDS * 3))) == serial_results * 3
+        # Words of later chunks are served from the parent-side cache
+        assert segmenter.cache.stats()["hits"] > 0
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ParallelSegmenter(workers=0)
+    with pytest.raises(ValueError):
+        ParallelSegmenter(chunk_size=0)
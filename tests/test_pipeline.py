@@ -0,0 +1,50 @@
+# tests/test_pipeline.py
+"""
+Unit tests untuk pipeline tokenisasi-dan-segmentasi teks.
+"""
+import types
+import pytest
+from modern_kata_kupas import ModernKataKupas
+from modern_kata_kupas.pipeline import tokenize, split_morphemes
+
+@pytest.fixture(scope="module")
+def mkk():
+    return ModernKataKupas()
+
+def test_tokenize_spans_and_kinds():
+    text = "Anak-anak membeli 2.500 buku, di-download."
+    tokens = list(tokenize(text))
+    assert [(t.text, t.kind) for t in tokens] == [
+        ("Anak-anak", "word"), ("membeli", "word"), ("2.500", "number"),
+        ("buku", "word"), (",", "punct"), ("di-download", "word"), (".", "punct"),
+    ]
+    for token in tokens:
+        assert text[token.start:token.end] == token.text
+
+def test_tokenize_trailing_hyphen_is_punctuation():
+    assert [t.text for t in tokenize("ke- luar")] == ["ke", "-", "luar"]
+
+def test_split_morphemes_keeps_rs_marker():
+    assert split_morphemes("meN~tulis~kan") == ["meN", "tulis", "kan"]
+    assert split_morphemes("sayur~rs(~mayur)") == ["sayur", "rs(~mayur)"]
+
+def test_segment_text_yields_morphemes_with_word_spans(mkk):
+    tokens = mkk.segment_text("Rumah-rumah dibangun.")
+    assert isinstance(tokens, types.GeneratorType)
+    tokens = list(tokens)
+    assert [(t.text, t.start, t.end, t.kind) for t in tokens] == [
+        ("rumah", 0, 11, "morpheme"), ("ulg", 0, 11, "morpheme"),
+        ("di", 12, 20, "morpheme"), ("bangun", 12, 20, "morpheme"),
+        (".", 20, 21, "punct"),
+    ]
+    assert [t.is_last for t in tokens] == [False, True, False, True, True]
+    assert tokens[1].word == "Rumah-rumah" and tokens[1].index == 1
+
+def test_segment_stream_offsets_across_lines(mkk):
+    lines = ["Saya makan.\n", "Mereka dimakan!"]
+    document = "".join(lines)
+    tokens = list(mkk.segment_stream(iter(lines)))
+    words = {t.word: (t.start, t.end) for t in tokens}
+    assert document[slice(*words["dimakan"])] == "dimakan"
+    assert document[slice(*words["!"])] == "!"
+    assert [t.text for t in tokens if t.word == "dimakan"] == ["di", "makan"]
@@ -0,0 +1,84 @@
+# tests/test_resources.py
+import pytest
+
+from modern_kata_kupas import DictionaryManager, ModernKataKupas
+from modern_kata_kupas.resources import SHARED_REGISTRY, ResourceRegistry
+from modern_kata_kupas.word_table import WordTable
+
+
+@pytest.fixture
+def dictionary_file(tmp_path):
+    path = tmp_path / "kata_dasar.txt"
+    path.write_text("makan\ntulis\nmain\n", encoding="utf-8")
+    return str(path)
+
+
+def test_instances_share_loaded_resources(dictionary_file):
+    """Later instances reuse the loaded resources and segment like an unshared instance."""
+    first = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    second = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    assert first.rules is second.rules and first.config is second.config
+    assert first.stemmer.backend is second.stemmer.backend
+    assert first.stemmer.cache is not second.stemmer.cache
+    assert first.dictionary is not second.dictionary
+    assert first.dictionary.kata_dasar_set is second.dictionary.kata_dasar_set
+
+    unshared = ModernKataKupas(dictionary_path=dictionary_file)
+    for word in ["menulis", "makanan", "didownloadnya", "lelaki", "bermain-main"]:
+        assert second.segment(word) == unshared.segment(word)
+    assert first._get_dwipurwa_index() is second._get_dwipurwa_index()
+    assert first._get_loanword_affix_index() is second._get_loanword_affix_index()
+
+
+def test_add_word_stays_private(dictionary_file):
+    """add_word detaches the instance's dictionary view; the shared sets are unchanged."""
+    first = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    second = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    shared = first.dictionary.kata_dasar_set
+    second.dictionary.add_word("minum")
+    second.dictionary.add_word("zzloan", is_loanword=True)
+    assert second.dictionary.is_kata_dasar("minum") and second.dictionary.is_loanword("zzloan")
+    assert not first.dictionary.is_kata_dasar("minum") and "minum" not in shared
+    assert not first.dictionary.is_loanword("zzloan")
+    assert second.segment("zzloannya") == "zzloan~nya"
+    assert first.segment("zzloannya") != "zzloan~nya"
+    third = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    assert third.dictionary.kata_dasar_set is shared
+
+
+def test_changed_sources_are_reloaded(tmp_path, dictionary_file):
+    """A changed source file gets a new resource; word tables stay copy-on-write."""
+    first = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    with open(dictionary_file, "a", encoding="utf-8") as f:
+        f.write("baca\n")
+    second = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+    assert second.dictionary.is_kata_dasar("baca") and not first.dictionary.is_kata_dasar("baca")
+    assert first.rules is second.rules
+    # Derived indexes are replaced with their dictionary, not accumulated
+    second._get_loanword_affix_index()
+    registered = len(SHARED_REGISTRY)
+    for word in ("tidur", "lari"):
+        with open(dictionary_file, "a", encoding="utf-8") as f:
+            f.write(word + "\n")
+        edited = ModernKataKupas(dictionary_path=dictionary_file, share_resources=True)
+        assert edited._get_loanword_affix_index() is not second._get_loanword_affix_index()
+    assert len(SHARED_REGISTRY) == registered
+
+    table_dir = str(tmp_path / "tables")
+    DictionaryManager(dictionary_path=dictionary_file).save_word_tables(table_dir)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"word_table_dir: {table_dir}\n", encoding="utf-8")
+    one = ModernKataKupas(config_path=str(config_path), share_resources=True)
+    two = ModernKataKupas(config_path=str(config_path), share_resources=True)
+    assert isinstance(one.dictionary.kata_dasar_set, WordTable)
+    assert one.dictionary.kata_dasar_set is two.dictionary.kata_dasar_set
+    two.dictionary.add_word("minum")
+    assert two.dictionary.is_kata_dasar("minum") and not one.dictionary.is_kata_dasar("minum")
+    assert isinstance(two.dictionary.kata_dasar_set, WordTable)
+
+    registry = ResourceRegistry()
+    assert registry.get("rules", None, "v1", lambda: [1]) is registry.get("rules", None, "v1", lambda: [2])
+    assert registry.get("rules", None, "v2", lambda: [2]) == [2]
+    assert registry.stats() == {"resources": 1, "hits": 1, "misses": 2}
+    registry.clear()
+    assert len(registry) == 0
@@ -113,4 +113,76 @@ def test_loaded_suffix_rules_structure(dummy_rules_file):
     assert isinstance(suffix_rules["-kan"][0], dict)
     assert suffix_rules["-kan"][0].get("form") == "-kan"
 
-# Tambahkan lebih banyak tes untuk berbagai aspek pemuatan dan pengambilan aturan
\ No newline at end of file
+# Tambahkan lebih banyak tes untuk berbagai aspek pemuatan dan pengambilan aturan
+def test_match_prefixes_longest_first_with_metadata():
+    """Tes match_prefixes: urutan terpanjang dulu beserta metadata kanonik dan peluluhan."""
+    rules = MorphologicalRules()
+    matches = rules.match_prefixes("memukul")
+    assert [m.surface for m in matches] == ["mem", "me"]
+    assert matches[0].canonical == "meN"
+    assert matches[0].restore_initial == "p"
+    assert rules.match_prefixes("dibaca")[0].restore_initial is None
+    assert rules.match_prefixes("xyz") == []
+
+def test_match_prefixes_agrees_with_prefix_forms():
+    """Tes bahwa trie prefiks konsisten dengan get_all_prefix_forms dan get_canonical_prefix_form."""
+    rules = MorphologicalRules()
+    for form in rules.get_all_prefix_forms():
+        match = rules.match_prefixes(form)[0]
+        assert match.surface == form
+        assert match.canonical == rules.get_canonical_prefix_form(form)
+
+def test_rebuild_indexes_after_in_place_change(dummy_rules_file):
+    """Tes bahwa rebuild_indexes() memperbarui trie setelah prefix_rules diubah langsung."""
+    rules = MorphologicalRules(rules_file_path=dummy_rules_file)
+    assert [m.surface for m in rules.match_prefixes("di-baca")] == ["di-"]
+    rules.prefix_rules["ke-"] = [{"form": "ke-"}]
+    assert rules.match_prefixes("ke-luar") == []
+    rules.rebuild_indexes()
+    assert rules.match_prefixes("ke-luar")[0].canonical == "ke-"
+
+def test_reverse_prefix_indexes():
+    """Tes indeks balik permukaan -> kanonik dan (permukaan, kanonik) -> karakter peluluhan."""
+    rules = MorphologicalRules()
+    assert rules.canonical_by_surface["meny"] == "meN"
+    assert rules.canonical_by_surface["pel"] == "per"
+    assert rules.canonical_by_surface["di"] == "di"
+    assert rules.restore_initial_by_prefix[("mem", "meN")] == "p"
+    assert rules.restore_initial_by_prefix[("meng", "meN")] == "k"
+    assert rules.restore_initial_by_prefix[("ber", "ber")] is None
+    # Metode lama tetap bekerja sebagai pembungkus tipis indeks
+    assert rules.get_canonical_prefix_form("peny") == "peN"
+    assert rules.reverse_morphophonemics("meny", "meN", "apu") == "sapu"
+    assert rules.reverse_morphophonemics("di", "di", "baca") == "baca"
+    assert rules.reverse_morphophonemics("mem", "di", "ukul") == "ukul"
+
+def test_match_suffix_rules_precompiled_records():
+    """Tes trie sufiks terbalik: urutan terpanjang dulu, rekaman read-only dan tanpa salinan per panggilan."""
+    rules = MorphologicalRules()
+    matches = rules.match_suffix_rules("memberikan")
+    assert [r["original_pattern"] for r in matches] == ["kan", "an"]
+    assert matches[0]["type"] == "suffix_derivational"
+    assert rules.match_suffix_rules("menuliskan") is matches # Tuple yang sama dari trie
+    with pytest.raises(TypeError):
+        matches[0]["original_pattern"] = "x" # type: ignore[index]
+    assert rules.match_suffix_rules("rumah") == ()
+    assert [r["original_pattern"] for r in rules.get_matching_suffix_rules("bukunya")] == ["nya"]
+    assert "original_pattern" not in rules.suffix_rules["nya"][0] # Aturan asli tidak diubah
+
+def test_match_suffix_rules_dict_format(dummy_rules_file):
+    """Tes trie sufiks dengan format aturan lama (dict)."""
+    rules = MorphologicalRules(rules_file_path=dummy_rules_file)
+    assert [r["original_pattern"] for r in rules.match_suffix_rules("tulis-kan")] == ["-kan"]
+    assert rules.match_suffix_rules("tuliskan") == ()
+
+@pytest.mark.parametrize("rules_data", [
+    {"prefixes": {"meN": {"form": "meN"}}, "suffixes": {}},
+    {"prefixes": {"di": ["di"]}, "suffixes": {"kan": ["kan"]}},
+])
+def test_legacy_rule_details_are_skipped(tmp_path, rules_data):
+    """Tes detail aturan lama yang bukan dict: dilewati saat membangun indeks, bukan error."""
+    rules_path = tmp_path / "legacy_rules.json"
+    rules_path.write_text(json.dumps(rules_data), encoding="utf-8")
+    rules = MorphologicalRules(rules_file_path=str(rules_path))
+    assert rules.match_prefixes("dimakan") == []
+    assert rules.match_suffix_rules("makan") == ()
@@ -684,4 +684,215 @@ class TestSegmentEdgeCases(unittest.TestCase):
         self.assertEqual(self.mkk.segment("anti-mainstream"), "anti-mainstream")
 
 
-# Add more test cases as needed
\ No newline at end of file
+# Add more test cases as needed
+class TestSegmentCache(unittest.TestCase):
+    def setUp(self):
+        self.mkk = ModernKataKupas()
+
+    def test_repeated_word_is_served_from_cache(self):
+        first = self.mkk.segment("makanan")
+        self.assertEqual(self.mkk.segment("Makanan."), first)
+        stats = self.mkk.get_cache_stats()["segment"]
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_add_word_invalidates_cache(self):
+        self.assertEqual(self.mkk.segment("dikuplek"), "dikuplek")
+        self.mkk.dictionary.add_word("kuplek")
+        self.assertEqual(self.mkk.segment("dikuplek"), "di~kuplek")
+
+    def test_replacing_dictionary_invalidates_cache(self):
+        self.mkk.segment("dikuplek")
+        self.assertGreater(self.mkk.get_cache_stats()["segment"]["size"], 0)
+        self.mkk.dictionary = DictionaryManager()
+        self.mkk.dictionary.add_word("kuplek")
+        self.assertEqual(self.mkk.segment("dikuplek"), "di~kuplek")
+
+    def test_cache_can_be_disabled_via_config(self):
+        import tempfile
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False, encoding="utf-8") as f:
+            f.write("cache:\n  segment_cache_size: 0\n")
+            config_path = f.name
+        try:
+            mkk = ModernKataKupas(config_path=config_path)
+            mkk.segment("makanan")
+            mkk.segment("makanan")
+            self.assertEqual(mkk.get_cache_stats()["segment"]["size"], 0)
+            self.assertEqual(mkk.get_cache_stats()["segment"]["hits"], 0)
+        finally:
+            os.unlink(config_path)
+
+def test_segment_internals_use_normalized_lookups():
+    """segment() normalizes once; internals must only use contains_normalized."""
+    from unittest.mock import patch
+    mkk = ModernKataKupas()
+    with patch.object(DictionaryManager, "is_kata_dasar", side_effect=AssertionError("re-normalizing lookup")), \
+            patch.object(DictionaryManager, "is_loanword", side_effect=AssertionError("re-normalizing lookup")):
+        assert mkk.segment("Memperjuangkannya!") == "meN~per~juang~kan~nya"
+        assert mkk.segment("di-download") == "di~download"
+        assert mkk.segment("rumah-rumah") == "rumah~ulg"
+
+def test_dwipurwa_detection_uses_candidate_index():
+    """Dwipurwa detection is one index probe; the stemmer only confirms candidates."""
+    from unittest.mock import patch
+    mkk = ModernKataKupas()
+    index = mkk._get_dwipurwa_index()
+    assert index["tetamu"] == "tamu"
+    assert index["sesama"] == "sama"
+    assert "sesal" not in index # "sesal" is itself a root
+    with patch.object(mkk.stemmer, "get_root_word", side_effect=AssertionError("stemmer called")):
+        assert mkk._handle_dwipurwa("makanan") is None
+        assert mkk._handle_dwipurwa("lelaki") == ("laki", "rp", [], None)
+    assert mkk._handle_dwipurwa("sesama") == ("sama", "rp", [], None)
+    assert mkk._handle_dwipurwa("kekerasan") is None
+
+def test_reduplication_pair_indexes_from_config(tmp_path):
+    """Frozen compounds and salin suara pairs come from config and are hash-indexed."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "dwilingga_salin_suara_pairs:\n  - base: \"kipas\"\n    variant: \"kopos\"\n"
+        "frozen_compounds:\n  - base: \"suka\"\n    variant: \"duka\"\n",
+        encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert mkk._handle_reduplication("kopos-kipasnya") == ("kopos", "ulg", [], "kipasnya")
+    assert mkk._handle_reduplication("duka-suka") == ("duka", "", [], "suka")
+    assert mkk._handle_reduplication("hutan-belantara") == ("hutan-belantara", "", [], None)
+    mkk.FROZEN_COMPOUNDS.append(("hutan", "belantara"))
+    mkk.rebuild_reduplication_indexes()
+    assert mkk._handle_reduplication("hutan-belantara") == ("hutan", "", [], "belantara")
+
+def test_native_root_finder_avoids_stemmer(tmp_path):
+    """With root_finder: native, hyphenated tokens never call the external stemmer."""
+    from unittest.mock import patch
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("root_finder: native\n", encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert mkk.root_finder == "native"
+    assert mkk._find_root_native("bermain") == "main"
+    assert mkk._find_root_native("main") == "main"
+    assert mkk._find_root_native("xyzabc") == "xyzabc"
+    with patch.object(mkk.stemmer, "get_root_word", side_effect=AssertionError("stemmer called")):
+        assert mkk.segment("bermain-main") == "ber~main~ulg"
+        assert mkk.segment("pukul-memukul") == "pukul~ulg"
+        assert mkk.segment("bermain-mainkan") == "ber~main~ulg~kan"
+
+def test_strategies_share_strip_memo_and_skip_dominated_work():
+    """Both strategies share one per-word memo; dominated suffix-first work is skipped."""
+    mkk = ModernKataKupas()
+    # Suffix-first leaves "bermain" unchanged, so its prefix stage reuses the
+    # prefix-first result for "bermain" from the memo.
+    assert mkk.segment("bermain") == "ber~main"
+    assert mkk.get_stage_stats()["last_word"] == {
+        "strip_prefixes": 1, "strip_suffixes": 2, "memo_hits": 1}
+
+    # Prefix-first finds the valid stem "makan"; suffix-first leaves "makan"
+    # too, which cannot be strictly longer, so its prefix stage is skipped.
+    assert mkk.segment("makanan") == "makan~an"
+    assert mkk.get_stage_stats()["last_word"]["dominated_skips"] == 1
+
+    total = mkk.get_stage_stats()["total"]
+    assert total["strip_suffixes"] == 3
+    mkk.segment("makanan") # Served from the segment cache, not counted
+    assert mkk.get_stage_stats()["total"] == total
+
+class TestSegmentMany(unittest.TestCase):
+    def setUp(self):
+        self.mkk = ModernKataKupas()
+        self.words = ["makanan", "dimakan", "makanan", "rumah-rumah", "", "dimakan", "Makanan"]
+
+    def test_matches_segment_in_input_order(self):
+        expected = [self.mkk.segment(w) for w in self.words]
+        self.assertEqual(self.mkk.segment_many(self.words), expected)
+
+    def test_each_unique_token_is_segmented_once(self):
+        from unittest.mock import patch
+        with patch.object(self.mkk, "segment", wraps=self.mkk.segment) as spy:
+            self.mkk.segment_many(self.words)
+        self.assertEqual(spy.call_count, len(set(self.words)))
+
+    def test_lazy_returns_generator(self):
+        import types
+        result = self.mkk.segment_many(iter(self.words), lazy=True)
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(list(result), self.mkk.segment_many(self.words))
+
+    def test_lazy_repeats_are_answered_by_segment_cache(self):
+        list(self.mkk.segment_many(iter(self.words), lazy=True))
+        stats = self.mkk.get_cache_stats()["segment"]
+        self.assertEqual(stats["misses"], 3) # makanan, dimakan, rumah-rumah
+        self.assertEqual(stats["hits"], 3)
+
+def test_prefix_stripping_budget():
+    """Prefix stripping is iterative and stops after prefix_strip_budget prefixes."""
+    mkk = ModernKataKupas()
+    assert mkk.prefix_strip_budget == 8
+    assert mkk._strip_prefixes("memperjuangkan") == ("juangkan", ["meN", "per"])
+
+    # Far deeper than the recursion limit; must not raise RecursionError
+    garbage = "memper" * 5000
+    assert mkk.segment(garbage) == garbage
+    stats = mkk.get_stage_stats()["last_word"]
+    assert stats["prefix_budget_hits"] >= 1
+    assert stats["words_over_budget"] == 1
+    assert mkk._strip_prefixes(garbage) == ("memper" * 4996, ["meN", "per"] * 4)
+
+    mkk.segment("dimakan")
+    assert "words_over_budget" not in mkk.get_stage_stats()["last_word"]
+    assert mkk.get_stage_stats()["total"]["words_over_budget"] == 1
+
+def test_feature_flags_skip_stages(tmp_path):
+    """Disabled features skip their stages entirely."""
+    from unittest.mock import patch
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "features:\n"
+        "  enable_loanword_affixation: false\n"
+        "  enable_reduplication: false\n"
+        "  enable_morphophonemic_rules: false\n",
+        encoding="utf-8",
+    )
+    mkk = ModernKataKupas(config_path=str(config_path))
+    with patch.object(mkk, "_handle_loanword_affixation", side_effect=AssertionError("loanword stage")), \
+            patch.object(mkk, "_handle_reduplication", side_effect=AssertionError("reduplication stage")), \
+            patch.object(mkk, "_handle_dwipurwa", side_effect=AssertionError("dwipurwa stage")):
+        assert mkk.segment("didownload") == "didownload"
+        assert mkk.segment("rumah-rumah") == "rumah-rumah"
+        assert mkk.segment("lelaki") == "lelaki"
+        assert mkk.segment("makanan") == "makan~an"
+    # No elided initial is restored: "memukul" no longer yields "pukul"
+    assert mkk.segment("memukul") == "memukul"
+    assert mkk.segment("membaca") == "meN~baca"
+
+def test_fast_profile():
+    """The packaged "fast" profile turns off loanword affixation and uses the native root finder."""
+    mkk = ModernKataKupas(config_path="fast")
+    assert mkk.root_finder == "native"
+    assert not mkk.enable_loanword_affixation
+    assert mkk.enable_reduplication and mkk.enable_morphophonemic_rules
+    assert mkk.segment("didownload") == "didownload"
+    assert mkk.segment("bermain-main") == "ber~main~ulg"
+    assert mkk.segment("memukul") == "meN~pukul"
+
+def test_loanword_affix_index():
+    """Loanword + suffix surface forms come from an index that follows the loanword list."""
+    mkk = ModernKataKupas()
+    index = mkk._get_loanword_affix_index()
+    assert index["downloadnya"] == ("download", "nya")
+    assert "download" not in index # Bare loanwords are probed in the loanword set
+    assert mkk._handle_loanword_affixation("mengupdatenya") == "meN~update~nya"
+    assert mkk._handle_loanword_affixation("di-download") == "di~download"
+    assert mkk._handle_loanword_affixation("downloadnya") == "download~nya"
+    assert mkk._handle_loanword_affixation("xyzabc") == ""
+
+    assert mkk._handle_loanword_affixation("dizorbify") == ""
+    mkk.dictionary.add_word("zorbify", is_loanword=True)
+    assert mkk._handle_loanword_affixation("dizorbifykan") == "di~zorbify~kan"
+    assert mkk._get_loanword_affix_index() is not index
+
+def test_prefix_first_suffix_stage_is_pruned():
+    """The suffix stage is skipped when no root word starts the stem left after the prefixes."""
+    mkk = ModernKataKupas()
+    assert mkk.segment("diqwerty") == "diqwerty"
+    assert mkk.get_stage_stats()["last_word"]["pruned_branches"] == 1
+    assert mkk.segment("dimakanan") == "di~makan~an"
+    assert "pruned_branches" not in mkk.get_stage_stats()["last_word"]
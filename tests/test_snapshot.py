@@ -0,0 +1,77 @@
+# tests/test_snapshot.py
+import os
+
+import pytest
+
+from modern_kata_kupas import DictionaryFileNotFoundError, ModernKataKupas
+from modern_kata_kupas.exceptions import RuleError
+from modern_kata_kupas.snapshot import compile_snapshot, load_snapshot, read_snapshot, source_fingerprints
+
+
+@pytest.fixture
+def dictionary_file(tmp_path):
+    path = tmp_path / "kata_dasar.txt"
+    path.write_text("makan\ntulis\nMain\n", encoding="utf-8")
+    return str(path)
+
+
+def test_compile_and_read_roundtrip(tmp_path, dictionary_file):
+    """A snapshot restores the normalized lexicon, rules and config without the sources."""
+    path = str(tmp_path / "mkk.snapshot")
+    compiled = compile_snapshot(path, dictionary_path=dictionary_file, config_path="fast")
+    loaded = read_snapshot(path, expected_sources=source_fingerprints(dictionary_file, None, "fast"))
+    assert loaded.dictionary.kata_dasar_set == {"makan", "tulis", "main"}
+    assert loaded.dictionary.loanwords_set == compiled.dictionary.loanwords_set
+    assert loaded.rules.canonical_by_surface == compiled.rules.canonical_by_surface
+    assert loaded.rules.match_prefixes("menulis") == compiled.rules.match_prefixes("menulis")
+    assert loaded.config.config == compiled.config.config
+    assert loaded.config.get_root_finder() == "native"
+    assert loaded.sources == compiled.sources
+
+
+def test_stale_and_corrupt_snapshots(tmp_path, dictionary_file):
+    """Changed sources and damaged files are detected; load_snapshot recompiles."""
+    path = str(tmp_path / "mkk.snapshot")
+    compile_snapshot(path, dictionary_path=dictionary_file)
+
+    with open(dictionary_file, "a", encoding="utf-8") as f:
+        f.write("baca\n")
+    with pytest.raises(ValueError, match="stale"):
+        read_snapshot(path, expected_sources=source_fingerprints(dictionary_file))
+    assert "baca" in load_snapshot(path, dictionary_path=dictionary_file).dictionary.kata_dasar_set
+    assert "baca" in read_snapshot(path, expected_sources=source_fingerprints(dictionary_file)).dictionary.kata_dasar_set
+
+    with open(path, "r+b") as f:
+        f.seek(-3, os.SEEK_END)
+        f.write(b"XYZ")
+    with pytest.raises(ValueError, match="checksum"):
+        read_snapshot(path)
+    assert load_snapshot(path, dictionary_path=dictionary_file).dictionary.get_kata_dasar_count() == 4
+
+    not_a_snapshot = tmp_path / "words.txt"
+    not_a_snapshot.write_text("makan\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_snapshot(str(not_a_snapshot))
+
+
+def test_segmenter_from_snapshot(tmp_path):
+    """ModernKataKupas(snapshot_path=...) compiles a missing snapshot, then loads it."""
+    path = str(tmp_path / "mkk.snapshot")
+    first = ModernKataKupas(snapshot_path=path)
+    assert os.path.exists(path)
+    second = ModernKataKupas(snapshot_path=path)
+    plain = ModernKataKupas()
+    assert second.dictionary.kata_dasar_set == plain.dictionary.kata_dasar_set
+    for word in ["mempermainkannya", "didownload", "buku-bukunya", "pengiriman"]:
+        assert first.segment(word) == second.segment(word) == plain.segment(word)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_invalid_source_paths(tmp_path, shared):
+    """Bad source paths raise the library's exceptions with snapshots and shared resources too."""
+    options = {"share_resources": True} if shared else {"snapshot_path": str(tmp_path / "mkk.snapshot")}
+    for bad_path in (str(tmp_path / "missing.txt"), str(tmp_path)):
+        with pytest.raises(DictionaryFileNotFoundError):
+            ModernKataKupas(dictionary_path=bad_path, **options)
+    with pytest.raises(RuleError):
+        ModernKataKupas(rules_file_path=str(tmp_path), **options)
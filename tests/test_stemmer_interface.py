@@ -40,5 +40,25 @@ def test_get_root_word_with_punctuation():
     assert stemmer.get_root_word("makan!") == "makan"
     assert stemmer.get_root_word("memakan?") == "makan"
 
+def test_stemmer_is_built_lazily_and_memoized():
+    """Tests that Sastrawi is built on first use and results are cached."""
+    stemmer = IndonesianStemmer(cache_size=2)
+    assert not stemmer.is_loaded
+    assert stemmer.get_root_word("memakan") == "makan"
+    assert stemmer.is_loaded
+    assert stemmer.get_root_word("memakan") == "makan"
+    stats = stemmer.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    stemmer.get_root_word("dimakan")
+    stemmer.get_root_word("termakan")
+    assert stemmer.get_cache_stats()["evictions"] == 1
+
+def test_modern_kata_kupas_does_not_build_stemmer_eagerly():
+    """Tests that constructing the segmenter does not build Sastrawi."""
+    from modern_kata_kupas import ModernKataKupas
+    mkk = ModernKataKupas()
+    assert not mkk.stemmer.is_loaded
+    assert "stemmer" in mkk.get_cache_stats()
+
 # Note: PySastrawi might have limitations or specific behaviors for complex cases.
 # These tests cover basic expected functionality of the wrapper.
\ No newline at end of file
@@ -0,0 +1,115 @@
+# tests/test_word_graph.py
+import pickle
+import struct
+
+import pytest
+
+from modern_kata_kupas import DictionaryManager, ModernKataKupas
+from modern_kata_kupas.word_graph import WORD_GRAPH_MAGIC, WordGraph
+from modern_kata_kupas.word_table import WordTable
+
+WORDS = ["makan", "makanan", "main", "mainan", "minum", "tulis", "évaluasi", "makan"]
+
+
+def test_membership_and_queries():
+    """A word graph answers membership, prefix and suffix queries for the stored words."""
+    graph = WordGraph(WORDS)
+    assert len(graph) == 7
+    assert list(graph) == sorted(set(WORDS))
+    assert graph == set(WORDS)
+    assert "makan" in graph and "évaluasi" in graph
+    assert "maka" not in graph and "makanan2" not in graph and "" not in graph and 3 not in graph
+    # Shared prefixes and suffixes share states
+    assert graph.state_count < sum(len(word) for word in set(WORDS))
+
+    assert graph.has_prefix("mak") and graph.has_prefix("makanan") and graph.has_prefix("")
+    assert not graph.has_prefix("mal")
+    assert list(graph.iter_prefix("ma")) == ["main", "mainan", "makan", "makanan"]
+    assert graph.has_suffix("nan") and not graph.has_suffix("ran")
+    assert sorted(graph.iter_suffix("an")) == ["mainan", "makan", "makanan"]
+    assert list(graph.iter_suffix("xyz")) == []
+    assert pickle.loads(pickle.dumps(graph)) == graph
+
+
+def test_save_load_and_overlay(tmp_path):
+    """Saved graphs load with both automata; runtime changes stay in the instance."""
+    path = str(tmp_path / "words.dawg")
+    WordGraph(WORDS).save(path)
+    graph = WordGraph.load(path)
+    assert graph == set(WORDS) and graph.path == path
+    assert sorted(graph.iter_suffix("um")) == ["minum"]
+
+    graph.add("minuman")
+    graph.add("makan")
+    graph.discard("makanan")
+    assert "minuman" in graph and "makanan" not in graph and len(graph) == 7
+    assert list(graph.iter_prefix("mi")) == ["minum", "minuman"]
+    assert sorted(graph.iter_suffix("an")) == ["mainan", "makan", "minuman"]
+    assert not graph.has_suffix("kanan") and graph.has_prefix("minuma")
+    assert WordGraph.load(path) == set(WORDS)
+
+    empty_path = str(tmp_path / "empty.dawg")
+    WordGraph().save(empty_path)
+    empty = WordGraph.load(empty_path)
+    assert len(empty) == 0 and "makan" not in empty and not empty.has_suffix("an")
+    not_a_graph = tmp_path / "words.txt"
+    not_a_graph.write_text("makan\nminum\n" * 4, encoding="utf-8")
+    with pytest.raises(ValueError):
+        WordGraph.load(str(not_a_graph))
+    with open(path, "rb") as f:
+        truncated = f.read()[:-10]
+    (tmp_path / "truncated.dawg").write_bytes(truncated)
+    with pytest.raises(ValueError):
+        WordGraph.load(str(tmp_path / "truncated.dawg"))
+
+
+def test_corrupt_graph_is_rejected_at_load(tmp_path):
+    """Out-of-range edge targets or decreasing edge offsets are caught by load, not during lookups."""
+    path = tmp_path / "words.dawg"
+    WordGraph(WORDS).save(str(path))
+    data = path.read_bytes()
+    header_end = len(WORD_GRAPH_MAGIC) + 4 * 7
+    _, states, _, _ = struct.unpack_from("<4I", data, len(WORD_GRAPH_MAGIC))
+    first_at, targets_at = header_end, header_end + 4 * (states + 1)
+
+    bad_target = bytearray(data)
+    struct.pack_into("<I", bad_target, targets_at, states)
+    first_1, first_2 = struct.unpack_from("<2I", data, first_at + 4)
+    assert first_1 < first_2
+    decreasing = bytearray(data)
+    struct.pack_into("<2I", decreasing, first_at + 4, first_2, first_1)
+    for name, corrupt in (("target", bad_target), ("offsets", decreasing)):
+        (tmp_path / name).write_bytes(bytes(corrupt))
+        with pytest.raises(ValueError, match="corrupt"):
+            WordGraph.load(str(tmp_path / name))
+
+
+def test_dictionary_manager_graph_storage(tmp_path):
+    """DictionaryManager recognizes word graph files in a word table directory."""
+    dictionary_path = tmp_path / "kata_dasar.txt"
+    dictionary_path.write_text("Makan\ntulis\nmain\n", encoding="utf-8")
+    graph_dir = str(tmp_path / "graphs")
+    source = DictionaryManager(dictionary_path=str(dictionary_path))
+    source.save_word_tables(graph_dir, storage="graph")
+    with pytest.raises(ValueError):
+        source.save_word_tables(graph_dir, storage="trie")
+
+    manager = DictionaryManager.from_word_tables(graph_dir)
+    assert isinstance(manager.kata_dasar_set, WordGraph)
+    assert manager.is_kata_dasar("MAKAN") and not manager.is_kata_dasar("minum")
+    assert manager.is_loanword("download")
+    assert manager.kata_dasar_set.has_prefix("tul")
+    manager.add_word("minum")
+    assert manager.is_kata_dasar("minum")
+
+    table_dir = str(tmp_path / "tables")
+    source.save_word_tables(table_dir)
+    assert isinstance(DictionaryManager.from_word_tables(table_dir).kata_dasar_set, WordTable)
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"word_table_dir: {graph_dir}\n", encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert isinstance(mkk.dictionary.loanwords_set, WordGraph)
+    assert mkk.segment("menulis") == "meN~tulis"
+    assert mkk.segment("didownloadnya") == "di~download~nya"
+    assert mkk.segment("makanan") == "makan~an"
@@ -0,0 +1,102 @@
+# tests/test_word_table.py
+import pickle
+
+import pytest
+
+from modern_kata_kupas import DictionaryManager, ModernKataKupas
+from modern_kata_kupas.exceptions import DictionaryFileNotFoundError, DictionaryLoadingError
+from modern_kata_kupas.word_table import WordTable, write_word_table
+
+
+def test_write_and_query(tmp_path):
+    """A word table answers membership, length and sorted iteration from the mapping."""
+    path = str(tmp_path / "words.tbl")
+    words = ["makan", "minum", "tulis", "évaluasi", "makan"]
+    assert write_word_table(path, words) == 4
+    table = WordTable(path)
+    assert len(table) == 4
+    assert "makan" in table and "évaluasi" in table
+    assert "maka" not in table and "makanan" not in table and 3 not in table
+    assert list(table) == sorted(set(words))
+    assert table.word_at(0) == "makan" and table.word_at(3) == "évaluasi"
+    with pytest.raises(IndexError):
+        table.word_at(4)
+    assert table == set(words)
+    # Pickling re-maps the same file instead of copying the words
+    assert pickle.loads(pickle.dumps(table)) == table
+    table.close()
+
+
+def test_runtime_overlay(tmp_path):
+    """Added and discarded words only change this instance, never the file."""
+    path = str(tmp_path / "words.tbl")
+    write_word_table(path, ["makan", "minum"])
+    table = WordTable(path)
+    table.add("baca")
+    table.add("makan")
+    table.discard("minum")
+    assert "baca" in table and "makan" in table and "minum" not in table
+    assert sorted(table) == ["baca", "makan"]
+    assert len(table) == 2
+    assert WordTable(path) == {"makan", "minum"}
+    with pytest.raises(TypeError):
+        pickle.dumps(table)
+
+    empty_path = str(tmp_path / "empty.tbl")
+    write_word_table(empty_path, [])
+    assert len(WordTable(empty_path)) == 0 and "makan" not in WordTable(empty_path)
+
+    not_a_table = tmp_path / "words.txt"
+    not_a_table.write_text("makan\nminum\n" * 4, encoding="utf-8")
+    with pytest.raises(ValueError):
+        WordTable(str(not_a_table))
+
+
+def test_truncated_table(tmp_path):
+    """A table cut short anywhere raises ValueError, or DictionaryLoadingError via DictionaryManager."""
+    path = tmp_path / "words.tbl"
+    write_word_table(str(path), ["makan", "minum", "tulis"])
+    data = path.read_bytes()
+    for cut in (17, 20, 30, len(data) - 1):
+        truncated = tmp_path / f"truncated{cut}.tbl"
+        truncated.write_bytes(data[:cut])
+        with pytest.raises(ValueError):
+            WordTable(str(truncated))
+
+    (tmp_path / "tables").mkdir()
+    for filename in (DictionaryManager.KATA_DASAR_TABLE_FILENAME, DictionaryManager.LOANWORD_TABLE_FILENAME):
+        (tmp_path / "tables" / filename).write_bytes(data[:20])
+    with pytest.raises(DictionaryLoadingError):
+        DictionaryManager.from_word_tables(str(tmp_path / "tables"))
+
+
+def test_dictionary_manager_word_tables(tmp_path):
+    """DictionaryManager can be served from word tables, also via the word_table_dir option."""
+    dictionary_path = tmp_path / "kata_dasar.txt"
+    dictionary_path.write_text("Makan\ntulis\nmain\n", encoding="utf-8")
+    table_dir = str(tmp_path / "tables")
+    DictionaryManager(dictionary_path=str(dictionary_path)).save_word_tables(table_dir)
+
+    manager = DictionaryManager.from_word_tables(table_dir)
+    assert isinstance(manager.kata_dasar_set, WordTable)
+    assert manager.is_kata_dasar("MAKAN") and not manager.is_kata_dasar("minum")
+    assert manager.is_loanword("download")
+    generation = manager.generation
+    manager.add_word("minum")
+    assert manager.is_kata_dasar("minum") and manager.generation == generation + 1
+
+    with pytest.raises(DictionaryFileNotFoundError):
+        DictionaryManager.from_word_tables(str(tmp_path / "missing"))
+    (tmp_path / "broken").mkdir()
+    for filename in (DictionaryManager.KATA_DASAR_TABLE_FILENAME, DictionaryManager.LOANWORD_TABLE_FILENAME):
+        (tmp_path / "broken" / filename).write_bytes(b"not a table")
+    with pytest.raises(DictionaryLoadingError):
+        DictionaryManager.from_word_tables(str(tmp_path / "broken"))
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"word_table_dir: {table_dir}\n", encoding="utf-8")
+    mkk = ModernKataKupas(config_path=str(config_path))
+    assert isinstance(mkk.dictionary.loanwords_set, WordTable)
+    assert mkk.segment("menulis") == "meN~tulis"
+    assert mkk.segment("didownloadnya") == "di~download~nya"
+    assert mkk.segment("makanan") == "makan~an"
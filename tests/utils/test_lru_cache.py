@@ -0,0 +1,48 @@
+# tests/utils/test_lru_cache.py
+"""
+Unit tests untuk modul lru_cache.py
+"""
+
+from modern_kata_kupas.utils.lru_cache import LRUCache
+
+def test_get_put_and_counters():
+    """Tes operasi dasar dan penghitung hit/miss."""
+    cache = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["hit_rate"] == 0.5
+
+def test_evicts_least_recently_used():
+    """Tes bahwa entri yang paling lama tidak dipakai dibuang lebih dulu."""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" sekarang paling lama tidak dipakai
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+def test_zero_size_disables_cache():
+    """Tes bahwa maxsize 0 menonaktifkan cache."""
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert len(cache) == 0
+    assert cache.get("a", "default") == "default"
+
+def test_clear_and_reset_stats():
+    """Tes clear() dan reset_stats()."""
+    cache = LRUCache(maxsize=4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 1
+    cache.reset_stats()
+    assert cache.stats()["hits"] == 0